@@ -0,0 +1 @@
+"""Stand-alone performance scripts; run them with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,40 @@
+"""Accuracy and time of sampled betweenness against the exact scores.
+
+Run with ``python -m benchmarks.bench_betweenness [edges]``. The exact
+reference uses every node as a source, so keep the graph small enough for
+that (the default is 20,000 edges); the last row shows a time-budgeted run
+on a graph ten times larger.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+
+from hyperhelix.analytics.betweenness import approximate_betweenness
+
+from .bench_csr import build_graph, timed
+
+
+def main(edges: int = 20_000) -> None:
+    snap = build_graph(edges // 4, edges).freeze()
+    exact = timed(
+        f"exact ({snap.num_nodes} sources)", lambda: approximate_betweenness(snap, samples=snap.num_nodes)
+    )
+    top = {node_id for node_id, _ in exact.top(50)}
+    for samples in (50, 200, 1_000):
+        result = timed(f"{samples} samples", lambda: approximate_betweenness(snap, samples=samples))
+        error = float(np.abs(result.scores - exact.scores).max())
+        recall = len(top & {node_id for node_id, _ in result.top(50)}) / 50
+        print(f"  max error {error:.5f}, bound {result.error_bound:.4f}, top-50 recall {recall:.2f}")
+    workers = os.cpu_count() or 1
+    big = build_graph(edges * 10 // 4, edges * 10).freeze()
+    result = timed(f"{edges * 10} edges, 5 s budget", lambda: approximate_betweenness(
+        big, time_budget=5.0, workers=workers))
+    print(f"  {result.samples} sources on {workers} workers, bound {result.error_bound:.4f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
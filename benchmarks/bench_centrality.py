@@ -0,0 +1,31 @@
+"""Time PageRank and eigenvector centrality over a CSR snapshot.
+
+Run with ``python -m benchmarks.bench_centrality``. The default size is one
+million undirected edges; the warm-start rows re-run after a small batch of
+edge changes, seeded with the previous vector.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from hyperhelix.analytics.centrality import CentralityEngine
+
+from .bench_csr import build_graph, timed
+
+
+def main(edges: int = 1_000_000) -> None:
+    graph = timed("build HyperHelix", lambda: build_graph(edges // 4, edges))
+    timed("freeze (CSR build)", graph.freeze)
+    for method in ("pagerank", "eigenvector"):
+        engine = CentralityEngine(graph, method=method, tol=1e-8, max_iter=200)
+        cold = timed(f"{method} cold", engine.compute)
+        for i in range(1_000):
+            graph.add_edge(f"n{i}", f"n{i + 7}", 3.0)
+        warm = timed(f"{method} warm (1k edges changed)", engine.compute)
+        print(f"  iterations: cold {cold.iterations}, warm {warm.iterations}")
+    timed("write importance", CentralityEngine(graph).update)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,50 @@
+"""Wall time of community detection against worker count.
+
+Run with ``python -m benchmarks.bench_communities``. The graph has one
+million undirected edges, 90% of them inside 1,000 planted communities.
+Worker counts go up to ``os.cpu_count()``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+
+from hyperhelix.analytics.communities import label_propagation, louvain
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+from .bench_csr import timed
+
+
+def build_clustered(nodes: int, edges: int, groups: int = 1_000, seed: int = 0) -> HyperHelix:
+    rng = random.Random(seed)
+    size = nodes // groups
+    graph = HyperHelix()
+    graph._insert_hooks.clear()
+    for i in range(nodes):
+        graph.add_node(Node(id=f"n{i}", payload=None))
+    for _ in range(edges):
+        if rng.random() < 0.9:
+            base = rng.randrange(groups) * size
+            a, b = base + rng.randrange(size), base + rng.randrange(size)
+        else:
+            a, b = rng.randrange(nodes), rng.randrange(nodes)
+        graph.add_edge(f"n{a}", f"n{b}", rng.uniform(1, 5))
+    return graph
+
+
+def main(edges: int = 1_000_000) -> None:
+    graph = timed("build HyperHelix", lambda: build_clustered(edges // 4, edges))
+    snap = timed("freeze (CSR build)", graph.freeze)
+    workers = [w for w in (1, 2, 4, 8, 16, 32) if w <= (os.cpu_count() or 1)]
+    for w in workers:
+        lpa = timed(f"label propagation x{w}", lambda: label_propagation(snap, workers=w))
+        print(f"  {lpa.count} communities, modularity {lpa.modularity:.4f}, {lpa.iterations} sweeps")
+        result = timed(f"louvain x{w}", lambda: louvain(snap, workers=w))
+        print(f"  {result.count} communities, modularity {result.modularity:.4f}, {result.iterations} levels")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,41 @@
+"""Time connectivity queries against an exhaustive search of a component.
+
+Run with ``python -m benchmarks.bench_components``. The default graph has
+250k nodes and one million random edges plus a detached island, so every
+``shortest_path`` to the island used to expand the whole giant component.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+
+from hyperhelix import pathfinding
+from hyperhelix.node import Node
+
+from .bench_csr import build_graph, timed
+
+
+def main(edges: int = 1_000_000) -> None:
+    rng = random.Random(0)
+    nodes = edges // 4
+    graph = timed("build HyperHelix", lambda: build_graph(nodes, edges))
+    graph.add_node(Node(id="island", payload=None))
+    timed("exhaustive search", lambda: pathfinding.search(
+        lambda node_id: graph.nodes[node_id].edges, "n0", "island"
+    ))
+    timed("build components", lambda: graph.connected("n0", "island"))
+    timed("shortest_path x1k", lambda: [graph.shortest_path(f"n{i}", "island") for i in range(1_000)])
+    timed("10k edge inserts", lambda: [
+        graph.add_edge(f"n{rng.randrange(nodes)}", f"n{rng.randrange(nodes)}") for _ in range(10_000)
+    ])
+    pairs = [(a, b) for a in (f"n{i}" for i in range(200)) for b in list(graph.nodes[a].edges)[:1]]
+    timed("200 removes + queries", lambda: [
+        (graph.remove_edge(a, b), graph.connected(a, b)) for a, b in pairs if b in graph.nodes[a].edges
+    ])
+    sizes = timed("component sizes", graph.component_sizes)
+    print(f"{len(sizes)} components, largest {sizes[0]}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,51 @@
+"""Time CSR snapshot builds and compare traversal against the dict graph.
+
+Run with ``python -m benchmarks.bench_csr``. The default size is one
+million undirected edges.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def build_graph(nodes: int, edges: int, seed: int = 0) -> HyperHelix:
+    rng = random.Random(seed)
+    graph = HyperHelix()
+    graph._insert_hooks.clear()
+    for i in range(nodes):
+        graph.add_node(Node(id=f"n{i}", payload=None))
+    for _ in range(edges):
+        graph.add_edge(f"n{rng.randrange(nodes)}", f"n{rng.randrange(nodes)}", rng.uniform(1, 5))
+    return graph
+
+
+def timed(label: str, fn) -> object:
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main(edges: int = 1_000_000) -> None:
+    graph = timed("build HyperHelix", lambda: build_graph(edges // 4, edges))
+    snap = timed("freeze (CSR build)", graph.freeze)
+    timed("freeze (cached)", graph.freeze)
+    for i in range(1_000):
+        graph.add_edge(f"n{i}", f"n{i + 1}", 2.0)
+    timed("freeze (1k edges changed)", graph.freeze)
+    print(f"snapshot: {snap.num_nodes} nodes, {snap.num_edges} edges, "
+          f"{(snap.offsets.nbytes + snap.neighbors.nbytes + snap.weights.nbytes) / 1e6:.1f} MB arrays")
+    timed("dict spiral_walk depth=3", lambda: sum(1 for _ in graph.spiral_walk("n0", 3)))
+    timed("CSR spiral_walk depth=3", lambda: snap.spiral_walk("n0", 3))
+    timed("dict shortest_path", lambda: graph.shortest_path("n0", "n1"))
+    timed("CSR shortest_path", lambda: snap.shortest_path("n0", "n1"))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,45 @@
+"""Measure journal append throughput and startup replay speed in nodes/s.
+
+Run with ``python -m benchmarks.bench_journal``.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+from hyperhelix.persistence.journal import Journal
+
+
+def main(count: int = 200_000, degree: int = 4) -> None:
+    with tempfile.TemporaryDirectory() as path:
+        graph = HyperHelix(journal=Journal(path, sync_interval=0.05, checkpoint_every=10**9))
+        graph._insert_hooks.clear()
+        started = time.perf_counter()
+        graph.add_nodes(Node(id=f"node-{i}", payload={"i": i}) for i in range(count))
+        graph.add_edges(
+            (f"node-{i}", f"node-{(i + k) % count}")
+            for i in range(count)
+            for k in range(1, degree // 2 + 1)
+        )
+        graph.journal.close()
+        elapsed = time.perf_counter() - started
+        records = count * (1 + degree // 2)
+        print(f"append   {records / elapsed:12.0f} records/s")
+
+        stats = Journal(path, sync_interval=None).replay(HyperHelix())
+        print(f"replay   {stats.nodes_per_second:12.0f} nodes/s ({stats.records} records)")
+
+        journal = Journal(path, sync_interval=None)
+        journal.replay(HyperHelix())
+        journal.checkpoint()
+        journal.close()
+        del journal
+        stats = Journal(path, sync_interval=None).replay(HyperHelix())
+        print(f"ckpt     {stats.nodes_per_second:12.0f} nodes/s from checkpoint")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Report bytes per node and per edge for the graph's node representation.
+
+Run with ``python -m benchmarks.bench_memory``. ``LegacyNode`` mirrors the
+earlier dict-backed dataclasses with datetime timestamps for comparison.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from hyperhelix.node import Node
+
+
+@dataclass
+class LegacyMetadata:
+    created: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    importance: float = 0.0
+    permanence: float = 0.0
+    perception_history: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LegacyNode:
+    id: str
+    payload: Any
+    tags: List[str] = field(default_factory=list)
+    layer: int = 0
+    strand: str = "default"
+    edges: Dict[str, float] = field(default_factory=dict)
+    metadata: LegacyMetadata = field(default_factory=LegacyMetadata)
+    execute_fn: Callable[[Any], Any] | None = None
+
+
+def measure(cls, count: int, degree: int) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    # Build ids the way the API does: a fresh string per request.
+    nodes = {}
+    for i in range(count):
+        node = cls(id="".join(["node-", str(i)]), payload=None)
+        nodes[node.id] = node
+    after_nodes = tracemalloc.get_traced_memory()[0]
+    ids = list(nodes)
+    for i, node in enumerate(nodes.values()):
+        for k in range(1, degree // 2 + 1):
+            other = nodes[ids[(i + k) % count]]
+            node.edges[other.id] = 1.0
+            other.edges[node.id] = 1.0
+    after_edges = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    edges = count * (degree // 2)
+    return (after_nodes - base) / count, (after_edges - after_nodes) / edges
+
+
+def main(count: int = 100_000, degree: int = 8) -> None:
+    for label, cls in (("before (LegacyNode)", LegacyNode), ("after (Node)", Node)):
+        per_node, per_edge = measure(cls, count, degree)
+        print(f"{label:<22} {per_node:8.1f} bytes/node {per_edge:8.1f} bytes/edge")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Compare the per-node metrics loop with the vectorised metrics table.
+
+Run with ``python -m benchmarks.bench_metrics``. The default size is one
+million undirected edges.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from hyperhelix.analytics.importance import compute_importance
+from hyperhelix.analytics.metrics import compute_metrics, write_importance
+from hyperhelix.analytics.permanence import compute_permanence
+
+from .bench_csr import build_graph, timed
+
+
+def per_node(graph) -> None:
+    nodes = graph.nodes
+    for node in nodes.values():
+        node.metadata.importance = compute_importance(node, nodes.values())
+        compute_permanence(node)
+        sum(node.edges.values())
+
+
+def main(edges: int = 1_000_000) -> None:
+    graph = timed("build HyperHelix", lambda: build_graph(edges // 4, edges))
+    timed("per-node loop", lambda: per_node(graph))
+    timed("metrics table (cold CSR)", lambda: compute_metrics(graph))
+    table = timed("metrics table (cached CSR)", lambda: compute_metrics(graph))
+    timed("bulk importance write", lambda: write_importance(graph, table))
+    timed("permanence column", lambda: table.permanence)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,54 @@
+"""Compare nodes expanded by each ``shortest_path`` mode.
+
+Run with ``python -m benchmarks.bench_pathfinding``. Graphs are weighted
+grids where every edge weight is at least the Euclidean distance between
+its endpoints, so the coordinate heuristic is admissible.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from hyperhelix import pathfinding
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+from hyperhelix.visualization.coords_generator import distance_heuristic
+
+
+def grid(size: int, seed: int = 0) -> tuple[HyperHelix, dict]:
+    rng = random.Random(seed)
+    graph = HyperHelix()
+    graph._insert_hooks.clear()
+    coords = {}
+    for x in range(size):
+        for y in range(size):
+            node_id = f"{x},{y}"
+            graph.add_node(Node(id=node_id, payload=None))
+            coords[node_id] = (float(x), float(y), 0.0)
+    for x in range(size):
+        for y in range(size):
+            if x + 1 < size:
+                graph.add_edge(f"{x},{y}", f"{x + 1},{y}", 1 + rng.random())
+            if y + 1 < size:
+                graph.add_edge(f"{x},{y}", f"{x},{y + 1}", 1 + rng.random())
+    return graph, coords
+
+
+def main() -> None:
+    print(f"{'grid':>8} {'method':<14} {'expanded':>9} {'ms':>8}")
+    for size in (50, 100, 200):
+        graph, coords = grid(size)
+        heuristic = distance_heuristic(coords)
+        start, end = "0,0", f"{size - 1},{size // 2}"
+        # Build the connectivity index outside the timed searches.
+        graph.connected(start, end)
+        for method in pathfinding.METHODS:
+            t0 = time.perf_counter()
+            result = graph.find_path(start, end, method, heuristic)
+            ms = (time.perf_counter() - t0) * 1e3
+            print(f"{size:>4}x{size:<3} {method:<14} {result.expanded:>9} {ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Compare sorting every node by importance with the maintained ranking.
+
+Run with ``python -m benchmarks.bench_rank``. The default size is 250k
+nodes; each query pass asks for the top 50 and one rank 1k times.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+
+from .bench_csr import build_graph, timed
+
+
+def sorted_top(graph, k: int, queries: int) -> None:
+    for _ in range(queries):
+        sorted(graph.nodes.values(), key=lambda n: -n.metadata.importance)[:k]
+
+
+def ranked_top(graph, k: int, queries: int) -> None:
+    ids = list(graph.nodes)
+    for i in range(queries):
+        graph.top_nodes_by_importance(k)
+        graph.importance_rank(ids[i])
+        graph.count_above_importance(0.5)
+
+
+def main(nodes: int = 250_000) -> None:
+    rng = random.Random(0)
+    graph = timed("build HyperHelix", lambda: build_graph(nodes, 0))
+    graph.set_importances((node_id, rng.random()) for node_id in graph.nodes)
+    timed("sort per query (x20)", lambda: sorted_top(graph, 50, 20))
+    timed("build ranking", lambda: graph.top_nodes_by_importance(1))
+    timed("ranked queries (x1k)", lambda: ranked_top(graph, 50, 1_000))
+    ids = rng.sample(list(graph.nodes), 20_000)
+    timed("20k importance writes", lambda: [graph.set_importance(i, rng.random()) for i in ids])
+    timed("bulk rewrite", lambda: graph.set_importances((i, rng.random()) for i in graph.nodes))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 250_000)
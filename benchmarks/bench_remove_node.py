@@ -0,0 +1,45 @@
+"""Measure ``HyperHelix.remove_node`` latency across graph sizes.
+
+Run with ``python -m benchmarks.bench_remove_node``. The mean latency per
+delete should stay flat as the graph grows because removal only visits the
+removed node's neighbours.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def build_graph(size: int, degree: int = 4, seed: int = 0) -> HyperHelix:
+    rng = random.Random(seed)
+    graph = HyperHelix()
+    # Skip the evolution hooks so setup stays fast at large sizes.
+    graph._insert_hooks.clear()
+    for i in range(size):
+        graph.add_node(Node(id=f"n{i}", payload=None))
+    for i in range(size):
+        for _ in range(degree // 2):
+            graph.add_edge(f"n{i}", f"n{rng.randrange(size)}")
+    return graph
+
+
+def bench(size: int, deletes: int = 500) -> float:
+    graph = build_graph(size)
+    victims = random.Random(1).sample(sorted(graph.nodes), deletes)
+    start = time.perf_counter()
+    for node_id in victims:
+        graph.remove_node(node_id)
+    return (time.perf_counter() - start) / deletes
+
+
+def main() -> None:
+    for size in (1_000, 10_000, 100_000):
+        print(f"{size:>8} nodes: {bench(size) * 1e6:8.2f} us/delete")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,31 +13,33 @@ def scan_repository(graph: HyperHelix, base_path: str) -> None:
     """Add all Python files under ``base_path`` to the graph.
 
     Nodes are created for each file and edges link modules that import
-    one another based on their ``import`` statements.
+    one another based on their ``import`` statements. Everything is
+    inserted in a single graph batch so hooks run once at the end.
     """
     root = Path(base_path)
     mapping: dict[Path, str] = {}
 
-    for file in root.rglob("*.py"):
-        content = file.read_text()
-        node_id = f"file:{file.relative_to(root)}"
-        graph.add_node(Node(id=node_id, payload={"path": str(file), "content": content}))
-        mapping[file.relative_to(root)] = node_id
-
-    for rel_path, node_id in mapping.items():
-        tree = ast.parse((root / rel_path).read_text())
-        for stmt in ast.walk(tree):
-            if isinstance(stmt, ast.Import):
-                for alias in stmt.names:
-                    target_rel = Path(alias.name.replace('.', '/')).with_suffix('.py')
+    with graph.batch():
+        for file in root.rglob("*.py"):
+            content = file.read_text()
+            node_id = f"file:{file.relative_to(root)}"
+            graph.add_node(Node(id=node_id, payload={"path": str(file), "content": content}))
+            mapping[file.relative_to(root)] = node_id
+
+        for rel_path, node_id in mapping.items():
+            tree = ast.parse((root / rel_path).read_text())
+            for stmt in ast.walk(tree):
+                if isinstance(stmt, ast.Import):
+                    for alias in stmt.names:
+                        target_rel = Path(alias.name.replace('.', '/')).with_suffix('.py')
+                        target_id = mapping.get(target_rel)
+                        if target_id:
+                            graph.add_edge(node_id, target_id)
+                elif isinstance(stmt, ast.ImportFrom) and stmt.module:
+                    target_rel = Path(stmt.module.replace('.', '/')).with_suffix('.py')
                     target_id = mapping.get(target_rel)
                     if target_id:
                         graph.add_edge(node_id, target_id)
-            elif isinstance(stmt, ast.ImportFrom) and stmt.module:
-                target_rel = Path(stmt.module.replace('.', '/')).with_suffix('.py')
-                target_id = mapping.get(target_rel)
-                if target_id:
-                    graph.add_edge(node_id, target_id)
 
 
 def load_module_from_node(graph: HyperHelix, node_id: str) -> ModuleType:
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from itertools import islice
+
 from ..core import HyperHelix
 
 
 def graph_summary(graph: HyperHelix, limit: int = 5) -> str:
     """Return a short text summary of the graph state."""
-    nodes = list(graph.nodes)[:limit]
-    summary = f"The graph contains {len(graph.nodes)} nodes."
+    snapshot = graph.snapshot()
+    summary = f"The graph contains {len(snapshot)} nodes."
+    nodes = list(islice(snapshot, limit))
     if nodes:
         summary += f" Sample nodes: {', '.join(nodes)}."
     return summary
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 from ..core import HyperHelix
 from ..node import Node
 
@@ -7,3 +9,8 @@ from ..node import Node
 def process_webhook(graph: HyperHelix, payload: dict) -> None:
     node_id = payload.get("id", "webhook")
     graph.add_node(Node(id=node_id, payload=payload))
+
+
+def process_webhooks(graph: HyperHelix, payloads: Iterable[dict]) -> None:
+    """Ingest a backlog of webhook payloads in one graph batch."""
+    graph.add_nodes(Node(id=p.get("id", "webhook"), payload=p) for p in payloads)
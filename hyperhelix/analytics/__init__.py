@@ -1 +1,19 @@
-"""Utilities for analyzing node importance and permanence."""
+"""Utilities for analyzing node importance and permanence.
+
+Permanence is age-based and derived from ``created_ts`` whenever it is read
+(``node.metadata.permanence``, :mod:`.permanence`), so no engine stores it.
+The remaining modules score a ``freeze()`` CSR snapshot with NumPy:
+
+- :mod:`.centrality` – weighted PageRank and eigenvector centrality by power
+  iteration. ``CentralityEngine`` warm-starts from its previous vector and
+  writes ``NodeMetadata.importance`` (PageRank sums to 1), after which the
+  degree-based insert hooks stop writing it; ``MetricsScheduler`` can run it.
+- :mod:`.communities` – label propagation and Louvain, swept in random waves
+  that go to a process pool above ``PARALLEL_MIN_EDGES``. ``assign_strands``
+  stores the result as ``community-<n>`` strands.
+- :mod:`.betweenness` – Brandes' algorithm from sampled sources, sized by an
+  ``epsilon``/``delta`` target and reporting a Hoeffding ``error_bound``.
+  ``spiral_walk(priority=...)`` and ``sprint_plan`` visit high scorers first.
+- :mod:`.metrics` – ``MetricsTable`` columns keyed by snapshot index, and
+  ``write_importance`` to store importance in one pass.
+"""
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING, Dict, Generator, List, Tuple
+
+import logging
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..csr import CSRGraph
+
+logger = logging.getLogger(__name__)
+
+# Sources per task handed to a worker.
+DEFAULT_BATCH = 8
+
+
+@dataclass
+class BetweennessResult:
+    """Estimated normalised betweenness by CSR index.
+
+    ``error_bound`` is the additive error that holds for every node at once
+    with probability ``1 - delta``; it is ``0.0`` once every node has been
+    used as a source, when the scores are exact.
+    """
+
+    ids: Tuple[str, ...]
+    scores: np.ndarray
+    samples: int
+    error_bound: float
+    elapsed: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(zip(self.ids, self.scores.tolist()))
+
+    def top(self, k: int) -> List[Tuple[str, float]]:
+        """The ``k`` highest-scoring ids with their scores, best first."""
+        k = min(k, len(self.scores))
+        if k <= 0:
+            return []
+        best = np.argpartition(-self.scores, k - 1)[:k]
+        best = best[np.argsort(-self.scores[best], kind="stable")]
+        return [(self.ids[i], float(self.scores[i])) for i in best]
+
+
+def samples_for(n: int, epsilon: float, delta: float = 0.1) -> int:
+    """Sources needed for error ``epsilon`` on all ``n`` nodes with probability ``1 - delta``.
+
+    Hoeffding's bound with a union bound over the nodes; each sample's
+    contribution to a normalised score lies in ``[0, n / (n - 1)]``.
+    """
+    if n < 3:
+        return n
+    spread = n / (n - 1)
+    return min(n, math.ceil(spread ** 2 * math.log(2 * n / delta) / (2 * epsilon ** 2)))
+
+
+def approximate_betweenness(
+    snapshot: "CSRGraph",
+    samples: int | None = None,
+    epsilon: float = 0.05,
+    delta: float = 0.1,
+    time_budget: float | None = None,
+    workers: int = 1,
+    seed: int = 0,
+) -> BetweennessResult:
+    """Weighted betweenness estimated from randomly sampled source nodes.
+
+    See :func:`iter_betweenness`; this returns its final estimate.
+    """
+    result = None
+    for result in iter_betweenness(snapshot, samples, epsilon, delta, time_budget, workers, seed):
+        pass
+    return result
+
+
+def iter_betweenness(
+    snapshot: "CSRGraph",
+    samples: int | None = None,
+    epsilon: float = 0.05,
+    delta: float = 0.1,
+    time_budget: float | None = None,
+    workers: int = 1,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH,
+) -> Generator[BetweennessResult, None, None]:
+    """Yield improving betweenness estimates as batches of sources finish.
+
+    Runs Brandes' weighted dependency accumulation from ``samples`` distinct
+    random sources, ``samples_for(n, epsilon, delta)`` when not given. A
+    ``time_budget`` in seconds stops handing out new batches once spent; the
+    bound then reflects the sources actually used. With ``workers > 1``
+    batches run in a process pool.
+    """
+    started = time.monotonic()
+    deadline = started + time_budget if time_budget is not None else None
+    n = snapshot.num_nodes
+    target = min(n, samples if samples is not None else samples_for(n, epsilon, delta))
+    sources = np.random.default_rng(seed).permutation(n)[:target]
+    batches = [sources[i:i + batch_size] for i in range(0, target, batch_size)]
+    totals = np.zeros(n)
+    done = 0
+
+    def estimate() -> BetweennessResult:
+        scale = n / (done * (n - 1) * (n - 2)) if done and n > 2 else 0.0
+        if done >= n or n < 3:
+            bound = 0.0
+        else:
+            bound = n / (n - 1) * math.sqrt(math.log(2 * n / delta) / (2 * done)) if done else math.inf
+        return BetweennessResult(snapshot.ids, totals * scale, done, bound, time.monotonic() - started)
+
+    def out_of_time() -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    args = (snapshot.offsets, snapshot.neighbors, snapshot.weights)
+    if workers <= 1 or len(batches) <= 1:
+        context = _context(*args)
+        for batch in batches:
+            if out_of_time():
+                break
+            partial, count = _dependencies(context, batch, deadline)
+            totals += partial
+            done += count
+            yield estimate()
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=args) as pool:
+            queue = iter(batches)
+            running = set()
+            while True:
+                while len(running) < workers * 2 and not out_of_time():
+                    batch = next(queue, None)
+                    if batch is None:
+                        break
+                    running.add(pool.submit(_dependencies, None, batch, deadline))
+                if not running:
+                    break
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    partial, count = future.result()
+                    totals += partial
+                    done += count
+                yield estimate()
+    if not done:
+        yield estimate()
+    logger.debug("Betweenness from %d of %d sources in %.3f s", done, n, time.monotonic() - started)
+
+
+# Graph adjacency of a pool worker process, set once by ``_init_worker``.
+_worker_context: Dict[str, list] = {}
+
+
+def _context(offsets: np.ndarray, neighbors: np.ndarray, weights: np.ndarray) -> Dict[str, list]:
+    # Plain lists are much faster than array indexing in the Dijkstra loop.
+    return {"offsets": offsets.tolist(), "neighbors": neighbors.tolist(), "weights": weights.tolist()}
+
+
+def _init_worker(*args) -> None:
+    _worker_context.update(_context(*args))
+
+
+def _dependencies(
+    context: Dict[str, list] | None, sources: np.ndarray, deadline: float | None = None
+) -> Tuple[np.ndarray, int]:
+    """Summed Brandes dependencies of every node on shortest paths from ``sources``.
+
+    Sources not started by ``deadline`` are skipped; returns the sums and
+    how many sources were used.
+    """
+    ctx = _worker_context if context is None else context
+    offsets, neighbors, weights = ctx["offsets"], ctx["neighbors"], ctx["weights"]
+    totals = [0.0] * (len(offsets) - 1)
+    used = 0
+    for s in sources.tolist():
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        used += 1
+        dist: Dict[int, float] = {}
+        sigma = {s: 1.0}
+        preds: Dict[int, List[int]] = {s: []}
+        order: List[int] = []
+        tentative = {s: 0.0}
+        heap = [(0.0, s)]
+        while heap:
+            d, v = heappop(heap)
+            if v in dist:
+                continue
+            dist[v] = d
+            order.append(v)
+            for k in range(offsets[v], offsets[v + 1]):
+                w = neighbors[k]
+                nd = d + weights[k]
+                if w in dist:
+                    continue
+                best = tentative.get(w)
+                if best is None or nd < best:
+                    tentative[w] = nd
+                    sigma[w] = sigma[v]
+                    preds[w] = [v]
+                    heappush(heap, (nd, w))
+                elif nd == best:
+                    sigma[w] += sigma[v]
+                    preds[w].append(v)
+        dependency = dict.fromkeys(order, 0.0)
+        for w in reversed(order):
+            coeff = (1.0 + dependency[w]) / sigma[w]
+            for v in preds[w]:
+                dependency[v] += sigma[v] * coeff
+            if w != s:
+                totals[w] += dependency[w]
+    return np.asarray(totals), used
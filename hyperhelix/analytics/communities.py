@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import logging
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..core import HyperHelix
+    from ..csr import CSRGraph
+
+logger = logging.getLogger(__name__)
+
+# Below this many stored edges the work runs in-process even when workers > 1.
+PARALLEL_MIN_EDGES = 200_000
+# Each sweep visits the nodes in this many random waves. Nodes in one wave
+# decide together (split across the workers) while later waves see their
+# choices, which keeps the sweep close to asynchronous.
+WAVES = 16
+
+
+@dataclass
+class CommunityResult:
+    """Community label per CSR index, numbered from the largest community."""
+
+    ids: Tuple[str, ...]
+    labels: np.ndarray
+    iterations: int
+    modularity: float
+
+    @property
+    def count(self) -> int:
+        return int(self.labels.max()) + 1 if len(self.labels) else 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(zip(self.ids, self.labels.tolist()))
+
+    def groups(self) -> List[List[str]]:
+        """Member ids of each community, largest first."""
+        members: List[List[str]] = [[] for _ in range(self.count)]
+        for node_id, label in zip(self.ids, self.labels.tolist()):
+            members[label].append(node_id)
+        return members
+
+
+def modularity(snapshot: "CSRGraph", labels: np.ndarray, resolution: float = 1.0) -> float:
+    """Weighted modularity of a partition given as one label per CSR index."""
+    return _modularity(snapshot.offsets, snapshot.neighbors, snapshot.weights, labels, resolution)
+
+
+def label_propagation(
+    snapshot: "CSRGraph", max_iter: int = 50, workers: int = 1, seed: int = 0
+) -> CommunityResult:
+    """Communities by label propagation.
+
+    Every node starts in its own community and repeatedly adopts the label
+    with the largest total edge weight among its neighbours, keeping its
+    own label on ties, until no node changes. Each sweep visits the nodes
+    in random waves; with ``workers > 1`` a wave is split across a process
+    pool.
+    """
+    n = snapshot.num_nodes
+    labels = np.arange(n, dtype=np.int64)
+    iterations = 0
+    with _Pool(snapshot.offsets, snapshot.neighbors, snapshot.weights, workers) as pool:
+        for iterations in range(1, max_iter + 1):
+            labels, moved = pool.sweep(_lpa_part, labels, seed + iterations)
+            if not moved:
+                break
+    labels = _compact(labels)
+    score = modularity(snapshot, labels)
+    logger.debug(
+        "Label propagation: %d communities after %d sweeps", labels.max(initial=-1) + 1, iterations
+    )
+    return CommunityResult(snapshot.ids, labels, iterations, score)
+
+
+def louvain(
+    snapshot: "CSRGraph",
+    resolution: float = 1.0,
+    max_levels: int = 10,
+    max_passes: int = 20,
+    tol: float = 1e-7,
+    workers: int = 1,
+    seed: int = 0,
+) -> CommunityResult:
+    """Communities by Louvain-style modularity optimisation.
+
+    Each level moves nodes to the neighbouring community with the best
+    modularity gain until few nodes move, then collapses every community
+    into one node and repeats on the smaller graph. Sweeps run in random
+    waves as in :func:`label_propagation`, across a process pool when
+    ``workers > 1``. Stops when a level improves modularity by less than
+    ``tol``.
+    """
+    offsets, neighbors, weights = snapshot.offsets, snapshot.neighbors, snapshot.weights
+    membership = np.arange(snapshot.num_nodes, dtype=np.int64)
+    if not weights.sum():
+        return CommunityResult(snapshot.ids, membership, 0, 0.0)
+    best = _modularity(offsets, neighbors, weights, membership, resolution)
+    levels = 0
+    for levels in range(1, max_levels + 1):
+        n = len(offsets) - 1
+        labels = np.arange(n, dtype=np.int64)
+        with _Pool(offsets, neighbors, weights, workers, resolution) as pool:
+            for sweep in range(max_passes):
+                labels, moved = pool.sweep(_louvain_part, labels, seed + levels * max_passes + sweep)
+                if moved <= n // 1000:
+                    break
+        labels = _compact(labels)
+        score = _modularity(offsets, neighbors, weights, labels, resolution)
+        if score - best < tol:
+            break
+        best = score
+        membership = labels[membership]
+        offsets, neighbors, weights = _collapse(offsets, neighbors, weights, labels)
+    membership = _compact(membership)
+    logger.debug(
+        "Louvain: %d communities after %d levels, modularity %.4f",
+        membership.max(initial=-1) + 1, levels, best,
+    )
+    return CommunityResult(snapshot.ids, membership, levels, best)
+
+
+def assign_strands(graph: "HyperHelix", result: CommunityResult, prefix: str = "community-") -> int:
+    """Move each node to the strand ``{prefix}{label}``; returns how many moved."""
+    moved = 0
+    for node_id, label in zip(result.ids, result.labels.tolist()):
+        node = graph.nodes.get(node_id)
+        strand = f"{prefix}{label}"
+        if node is not None and node.strand != strand:
+            graph.set_strand(node_id, strand)
+            moved += 1
+    logger.info("Assigned %d nodes to %d community strands", moved, result.count)
+    return moved
+
+
+# -- sweeps ------------------------------------------------------------------
+
+# Graph arrays of a pool worker process, set once by ``_init_worker``.
+_worker_context: Dict[str, object] = {}
+
+
+def _context(
+    offsets: np.ndarray, neighbors: np.ndarray, weights: np.ndarray, resolution: float
+) -> Dict[str, object]:
+    n = len(offsets) - 1
+    strength = np.bincount(np.repeat(np.arange(n), np.diff(offsets)), weights=weights, minlength=n)
+    return {
+        "offsets": offsets,
+        "neighbors": neighbors,
+        "weights": weights,
+        "resolution": resolution,
+        "strength": strength,
+        "total": float(weights.sum()),
+    }
+
+
+def _init_worker(*args) -> None:
+    _worker_context.update(_context(*args))
+
+
+def _run_part(fn, labels: np.ndarray, totals: np.ndarray | None, nodes: np.ndarray, ctx: Dict | None = None):
+    return fn(_worker_context if ctx is None else ctx, labels, totals, nodes)
+
+
+class _Pool:
+    """Runs sweeps over random node waves, inline or in a process pool."""
+
+    def __init__(
+        self,
+        offsets: np.ndarray,
+        neighbors: np.ndarray,
+        weights: np.ndarray,
+        workers: int,
+        resolution: float = 1.0,
+    ) -> None:
+        self.workers = max(1, workers) if len(neighbors) >= PARALLEL_MIN_EDGES else 1
+        self.args = (offsets, neighbors, weights, resolution)
+        self.context = _context(*self.args)
+        self.executor: Executor | None = None
+
+    def __enter__(self) -> "_Pool":
+        if self.workers > 1:
+            self.executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=self.args)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def sweep(self, fn, labels: np.ndarray, seed: int) -> Tuple[np.ndarray, int]:
+        """Update every node once; returns the new labels and how many nodes moved."""
+        labels = labels.copy()
+        moved = 0
+        rng = np.random.default_rng(seed)
+        for wave in np.array_split(rng.permutation(len(labels)), WAVES):
+            totals = None
+            if fn is _louvain_part:
+                totals = np.bincount(labels, weights=self.context["strength"], minlength=len(labels))
+            parts = [part for part in np.array_split(wave, self.workers) if len(part)]
+            if self.executor is None:
+                results = [_run_part(fn, labels, totals, part, self.context) for part in parts]
+            else:
+                futures = [self.executor.submit(_run_part, fn, labels, totals, part) for part in parts]
+                results = [f.result() for f in futures]
+            for part, new in zip(parts, results):
+                moved += int(np.count_nonzero(labels[part] != new))
+                labels[part] = new
+        return labels, moved
+
+
+def _neighbour_scores(ctx: Dict, labels: np.ndarray, nodes: np.ndarray):
+    """Total edge weight from each of ``nodes`` to each neighbouring label.
+
+    Returns parallel ``rows`` (positions in ``nodes``), ``cands`` and
+    ``scores`` arrays; self-loops are skipped.
+    """
+    offsets, neighbors, weights = ctx["offsets"], ctx["neighbors"], ctx["weights"]
+    starts = offsets[nodes]
+    degree = offsets[nodes + 1] - starts
+    rows = np.repeat(np.arange(len(nodes)), degree)
+    # Edge slots of every node, laid end to end.
+    slots = np.repeat(starts - (np.cumsum(degree) - degree), degree) + np.arange(len(rows))
+    nbrs = neighbors[slots]
+    keep = nbrs != nodes[rows]
+    rows, nbrs, w = rows[keep], nbrs[keep], weights[slots[keep]]
+    n = len(labels)
+    keys, inverse = np.unique(rows * n + labels[nbrs], return_inverse=True)
+    return keys // n, keys % n, np.bincount(inverse, weights=w)
+
+
+def _pick_best(current: np.ndarray, rows, cands, gain, stay) -> np.ndarray:
+    """Labels after moving each row to its best candidate when that beats ``stay``."""
+    new = current.copy()
+    if not len(rows):
+        return new
+    order = np.lexsort((-gain, rows))
+    rows, cands, gain = rows[order], cands[order], gain[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = rows[1:] != rows[:-1]
+    rows, cands, gain = rows[first], cands[first], gain[first]
+    better = gain > stay[rows] + 1e-12
+    new[rows[better]] = cands[better]
+    return new
+
+
+def _lpa_part(ctx: Dict, labels: np.ndarray, totals: None, nodes: np.ndarray) -> np.ndarray:
+    rows, cands, scores = _neighbour_scores(ctx, labels, nodes)
+    current = labels[nodes]
+    # Weight already linking each node to its own label; ties keep it.
+    stay = np.zeros(len(nodes))
+    own = cands == current[rows]
+    stay[rows[own]] = scores[own]
+    return _pick_best(current, rows, cands, scores, stay)
+
+
+def _louvain_part(ctx: Dict, labels: np.ndarray, totals: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    rows, cands, links = _neighbour_scores(ctx, labels, nodes)
+    strength = ctx["strength"][nodes]
+    scale = ctx["resolution"] * strength / ctx["total"]
+    current = labels[nodes]
+    own = cands == current[rows]
+    # Gain of joining community c, up to a constant: links(i, c) - gamma * tot(c) * k_i / 2m,
+    # with the node itself taken out of its current community's total.
+    gain = links - scale[rows] * (totals[cands] - np.where(own, strength[rows], 0.0))
+    stay = -scale * (totals[current] - strength)
+    stay[rows[own]] = gain[own]
+    return _pick_best(current, rows, cands, gain, stay)
+
+
+# -- partition helpers -------------------------------------------------------
+
+
+def _compact(labels: np.ndarray) -> np.ndarray:
+    """Renumber labels 0..k-1 with the largest community first."""
+    if not len(labels):
+        return labels
+    uniq, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    rank = np.empty(len(uniq), dtype=np.int64)
+    rank[np.argsort(-counts, kind="stable")] = np.arange(len(uniq))
+    return rank[inverse]
+
+
+def _modularity(
+    offsets: np.ndarray, neighbors: np.ndarray, weights: np.ndarray, labels: np.ndarray, resolution: float
+) -> float:
+    total = float(weights.sum())
+    if not total:
+        return 0.0
+    rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    inside = float(weights[labels[rows] == labels[neighbors]].sum())
+    totals = np.bincount(labels[rows], weights=weights, minlength=int(labels.max()) + 1)
+    return inside / total - resolution * float((totals ** 2).sum()) / total ** 2
+
+
+def _collapse(
+    offsets: np.ndarray, neighbors: np.ndarray, weights: np.ndarray, labels: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR arrays of the graph with each community merged into one node."""
+    k = int(labels.max()) + 1
+    rows = labels[np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))]
+    keys, inverse = np.unique(rows * k + labels[neighbors], return_inverse=True)
+    merged = np.bincount(inverse, weights=weights)
+    src = keys // k
+    new_offsets = np.zeros(k + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=k), out=new_offsets[1:])
+    return new_offsets, keys % k, merged
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from ..node import Node
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
+
+    from ..csr import CSRGraph
+
 
 def compute_importance(node: Node, all_nodes: Iterable[Node]) -> float:
     """Compute node importance based on degree."""
     return float(len(node.edges))
+
+
+def compute_importance_array(snapshot: "CSRGraph") -> "np.ndarray":
+    """Degree-based importance for every node of a CSR snapshot, by index."""
+    return snapshot.degree().astype(float)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Mapping, Tuple
+
+import logging
+
+import numpy as np
+
+from .importance import compute_importance_array
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..core import HyperHelix
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("degree", "weighted_degree", "importance", "created_ts", "permanence")
+
+
+@dataclass
+class MetricsTable:
+    """Per-node metrics as NumPy columns aligned with a CSR snapshot's ids.
+
+    ``permanence`` is derived from ``created_ts`` when read, like
+    ``NodeMetadata.permanence``.
+    """
+
+    ids: Tuple[str, ...]
+    index: Mapping[str, int]
+    degree: np.ndarray
+    weighted_degree: np.ndarray
+    importance: np.ndarray
+    created_ts: np.ndarray
+    version: int = 0
+
+    @property
+    def permanence(self) -> np.ndarray:
+        return time.time() - self.created_ts
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, node_id: str) -> Dict[str, float]:
+        i = self.index[node_id]
+        return {name: float(getattr(self, name)[i]) for name in COLUMNS}
+
+    def top(self, column: str, k: int) -> List[Tuple[str, float]]:
+        """The ``k`` ids with the largest ``column`` values, largest first."""
+        values = getattr(self, column)
+        k = min(k, len(values))
+        if k <= 0:
+            return []
+        best = np.argpartition(-values, k - 1)[:k]
+        best = best[np.argsort(-values[best], kind="stable")]
+        return [(self.ids[i], float(values[i])) for i in best]
+
+
+def compute_metrics(graph: "HyperHelix", importance: np.ndarray | None = None) -> MetricsTable:
+    """Compute every node's metrics at once from the graph's CSR snapshot.
+
+    ``importance`` overrides the degree-based default, for example with
+    centrality scores aligned to the same snapshot.
+    """
+    with graph.read_lock():
+        snapshot = graph.freeze()
+        nodes = graph.nodes
+        created = np.fromiter(
+            (nodes[node_id].metadata.created_ts for node_id in snapshot.ids),
+            dtype=np.float64,
+            count=snapshot.num_nodes,
+        )
+    return MetricsTable(
+        snapshot.ids,
+        snapshot.index,
+        snapshot.degree(),
+        snapshot.weighted_degree(),
+        compute_importance_array(snapshot) if importance is None else importance,
+        created,
+        snapshot.version,
+    )
+
+
+def write_importance(graph: "HyperHelix", table: MetricsTable) -> int:
+    """Store the table's importance column on the nodes; returns how many were written."""
+    with graph.read_lock():
+        written = graph.set_importances(zip(table.ids, table.importance.tolist()))
+    logger.debug("Wrote importance for %d nodes", written)
+    return written
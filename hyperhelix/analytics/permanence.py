@@ -1,11 +1,35 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
+from typing import Iterable, List
+
+import numpy as np
 
 from ..node import Node
 
 
-def compute_permanence(node: Node) -> float:
-    """Simple permanence metric based on age."""
-    age = (datetime.now(timezone.utc) - node.metadata.created).total_seconds()
-    return age
+def compute_permanence(node: Node, now: float | None = None) -> float:
+    """Simple permanence metric based on age.
+
+    Derived from ``created_ts`` on demand, like ``node.metadata.permanence``,
+    so no engine has to keep a stored value fresh.
+    """
+    return (time.time() if now is None else now) - node.metadata.created_ts
+
+
+def compute_permanence_array(nodes: Iterable[Node], now: float | None = None) -> np.ndarray:
+    """Permanence of every node in ``nodes`` at one instant, in iteration order."""
+    created = np.fromiter((node.metadata.created_ts for node in nodes), dtype=float)
+    return (time.time() if now is None else now) - created
+
+
+def rank_by_permanence(nodes: Iterable[Node], k: int | None = None) -> List[str]:
+    """Node ids ordered from most to least permanent, optionally only the top ``k``."""
+    nodes = list(nodes)
+    scores = compute_permanence_array(nodes)
+    if k is not None and k < len(nodes):
+        top = np.argpartition(-scores, k)[:k] if k > 0 else np.empty(0, dtype=int)
+        order = top[np.argsort(-scores[top], kind="stable")]
+    else:
+        order = np.argsort(-scores, kind="stable")
+    return [nodes[i].id for i in order]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import os
+
 from fastapi import FastAPI
 
 from ..core import HyperHelix
+from ..persistence.journal import Journal
 from .routers import (
     nodes,
     edges,
@@ -15,10 +18,26 @@ from .routers import (
     models,
     summary,
     export,
+    path,
+    metrics,
 )
 
+
+def _create_graph() -> HyperHelix:
+    """Build the app graph from the ``HYPERHELIX_JOURNAL``,
+    ``HYPERHELIX_HOOK_METRICS`` and ``HYPERHELIX_DISTANCE_ORACLE``
+    environment settings."""
+    journal_dir = os.getenv("HYPERHELIX_JOURNAL")
+    graph = HyperHelix(journal=Journal(journal_dir) if journal_dir else None)
+    if os.getenv("HYPERHELIX_HOOK_METRICS"):
+        graph.enable_hook_metrics()
+    if os.getenv("HYPERHELIX_DISTANCE_ORACLE"):
+        graph.enable_distance_oracle()
+    return graph
+
+
 app = FastAPI()
-app.state.graph = HyperHelix()
+app.state.graph = _create_graph()
 app.include_router(nodes.router)
 app.include_router(edges.router)
 app.include_router(walk.router)
@@ -30,6 +49,8 @@ app.include_router(chat.router)
 app.include_router(models.router)
 app.include_router(summary.router)
 app.include_router(export.router)
+app.include_router(path.router)
+app.include_router(metrics.router)
 
 
 @app.get('/')
@@ -1,22 +1,47 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import logging
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ..dependencies import get_graph
+from .walk import MAX_WALK_NODES
 from ...core import HyperHelix
 from ...visualization.threejs_renderer import node_to_json
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.get('/export')
-def export_graph(graph: HyperHelix = Depends(get_graph)) -> dict:
-    """Return the full graph as a JSON payload."""
-    nodes = [node_to_json(n) for n in graph.nodes.values()]
-    edges = [
-        {'a': a, 'b': b, 'weight': w}
-        for a, node in graph.nodes.items()
-        for b, w in node.edges.items()
-        if a < b
-    ]
-    return {'nodes': nodes, 'edges': edges}
+def export_graph(
+    nodes: List[str] = Query(default=[]),
+    around: List[str] = Query(default=[]),
+    depth: int = 1,
+    max_nodes: int = Query(1_000, ge=1, le=MAX_WALK_NODES),
+    graph: HyperHelix = Depends(get_graph),
+) -> dict:
+    """Return the graph, or the subgraph induced by ``nodes`` and the
+    neighbourhood of ``around``, as a JSON payload."""
+    if not nodes and not around:
+        snapshot = graph.snapshot()
+        return {
+            'version': snapshot.version,
+            'nodes': [node_to_json(n) for n in snapshot.nodes.values()],
+            'edges': [{'a': a, 'b': b, 'weight': w} for a, b, w in snapshot.edges()],
+        }
+    with graph.read_lock():
+        ids = list(nodes)
+        if around:
+            try:
+                ids.extend(graph.neighborhood(around, depth, max_nodes=max_nodes))
+            except KeyError as exc:
+                logger.error("Export start node %s not found", exc.args[0])
+                raise HTTPException(status_code=404, detail='Start node not found')
+        view = graph.subgraph(ids)
+        return {
+            'version': view.version,
+            'nodes': [node_to_json(n) for n in view.nodes.values()],
+            'edges': [{'a': a, 'b': b, 'weight': w} for a, b, w in view.edges()],
+        }
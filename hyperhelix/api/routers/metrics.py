@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from ..dependencies import get_graph
+from ...core import HyperHelix
+
+router = APIRouter()
+
+
+@router.get('/metrics/hooks')
+def hook_metrics(graph: HyperHelix = Depends(get_graph)) -> dict:
+    """Return per-hook call counts, latency percentiles and last errors."""
+    metrics = graph.hook_metrics
+    if metrics is None:
+        return {'enabled': False, 'hooks': []}
+    return {'enabled': True, 'hooks': [s.as_dict() for s in metrics.stats()]}
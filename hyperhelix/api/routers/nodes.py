@@ -1,53 +1,107 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from functools import lru_cache
 from typing import List
 import logging
 
-from ..schemas import NodeIn, NodeOut, StatusOut
+from ..schemas import NodeIn, NodeOut, RankedNodeOut, StatusOut
 from ..dependencies import get_graph
 from ...core import HyperHelix
 from ...node import Node
 from ...execution.executor import execute_node
+from ...utils import load_config
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+MAX_TOP_NODES = 1_000
+
+
+@lru_cache(maxsize=1)
+def importance_threshold() -> float:
+    """``thresholds.importance`` from ``config/default.yaml``, loaded once."""
+    return float((load_config().get("thresholds") or {}).get("importance", 0.5))
+
 
 @router.post('/nodes', response_model=NodeOut)
 def create_node(node: NodeIn, graph: HyperHelix = Depends(get_graph)) -> NodeOut:
-    if node.id in graph.nodes:
-        logger.error("Create node failed duplicate id %s", node.id)
-        raise HTTPException(status_code=400, detail='Node exists')
-    g_node = Node(id=node.id, payload=node.payload)
-    graph.add_node(g_node)
-    return NodeOut(id=g_node.id, payload=g_node.payload)
+    with graph.write_lock():
+        if node.id in graph.nodes:
+            logger.error("Create node failed duplicate id %s", node.id)
+            raise HTTPException(status_code=400, detail='Node exists')
+        g_node = Node(id=node.id, payload=node.payload, layer=node.layer, strand=node.strand)
+        graph.add_node(g_node)
+    return NodeOut.from_node(g_node)
+
+
+# Declared before ``/nodes/{node_id}`` so "top" is not taken for a node id.
+@router.get('/nodes/top', response_model=List[RankedNodeOut])
+def top_nodes(
+    n: int = Query(10, ge=1, le=MAX_TOP_NODES),
+    threshold: float | None = None,
+    important: bool = False,
+    graph: HyperHelix = Depends(get_graph),
+) -> list[RankedNodeOut]:
+    """Return the ``n`` most important nodes, highest first.
+
+    ``threshold`` keeps only nodes at least that important; ``important``
+    applies the configured ``thresholds.importance`` instead.
+    """
+    if threshold is None and important:
+        threshold = importance_threshold()
+    with graph.read_lock():
+        if threshold is None:
+            nodes = graph.top_nodes_by_importance(n)
+        else:
+            nodes = graph.nodes_above_importance(threshold, n)
+        return [
+            RankedNodeOut(
+                id=node.id,
+                payload=node.payload,
+                layer=node.layer,
+                strand=node.strand,
+                importance=node.metadata.importance,
+                rank=rank,
+            )
+            for rank, node in enumerate(nodes)
+        ]
 
 
 @router.get('/nodes/{node_id}', response_model=NodeOut)
 def get_node(node_id: str, graph: HyperHelix = Depends(get_graph)) -> NodeOut:
     try:
-        node = graph.nodes[node_id]
+        with graph.read_lock():
+            node = graph.nodes[node_id]
     except KeyError:
         logger.error("Node %s not found", node_id)
         raise HTTPException(status_code=404, detail='Not found')
-    return NodeOut(id=node.id, payload=node.payload)
+    return NodeOut.from_node(node)
 
 
 @router.delete('/nodes/{node_id}', response_model=StatusOut)
 def delete_node(node_id: str, graph: HyperHelix = Depends(get_graph)) -> StatusOut:
     """Remove a node from the graph."""
-    if node_id not in graph.nodes:
+    try:
+        graph.remove_node(node_id)
+    except KeyError:
         logger.error("Node %s not found", node_id)
         raise HTTPException(status_code=404, detail='Not found')
-    graph.remove_node(node_id)
     return StatusOut(status="deleted")
 
 
 @router.get('/nodes', response_model=List[NodeOut])
-def list_nodes(graph: HyperHelix = Depends(get_graph)) -> list[NodeOut]:
-    """Return all nodes in the graph sorted by identifier."""
-    nodes = [NodeOut(id=n.id, payload=n.payload) for n in graph.nodes.values()]
+def list_nodes(
+    strand: str | None = None,
+    layer_min: int | None = None,
+    layer_max: int | None = None,
+    graph: HyperHelix = Depends(get_graph),
+) -> list[NodeOut]:
+    """Return nodes sorted by identifier, optionally filtered by strand and layer range."""
+    nodes = [
+        NodeOut.from_node(n)
+        for n in graph.find_nodes(strand=strand, layer_min=layer_min, layer_max=layer_max)
+    ]
     return sorted(nodes, key=lambda n: n.id)
 
 
@@ -59,4 +113,4 @@ def execute_node_endpoint(node_id: str, graph: HyperHelix = Depends(get_graph))
         raise HTTPException(status_code=404, detail='Not found')
     execute_node(graph, node_id)
     node = graph.nodes[node_id]
-    return NodeOut(id=node.id, payload=node.payload)
+    return NodeOut.from_node(node)
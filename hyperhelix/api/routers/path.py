@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException
+import logging
+
+from ..schemas import PathOut
+from ..dependencies import get_graph
+from ...core import HyperHelix
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get('/path/{a}/{b}', response_model=PathOut)
+def get_path(a: str, b: str, method: str = 'dijkstra', graph: HyperHelix = Depends(get_graph)) -> PathOut:
+    """Return the shortest path between two nodes."""
+    try:
+        result = graph.find_path(a, b, method)
+    except KeyError as exc:
+        logger.error("Path lookup failed missing node %s", exc.args[0])
+        raise HTTPException(status_code=404, detail=f"Node {exc.args[0]} not found")
+    except ValueError as exc:
+        logger.error("Path lookup failed: %s", exc)
+        raise HTTPException(status_code=400, detail=str(exc))
+    cost = result.cost if result.path else None
+    return PathOut(path=result.path, cost=cost, expanded=result.expanded)
@@ -14,10 +14,11 @@ router = APIRouter()
 
 @router.post('/tasks', response_model=TaskOut)
 def create_task(task: TaskIn, graph: HyperHelix = Depends(get_graph)) -> TaskOut:
-    if task.id in graph.nodes:
-        raise HTTPException(status_code=400, detail='Task exists')
-    data = Task(**task.model_dump())
-    task_manager.create_task(graph, data)
+    with graph.write_lock():
+        if task.id in graph.nodes:
+            raise HTTPException(status_code=400, detail='Task exists')
+        data = Task(**task.model_dump())
+        task_manager.create_task(graph, data)
     return TaskOut(**task.model_dump())
 
 
@@ -36,7 +37,9 @@ def assign_task_endpoint(
 @router.get('/tasks', response_model=List[TaskOut])
 def list_tasks(graph: HyperHelix = Depends(get_graph)) -> List[TaskOut]:
     tasks: List[TaskOut] = []
-    for node in graph.nodes.values():
+    with graph.read_lock():
+        nodes = list(graph.nodes.values())
+    for node in nodes:
         if isinstance(node.payload, Task):
             tasks.append(TaskOut(**node.payload.__dict__))
     return tasks
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 import logging
 from typing import List
 
@@ -11,12 +11,36 @@ from ...core import HyperHelix
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+MAX_WALK_NODES = 10_000
+MAX_WALK_EDGES = 100_000
+
 
 @router.get('/walk/{start_id}', response_model=List[NodeOut])
-def walk_graph(start_id: str, depth: int = 1, graph: HyperHelix = Depends(get_graph)) -> list[NodeOut]:
+def walk_graph(
+    start_id: str,
+    depth: int = 1,
+    max_nodes: int = Query(1_000, ge=1, le=MAX_WALK_NODES),
+    max_edges: int = Query(MAX_WALK_EDGES, ge=1, le=MAX_WALK_EDGES),
+    min_weight: float | None = None,
+    strand: str | None = None,
+    layer: int | None = None,
+    also: List[str] = Query(default=[]),
+    graph: HyperHelix = Depends(get_graph),
+) -> list[NodeOut]:
+    """Walk outward from ``start_id`` (and any ``also`` ids) within bounded budgets."""
     try:
-        nodes = list(graph.spiral_walk(start_id, depth))
-    except KeyError:
-        logger.error("Start node %s not found", start_id)
+        nodes = list(
+            graph.spiral_walk(
+                [start_id, *also],
+                depth,
+                max_nodes=max_nodes,
+                max_edges=max_edges,
+                min_weight=min_weight,
+                strand=strand,
+                layer=layer,
+            )
+        )
+    except KeyError as exc:
+        logger.error("Start node %s not found", exc.args[0])
         raise HTTPException(status_code=404, detail='Start node not found')
-    return [NodeOut(id=n.id, payload=n.payload) for n in nodes]
+    return [NodeOut.from_node(n) for n in nodes]
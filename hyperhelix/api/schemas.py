@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..node import Node
+
 
 class NodeIn(BaseModel):
     """Incoming node data."""
 
     id: str
     payload: dict | None = None
+    layer: int = 0
+    strand: str = "default"
 
 
 class NodeOut(BaseModel):
@@ -16,6 +23,19 @@ class NodeOut(BaseModel):
 
     id: str
     payload: dict | None = None
+    layer: int = 0
+    strand: str = "default"
+
+    @classmethod
+    def from_node(cls, node: "Node") -> "NodeOut":
+        return cls(id=node.id, payload=node.payload, layer=node.layer, strand=node.strand)
+
+
+class RankedNodeOut(NodeOut):
+    """Node returned from the importance ranking."""
+
+    importance: float
+    rank: int
 
 
 class EdgeIn(BaseModel):
@@ -54,3 +74,9 @@ class StatusOut(BaseModel):
     status: str
 
 
+class PathOut(BaseModel):
+    """Shortest path between two nodes."""
+
+    path: list[str]
+    cost: float | None = None
+    expanded: int
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RWLock:
+    """Writer-preferring readers-writer lock.
+
+    Any number of threads may hold the read side at once; the write side
+    is exclusive. Both sides are reentrant, and the thread holding the
+    write side may also take the read side. Upgrading a held read lock to
+    a write lock is refused because two upgrading readers would deadlock.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def acquire_read(self) -> None:
+        local = self._local
+        reads = getattr(local, "reads", 0)
+        if reads or self._writer == threading.get_ident():
+            if not reads:
+                local.counted = False
+            local.reads = reads + 1
+            return
+        with self._cond:
+            while self._writer is not None or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        local.reads = 1
+        local.counted = True
+
+    def release_read(self) -> None:
+        local = self._local
+        local.reads -= 1
+        if local.reads or not local.counted:
+            return
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        if self._writer == me:
+            self._writer_depth += 1
+            return
+        if getattr(self._local, "reads", 0):
+            logger.error("Attempted to upgrade a read lock to a write lock")
+            raise RuntimeError("cannot acquire write lock while holding a read lock")
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        self._writer_depth -= 1
+        if self._writer_depth:
+            return
+        with self._cond:
+            self._writer = None
+            if getattr(self._local, "reads", 0):
+                # Reads taken inside the write section now count as a reader.
+                self._readers += 1
+                self._local.counted = True
+            self._cond.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
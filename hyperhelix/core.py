@@ -1,49 +1,335 @@
 from __future__ import annotations
 
-from collections import deque
-from heapq import heappop, heappush
-from typing import Callable, Dict, Generator, List
+import sys
+import threading
+from contextlib import AbstractContextManager, contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Callable, Dict, Generator, Iterable, Iterator, List, Mapping, Sequence, Set, Tuple, TypeVar
 
 import logging
 
 from .node import Node
 from .edge import connect
+from .concurrency import RWLock
+from .execution.dispatcher import INSERT, UPDATE
+from .indexes import ComponentIndex, LayerIndex, RankIndex, TagIndex
+from . import pathfinding, traversal
 from .persistence.base_adapter import BaseAdapter
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .analytics.centrality import CentralityEngine
+    from .csr import CSRGraph
+    from .distance_oracle import DistanceOracle
+    from .pathfinding import Heuristic, PathResult
+    from .snapshot import GraphSnapshot
+    from .subgraph import SubgraphView
+    from .persistence.journal import Journal
+    from .execution.dispatcher import HookDispatcher
+    from .execution.hook_metrics import HookMetrics
+
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable)
+
+
+def _writes(method: F) -> F:
+    @wraps(method)
+    def wrapper(self: "HyperHelix", *args, **kwargs):
+        with self._lock.write():
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _reads(method: F) -> F:
+    @wraps(method)
+    def wrapper(self: "HyperHelix", *args, **kwargs):
+        with self._lock.read():
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class HyperHelix:
-    def __init__(self, adapter: "BaseAdapter" | None = None) -> None:
+    """Graph of :class:`Node` objects joined by symmetric weighted edges.
+
+    Mutations take the write side of a readers-writer lock and queries take
+    the read side, so the graph can be shared by API worker threads. Code
+    that iterates ``nodes`` directly should hold :meth:`read_lock`.
+    """
+
+    def __init__(
+        self,
+        adapter: "BaseAdapter" | None = None,
+        journal: "Journal" | None = None,
+        dispatcher: "HookDispatcher" | None = None,
+    ) -> None:
         self.nodes: Dict[str, Node] = {}
         self._insert_hooks: List[Callable[[HyperHelix, str], None]] = []
         self._update_hooks: List[Callable[[HyperHelix, str], None]] = []
+        self._batch_hooks: Dict[Callable, Callable[[HyperHelix, List[str]], None]] = {}
+        self._edge_hooks: List[Callable[[HyperHelix, str, str, float | None], None]] = []
+        self._remove_hooks: List[Callable[[HyperHelix, str], None]] = []
+        # Hook timing is off unless enable_hook_metrics() is called.
+        self.hook_metrics: "HookMetrics" | None = None
+        # Path caching is off unless enable_distance_oracle() is called.
+        self.distance_oracle: "DistanceOracle" | None = None
+        # Set by CentralityEngine.update(); the insert and update hooks then
+        # leave importance to it instead of writing degree scores.
+        self.importance_engine: "CentralityEngine" | None = None
         self.adapter = adapter
+        self._tags = TagIndex()
+        # Strands reuse the inverted index with one "tag" per node.
+        self._strands = TagIndex()
+        self._layers = LayerIndex()
+        # Built on the first ranking query and maintained from then on.
+        # Importance is written by the evolution engines while they hold the
+        # read lock, so the ranking has its own mutex.
+        self._importance: RankIndex | None = None
+        self._importance_mutex = threading.Lock()
+        # Connected components, built on the first connectivity query and
+        # maintained under the write lock from then on.
+        self._components: ComponentIndex | None = None
+        self._components_mutex = threading.Lock()
+        self._batch_depth = 0
+        self._pending_inserts: Dict[str, None] = {}
+        self._pending_edges: List[Tuple[str, str, float]] = []
+        self.version = 0
+        self._csr: "CSRGraph" | None = None
+        # Node ids whose edges changed since the last freeze; ``None`` forces
+        # a full rebuild.
+        self._csr_dirty: Set[str] | None = None
+        self._csr_mutex = threading.Lock()
+        self._snapshot: "GraphSnapshot" | None = None
+        # Node ids changed since the last snapshot, in order; ``None`` forces
+        # every node to be copied again.
+        self._snapshot_dirty: Dict[str, None] | None = None
+        self._snapshot_mutex = threading.Lock()
+        self._lock = RWLock()
 
         # Register default evolution hook
         try:
             from .evolution import evented_engine
 
-            self.register_insert_hook(evented_engine.on_insert)
+            self.register_insert_hook(
+                evented_engine.on_insert, batch_hook=evented_engine.on_insert_batch
+            )
         except Exception:  # pragma: no cover - optional imports
             logger.exception("Failed to register default hooks")
 
-    def register_insert_hook(self, hook: Callable[["HyperHelix", str], None]) -> None:
-        """Register a callback for node insertion events."""
+        # Replay before attaching so restored state is not journaled again.
+        self.journal: "Journal" | None = None
+        if journal is not None:
+            journal.replay(self)
+            self.journal = journal
+
+        # Without a dispatcher, insert and update hooks run inline.
+        self.dispatcher = dispatcher
+        if dispatcher is not None:
+            dispatcher.start(self._handle_hook_event)
+
+    def register_insert_hook(
+        self,
+        hook: Callable[["HyperHelix", str], None],
+        batch_hook: Callable[["HyperHelix", List[str]], None] | None = None,
+    ) -> None:
+        """Register a callback for node insertion events.
+
+        ``batch_hook`` is called once with every inserted id when a
+        :meth:`batch` commits; without it ``hook`` runs once per id.
+        """
         self._insert_hooks.append(hook)
+        if batch_hook is not None:
+            self._batch_hooks[hook] = batch_hook
 
     def register_update_hook(self, hook: Callable[["HyperHelix", str], None]) -> None:
         """Register a callback for node updates."""
         self._update_hooks.append(hook)
 
+    def register_edge_hook(self, hook: Callable[["HyperHelix", str, str, float | None], None]) -> None:
+        """Register a callback for edge changes.
+
+        The hook receives the endpoints and the new weight, or ``None`` when
+        the edge was removed, including edges dropped with a removed or
+        replaced node.
+        """
+        self._edge_hooks.append(hook)
+
+    def register_remove_hook(self, hook: Callable[["HyperHelix", str], None]) -> None:
+        """Register a callback invoked after a node has been removed."""
+        self._remove_hooks.append(hook)
+
+    def unregister_hook(self, hook: Callable) -> None:
+        """Remove ``hook`` from every hook list it was registered on."""
+        # Rebuilt rather than edited so hooks being fired are not disturbed.
+        self._insert_hooks = [h for h in self._insert_hooks if h != hook]
+        self._update_hooks = [h for h in self._update_hooks if h != hook]
+        self._edge_hooks = [h for h in self._edge_hooks if h != hook]
+        self._remove_hooks = [h for h in self._remove_hooks if h != hook]
+        self._batch_hooks = {k: v for k, v in self._batch_hooks.items() if k != hook}
+
+    def read_lock(self) -> AbstractContextManager[None]:
+        """Hold the shared read lock while iterating the graph."""
+        return self._lock.read()
+
+    def write_lock(self) -> AbstractContextManager[None]:
+        """Hold the exclusive write lock for a compound mutation."""
+        return self._lock.write()
+
+    @_writes
     def add_node(self, node: Node) -> None:
         logger.debug("Adding node %s", node.id)
+        if self.journal is not None:
+            self.journal.log_node(node)
+        previous = self.nodes.get(node.id)
+        dropped: List[str] = []
+        if previous is not None and previous is not node:
+            # Replacing a node drops its old edges so neighbours stay symmetric.
+            self._unindex(previous)
+            # A copy, since a self-loop is dropped from ``previous.edges`` too.
+            for neighbor_id in list(previous.edges):
+                neighbor = self.nodes.get(neighbor_id)
+                if neighbor is not None and neighbor.edges.pop(node.id, None) is not None:
+                    dropped.append(neighbor_id)
+                    self._mark_dirty(neighbor_id)
         self.nodes[node.id] = node
+        self._index(node)
+        self.version += 1
+        self._mark_dirty(node.id)
+        for neighbor_id in dropped:
+            for hook in self._edge_hooks:
+                hook(self, node.id, neighbor_id, None)
+        if self._batch_depth:
+            self._pending_inserts[node.id] = None
+            return
         if self.adapter:
             self.adapter.save_node(node.id, node.payload)
+        self._fire_insert([node.id])
+
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        """Insert many nodes with hooks and adapter writes batched."""
+        with self.batch():
+            for node in nodes:
+                self.add_node(node)
+
+    def add_edges(self, edges: Iterable[Sequence]) -> None:
+        """Insert many ``(a, b)`` or ``(a, b, weight)`` edges in one batch."""
+        with self.batch():
+            for edge in edges:
+                self.add_edge(*edge)
+
+    @contextmanager
+    def batch(self) -> Iterator["HyperHelix"]:
+        """Buffer inserts and run hooks and adapter writes once on exit.
+
+        Nodes and edges are visible in the graph immediately; insert hooks
+        and persistence are deferred until the outermost batch exits. The
+        write lock is held for the duration of the batch.
+        """
+        with self._lock.write():
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._commit_batch()
+
+    def _commit_batch(self) -> None:
+        node_ids = [i for i in self._pending_inserts if i in self.nodes]
+        # Save the edges the graph still holds, once each, at their current
+        # weight; ones removed inside the batch are skipped.
+        latest: Dict[Tuple[str, str], Tuple[str, str, float]] = {}
+        for a, b, _ in self._pending_edges:
+            node = self.nodes.get(a)
+            if node is not None and b in node.edges:
+                latest.setdefault((a, b) if a <= b else (b, a), (a, b, node.edges[b]))
+        edges = list(latest.values())
+        self._pending_inserts = {}
+        self._pending_edges = []
+        logger.debug("Committing batch of %d nodes and %d edges", len(node_ids), len(edges))
+        if self.adapter:
+            if node_ids:
+                self.adapter.save_nodes([(i, self.nodes[i].payload) for i in node_ids])
+            if edges:
+                self.adapter.save_edges(edges)
+        if node_ids:
+            self._fire_insert(node_ids)
+
+    def notify_update(self, node_id: str) -> None:
+        """Run the update hooks for ``node_id``, or queue them on the dispatcher."""
+        if self.dispatcher is not None:
+            self.dispatcher.submit(UPDATE, [node_id])
+            return
+        with self._lock.write():
+            self._run_update_hooks([node_id])
+
+    def _fire_insert(self, node_ids: List[str]) -> None:
+        if self.dispatcher is not None:
+            self.dispatcher.submit(INSERT, node_ids)
+        else:
+            self._run_insert_hooks(node_ids)
+
+    def _handle_hook_event(self, kind: str, node_ids: List[str]) -> None:
+        # Dispatcher workers run hooks under the write lock, as inline hooks
+        # do, skipping nodes removed since the event was queued.
+        with self._lock.write():
+            node_ids = [i for i in node_ids if i in self.nodes]
+            if not node_ids:
+                return
+            if kind == INSERT:
+                self._run_insert_hooks(node_ids)
+            else:
+                self._run_update_hooks(node_ids)
+
+    def _run_insert_hooks(self, node_ids: List[str]) -> None:
+        metrics = self.hook_metrics
         for hook in self._insert_hooks:
-            hook(self, node.id)
+            batch_hook = self._batch_hooks.get(hook)
+            if batch_hook is not None and len(node_ids) > 1:
+                if metrics is None:
+                    batch_hook(self, node_ids)
+                else:
+                    metrics.call(INSERT, batch_hook, self, node_ids)
+            elif metrics is None:
+                for node_id in node_ids:
+                    hook(self, node_id)
+            else:
+                for node_id in node_ids:
+                    metrics.call(INSERT, hook, self, node_id)
+
+    def _run_update_hooks(self, node_ids: List[str]) -> None:
+        metrics = self.hook_metrics
+        for hook in self._update_hooks:
+            for node_id in node_ids:
+                if metrics is None:
+                    hook(self, node_id)
+                else:
+                    metrics.call(UPDATE, hook, self, node_id)
+
+    def enable_hook_metrics(self) -> "HookMetrics":
+        """Start timing every insert and update hook call; returns the collector."""
+        from .execution.hook_metrics import HookMetrics
+
+        if self.hook_metrics is None:
+            self.hook_metrics = HookMetrics()
+        return self.hook_metrics
+
+    def disable_hook_metrics(self) -> None:
+        self.hook_metrics = None
+
+    def enable_distance_oracle(self, **options) -> "DistanceOracle":
+        """Answer ``shortest_path`` from a :class:`DistanceOracle` cache; returns it.
+
+        ``options`` are passed to the oracle the first time.
+        """
+        from .distance_oracle import DistanceOracle
+
+        if self.distance_oracle is None:
+            self.distance_oracle = DistanceOracle(self, **options)
+        return self.distance_oracle
 
+    @_writes
     def add_edge(self, a: str, b: str, weight: float = 1.0) -> None:
         logger.debug("Adding edge %s <-> %s", a, b)
         try:
@@ -52,10 +338,21 @@ class HyperHelix:
         except KeyError as exc:  # pragma: no cover - run-time safeguard
             logger.error("Cannot add edge, node missing: %s", exc.args[0])
             raise
+        if self.journal is not None:
+            self.journal.log_edge(a, b, weight)
         connect(node_a, node_b, weight)
-        if self.adapter:
+        if self._components is not None:
+            self._components.union(a, b)
+        self.version += 1
+        self._mark_dirty(a, b)
+        if self._batch_depth:
+            self._pending_edges.append((a, b, weight))
+        elif self.adapter:
             self.adapter.save_edge(a, b, weight)
+        for hook in self._edge_hooks:
+            hook(self, a, b, weight)
 
+    @_writes
     def remove_edge(self, a: str, b: str) -> None:
         """Remove an edge between two nodes."""
         logger.debug("Removing edge %s <-> %s", a, b)
@@ -66,71 +363,516 @@ class HyperHelix:
         if b not in self.nodes[a].edges:
             logger.error("Edge %s <-> %s not found", a, b)
             raise KeyError(f"{a}-{b}")
+        if self.journal is not None:
+            self.journal.log_remove_edge(a, b)
         self.nodes[a].edges.pop(b)
-        self.nodes[b].edges.pop(a)
+        if a != b:
+            self.nodes[b].edges.pop(a)
+        if self._components is not None:
+            self._components.cut(a, b)
+        self.version += 1
+        self._mark_dirty(a, b)
         if self.adapter and hasattr(self.adapter, "remove_edge"):
             self.adapter.remove_edge(a, b)
+        for hook in self._edge_hooks:
+            hook(self, a, b, None)
 
+    @_writes
     def remove_node(self, node_id: str) -> None:
         """Remove a node and any edges referencing it."""
         logger.debug("Removing node %s", node_id)
         if node_id not in self.nodes:
             logger.error("Node %s not found", node_id)
             raise KeyError(node_id)
-        for other in self.nodes.values():
-            other.edges.pop(node_id, None)
-        del self.nodes[node_id]
+        if self.journal is not None:
+            self.journal.log_remove_nodes([node_id])
+        self._detach(node_id)
+        if self.adapter and hasattr(self.adapter, "remove_nodes"):
+            self.adapter.remove_nodes([node_id])
+
+    @_writes
+    def remove_nodes(self, node_ids: Iterable[str]) -> None:
+        """Remove several nodes, issuing a single adapter call.
+
+        All ids are validated before anything is removed.
+        """
+        ids = list(dict.fromkeys(node_ids))
+        logger.debug("Removing %d nodes", len(ids))
+        for node_id in ids:
+            if node_id not in self.nodes:
+                logger.error("Node %s not found", node_id)
+                raise KeyError(node_id)
+        if ids and self.journal is not None:
+            self.journal.log_remove_nodes(ids)
+        for node_id in ids:
+            self._detach(node_id)
+        if ids and self.adapter and hasattr(self.adapter, "remove_nodes"):
+            self.adapter.remove_nodes(ids)
+
+    def _detach(self, node_id: str) -> None:
+        # Edges are symmetric, so only the node's own neighbours hold
+        # references back to it.
+        node = self.nodes.pop(node_id)
+        dropped: List[str] = []
+        for neighbor_id in node.edges:
+            neighbor = self.nodes.get(neighbor_id)
+            if neighbor is not None:
+                neighbor.edges.pop(node_id, None)
+                dropped.append(neighbor_id)
+        self._unindex(node)
+        self.version += 1
+        self._csr_dirty = None
+        self._mark_changed(node_id, *node.edges)
+        # Edge hooks first, so neighbours whose degree dropped are reported
+        # before the node itself is.
+        for neighbor_id in dropped:
+            for hook in self._edge_hooks:
+                hook(self, node_id, neighbor_id, None)
+        for hook in self._remove_hooks:
+            hook(self, node_id)
+
+    @_writes
+    def add_tag(self, node_id: str, tag: str) -> None:
+        """Attach ``tag`` to a node and index it."""
+        node = self.nodes[node_id]
+        if self.journal is not None:
+            self.journal.log_tag(node_id, tag, True)
+        if tag not in node.tags:
+            node.tags.append(tag)
+        self._tags.add(node_id, [tag])
+        self.version += 1
+        self._mark_changed(node_id)
+
+    @_writes
+    def remove_tag(self, node_id: str, tag: str) -> None:
+        """Detach ``tag`` from a node and drop it from the index."""
+        node = self.nodes[node_id]
+        if tag not in node.tags:
+            logger.error("Node %s has no tag %s", node_id, tag)
+            raise KeyError(tag)
+        if self.journal is not None:
+            self.journal.log_tag(node_id, tag, False)
+        node.tags[:] = [t for t in node.tags if t != tag]
+        self._tags.discard(node_id, [tag])
+        self.version += 1
+        self._mark_changed(node_id)
+
+    @_writes
+    def set_layer(self, node_id: str, layer: int) -> None:
+        """Move a node to ``layer``; assigning ``node.layer`` directly bypasses the index."""
+        node = self._require(node_id)
+        if self.journal is not None:
+            self.journal.log_layer(node_id, layer)
+        self._layers.discard(node_id, node.layer)
+        node.layer = layer
+        self._layers.add(node_id, layer)
+        self.version += 1
+        self._mark_changed(node_id)
+
+    @_writes
+    def set_strand(self, node_id: str, strand: str) -> None:
+        """Move a node to ``strand``; assigning ``node.strand`` directly bypasses the index."""
+        node = self._require(node_id)
+        if self.journal is not None:
+            self.journal.log_strand(node_id, strand)
+        self._strands.discard(node_id, [node.strand])
+        node.strand = sys.intern(strand)
+        self._strands.add(node_id, [node.strand])
+        self.version += 1
+        self._mark_changed(node_id)
+
+    def _require(self, node_id: str) -> Node:
+        node = self.nodes.get(node_id)
+        if node is None:
+            logger.error("Node %s not found", node_id)
+            raise KeyError(node_id)
+        return node
 
+    def _index(self, node: Node) -> None:
+        self._tags.add(node.id, node.tags)
+        self._strands.add(node.id, [node.strand])
+        self._layers.add(node.id, node.layer)
+        if self._importance is not None:
+            with self._importance_mutex:
+                self._importance.set(node.id, node.metadata.importance)
+        if self._components is not None:
+            self._components.add(node.id)
+            for neighbor_id in node.edges:
+                if neighbor_id in self.nodes:
+                    self._components.union(node.id, neighbor_id)
+
+    def _unindex(self, node: Node) -> None:
+        self._tags.discard(node.id, node.tags)
+        self._strands.discard(node.id, [node.strand])
+        self._layers.discard(node.id, node.layer)
+        if self._importance is not None:
+            with self._importance_mutex:
+                self._importance.discard(node.id)
+        if self._components is not None:
+            self._components.discard(node.id, list(node.edges))
+
+    def set_importance(self, node_id: str, importance: float) -> None:
+        """Store a node's importance; assigning ``node.metadata.importance`` directly bypasses the ranking.
+
+        Not journaled. Safe to call while holding the read lock, as the
+        evolution engines do.
+        """
+        node = self._require(node_id)
+        with self._importance_mutex:
+            node.metadata.importance = importance
+            if self._importance is not None:
+                self._importance.set(node_id, importance)
+
+    def set_importances(self, scores: Iterable[Tuple[str, float]]) -> int:
+        """Store many importances at once, skipping unknown ids; returns how many were stored."""
+        nodes = self.nodes
+        known = [(node_id, score) for node_id, score in scores if node_id in nodes]
+        with self._importance_mutex:
+            for node_id, score in known:
+                nodes[node_id].metadata.importance = score
+            if self._importance is not None:
+                self._importance.update(known)
+        return len(known)
+
+    def _ranking(self) -> RankIndex:
+        # Callers hold ``_importance_mutex``.
+        if self._importance is None:
+            ranking = RankIndex()
+            ranking.update((n.id, n.metadata.importance) for n in self.nodes.values())
+            self._importance = ranking
+        return self._importance
+
+    @_writes
+    def _restore(self, nodes: Dict[str, Node]) -> None:
+        """Replace the graph's contents without running hooks or journaling."""
+        self.nodes.clear()
+        self.nodes.update(nodes)
+        self._tags = TagIndex()
+        self._strands = TagIndex()
+        self._layers = LayerIndex()
+        self._importance = None
+        self._components = None
+        for node in nodes.values():
+            self._index(node)
+        self.version += 1
+        self._csr_dirty = None
+        self._snapshot_dirty = None
+
+    @_writes
+    def touch(self, *node_ids: str) -> None:
+        """Record a mutation made directly on node objects.
+
+        Pass the ids of every node whose edges or fields changed, both ends
+        of an edge, to invalidate only their cached state; without ids every
+        cache is dropped. Such mutations are not journaled.
+        """
+        self.version += 1
+        if node_ids:
+            self._mark_dirty(*node_ids)
+            if self._components is not None:
+                self._components.recheck(node_ids)
+            return
+        self._components = None
+        self._csr_dirty = None
+        self._snapshot_dirty = None
+
+    def _mark_dirty(self, *node_ids: str) -> None:
+        if self._csr_dirty is not None:
+            self._csr_dirty.update(node_ids)
+        self._mark_changed(*node_ids)
+
+    def _mark_changed(self, *node_ids: str) -> None:
+        if self._snapshot_dirty is not None:
+            for node_id in node_ids:
+                self._snapshot_dirty[node_id] = None
+
+    def snapshot(self) -> "GraphSnapshot":
+        """Return a consistent, read-only view of the graph at ``version``.
+
+        Only nodes changed since the previous snapshot are copied; the rest
+        are shared with it, so taking a snapshot costs one dict copy plus
+        the changed nodes. Reading the snapshot needs no lock.
+        """
+        from .snapshot import GraphSnapshot, copy_node
+
+        with self._lock.read(), self._snapshot_mutex:
+            previous = self._snapshot
+            if previous is not None and previous.version == self.version:
+                return previous
+            dirty = self._snapshot_dirty
+            if previous is None or dirty is None or len(dirty) * 2 > len(self.nodes):
+                nodes = {node_id: copy_node(node) for node_id, node in self.nodes.items()}
+                copied = len(nodes)
+            else:
+                nodes = previous._nodes.copy()
+                for node_id in dirty:
+                    node = self.nodes.get(node_id)
+                    if node is None:
+                        nodes.pop(node_id, None)
+                    else:
+                        nodes[node_id] = copy_node(node)
+                copied = len(dirty)
+            self._snapshot = GraphSnapshot(nodes, self.version)
+            self._snapshot_dirty = {}
+            logger.debug("Snapshot at version %d copied %d nodes", self.version, copied)
+            return self._snapshot
+
+    def freeze(self) -> "CSRGraph":
+        """Return an immutable CSR snapshot of the graph.
+
+        The snapshot is cached; after edge changes or inserts only the
+        touched rows are rebuilt, while node removals and :meth:`touch`
+        trigger a full rebuild.
+        """
+        from .csr import CSRGraph
+
+        with self._lock.read(), self._csr_mutex:
+            if (
+                self._csr is None
+                or self._csr_dirty is None
+                or len(self._csr_dirty) * 2 > len(self.nodes)
+            ):
+                self._csr = CSRGraph.from_graph(self)
+            elif self._csr_dirty:
+                self._csr = self._csr.patched(self, self._csr_dirty)
+            self._csr_dirty = set()
+            return self._csr
+
+    @_reads
     def find_nodes_by_tag(self, tag: str) -> list[Node]:
         """Return all nodes containing the given tag."""
         logger.debug("Searching nodes with tag %s", tag)
-        return [n for n in self.nodes.values() if tag in n.tags]
-
-    def spiral_walk(self, start_id: str, depth: int = 1) -> Generator[Node, None, None]:
-        logger.debug("Spiral walk from %s depth %d", start_id, depth)
-        if start_id not in self.nodes:
-            logger.error("Start node %s not found", start_id)
-            raise KeyError(start_id)
-        visited = set()
-        queue = deque([(start_id, 0)])
-        while queue:
-            current_id, level = queue.popleft()
-            if current_id in visited or level > depth:
-                continue
-            visited.add(current_id)
-            node = self.nodes[current_id]
-            yield node
-            for neighbor_id in node.edges:
-                queue.append((neighbor_id, level + 1))
+        return [self.nodes[i] for i in self._tags.ids(tag)]
+
+    @_reads
+    def recent_nodes_by_tag(self, tag: str, limit: int) -> list[Node]:
+        """Return up to ``limit`` nodes most recently given ``tag``, newest first."""
+        return [self.nodes[i] for i in self._tags.recent(tag, limit)]
+
+    @_reads
+    def find_nodes_by_tags(self, tags: Iterable[str], match_all: bool = True) -> list[Node]:
+        """Return nodes carrying all of ``tags`` (or any of them when ``match_all`` is false)."""
+        tags = list(tags)
+        logger.debug("Searching nodes with tags %s match_all=%s", tags, match_all)
+        return [self.nodes[i] for i in self._tags.match(tags, match_all)]
+
+    @_reads
+    def top_nodes_by_importance(self, k: int) -> list[Node]:
+        """Return the ``k`` most important nodes, highest first, ties by id."""
+        with self._importance_mutex:
+            ranked = self._ranking().top(k)
+        return [self.nodes[i] for i, _ in ranked]
+
+    @_reads
+    def importance_rank(self, node_id: str) -> int:
+        """Return the zero-based position of ``node_id`` in the importance ranking."""
+        self._require(node_id)
+        with self._importance_mutex:
+            return self._ranking().rank(node_id)
+
+    @_reads
+    def nodes_above_importance(self, threshold: float, limit: int | None = None) -> list[Node]:
+        """Return nodes with importance at least ``threshold``, highest first."""
+        with self._importance_mutex:
+            ranked = self._ranking().at_least(threshold, limit)
+        return [self.nodes[i] for i, _ in ranked]
+
+    @_reads
+    def count_above_importance(self, threshold: float) -> int:
+        """Return how many nodes have importance at least ``threshold``."""
+        with self._importance_mutex:
+            return self._ranking().count_at_least(threshold)
 
-    def shortest_path(self, start_id: str, end_id: str) -> List[str]:
-        """Return the shortest weighted path between two nodes."""
+    @_reads
+    def connected(self, a: str, b: str) -> bool:
+        """Return whether any path joins ``a`` and ``b``.
+
+        Answered from connected components maintained as edges change,
+        without searching the graph.
+        """
+        self._require(a)
+        self._require(b)
+        return self._connected(a, b)
+
+    @_reads
+    def component(self, node_id: str) -> list[Node]:
+        """Return the nodes reachable from ``node_id``, itself included."""
+        self._require(node_id)
+        return [self.nodes[i] for i in self._connectivity().component(node_id)]
+
+    @_reads
+    def component_sizes(self) -> List[int]:
+        """Return the size of every connected component, largest first."""
+        return self._connectivity().sizes()
+
+    def _connected(self, a: str, b: str) -> bool:
+        return self._connectivity().connected(a, b)
+
+    def _connectivity(self) -> ComponentIndex:
+        components = self._components
+        if components is None:
+            with self._components_mutex:
+                if self._components is None:
+                    nodes = self.nodes
+                    self._components = ComponentIndex.build(nodes, lambda node_id: nodes[node_id].edges)
+                components = self._components
+        return components
+
+    @_reads
+    def find_nodes(
+        self,
+        strand: str | None = None,
+        layer_min: int | None = None,
+        layer_max: int | None = None,
+    ) -> list[Node]:
+        """Return nodes on ``strand`` whose layer lies within the inclusive bounds.
+
+        Answered from the strand hash index and the sorted layer index;
+        omitted filters match everything.
+        """
+        logger.debug("Searching nodes strand=%s layers=%s..%s", strand, layer_min, layer_max)
+        if strand is None:
+            return [self.nodes[i] for i in self._layers.range(layer_min, layer_max)]
+        nodes = (self.nodes[i] for i in self._strands.ids(strand))
+        if layer_min is None and layer_max is None:
+            return list(nodes)
+        low = float("-inf") if layer_min is None else layer_min
+        high = float("inf") if layer_max is None else layer_max
+        return [n for n in nodes if low <= n.layer <= high]
+
+    @_reads
+    def group_by_strand(self) -> Dict[str, list[Node]]:
+        """Return nodes grouped by strand."""
+        return {s: [self.nodes[i] for i in self._strands.ids(s)] for s in self._strands}
+
+    @_reads
+    def group_by_layer(self) -> Dict[int, list[Node]]:
+        """Return nodes grouped by layer, in ascending layer order."""
+        return {
+            layer: [self.nodes[i] for i in self._layers.ids(layer)]
+            for layer in self._layers.layers()
+        }
+
+    def subgraph(self, node_ids: Iterable[str]) -> "SubgraphView":
+        """Return a zero-copy view of the subgraph induced by ``node_ids``."""
+        from .subgraph import SubgraphView
+
+        return SubgraphView(self, node_ids)
+
+    def neighborhood(
+        self, start_id: str | Iterable[str], depth: int = 1, max_nodes: int | None = None
+    ) -> "SubgraphView":
+        """Return the view induced by the nodes within ``depth`` hops of the start nodes."""
+        return self.subgraph(n.id for n in self.spiral_walk(start_id, depth, max_nodes=max_nodes))
+
+    def spiral_walk(
+        self,
+        start_id: str | Iterable[str],
+        depth: int = 1,
+        *,
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
+        min_weight: float | None = None,
+        strand: str | None = None,
+        layer: int | None = None,
+        priority: Mapping[str, float] | None = None,
+    ) -> Generator[Node, None, None]:
+        """Lazily yield nodes within ``depth`` hops of one or more start nodes.
+
+        ``max_nodes`` and ``max_edges`` bound the work done, ``min_weight``
+        skips light edges and ``strand``/``layer`` restrict which
+        neighbours are visited. Neighbours with higher ``priority`` scores
+        (for example betweenness) are visited first. The read lock is taken
+        per step rather than for the whole walk, so consumers may mutate the
+        graph in between.
+        """
+        starts = [start_id] if isinstance(start_id, str) else list(start_id)
+        logger.debug("Spiral walk from %s depth %d", starts, depth)
+        lock = self._lock
+        nodes = self.nodes
+        with lock.read():
+            for start in starts:
+                if start not in nodes:
+                    logger.error("Start node %s not found", start)
+                    raise KeyError(start)
+
+        def adjacency(node_id: str) -> Dict[str, float]:
+            with lock.read():
+                node = nodes.get(node_id)
+                return dict(node.edges) if node is not None else {}
+
+        strands = self._strands
+        layers = self._layers
+
+        def accept(node_id: str) -> bool:
+            # Strand and layer filters are index lookups, not node reads.
+            if strand is not None:
+                return node_id in strands.ids(strand) and (
+                    layer is None or node_id in layers.ids(layer)
+                )
+            if layer is not None:
+                return node_id in layers.ids(layer)
+            return node_id in nodes
+
+        for node_id, _ in traversal.walk(
+            adjacency,
+            starts,
+            depth,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+            min_weight=min_weight,
+            accept=accept,
+            priority=(lambda node_id: priority.get(node_id, 0.0)) if priority is not None else None,
+        ):
+            node = nodes.get(node_id)
+            if node is not None:
+                yield node
+
+    def shortest_path(
+        self,
+        start_id: str,
+        end_id: str,
+        method: str = "dijkstra",
+        heuristic: "Heuristic" | None = None,
+    ) -> List[str]:
+        """Return the shortest weighted path between two nodes.
+
+        ``method`` is ``"dijkstra"``, ``"bidirectional"`` or ``"astar"``;
+        A* uses ``heuristic(node_id, end_id)`` as its distance estimate.
+        Nodes in different components return ``[]`` without searching.
+        Once :meth:`enable_distance_oracle` has been called, searches without
+        a heuristic are answered from the oracle's cache.
+        """
+        return self.find_path(start_id, end_id, method, heuristic).path
+
+    @_reads
+    def find_path(
+        self,
+        start_id: str,
+        end_id: str,
+        method: str = "dijkstra",
+        heuristic: "Heuristic" | None = None,
+        cached: bool = True,
+    ) -> "PathResult":
+        """Like :meth:`shortest_path` but also report cost and nodes expanded.
+
+        ``cached=False`` bypasses the distance oracle.
+        """
         logger.debug("Shortest path %s -> %s", start_id, end_id)
         if start_id not in self.nodes or end_id not in self.nodes:
             logger.error("Start or end node missing: %s %s", start_id, end_id)
             raise KeyError(start_id if start_id not in self.nodes else end_id)
-
-        distances: Dict[str, float] = {start_id: 0.0}
-        prev: Dict[str, str | None] = {start_id: None}
-        queue: List[tuple[float, str]] = [(0.0, start_id)]
-
-        while queue:
-            dist, current = heappop(queue)
-            if current == end_id:
-                break
-            for neighbor, weight in self.nodes[current].edges.items():
-                new_dist = dist + weight
-                if neighbor not in distances or new_dist < distances[neighbor]:
-                    distances[neighbor] = new_dist
-                    prev[neighbor] = current
-                    heappush(queue, (new_dist, neighbor))
-
-        if end_id not in prev:
-            return []
-
-        path = []
-        node = end_id
-        while node is not None:
-            path.append(node)
-            node = prev.get(node)
-        return list(reversed(path))
+        # Unknown methods fall through so ``search`` reports them.
+        if (
+            start_id != end_id
+            and method in pathfinding.METHODS
+            and not self._connected(start_id, end_id)
+        ):
+            logger.debug("No path: %s and %s are in different components", start_id, end_id)
+            return pathfinding.PathResult()
+        oracle = self.distance_oracle
+        if cached and oracle is not None and heuristic is None and method in pathfinding.METHODS:
+            return oracle.find_path(start_id, end_id)
+        return pathfinding.search(
+            lambda node_id: self.nodes[node_id].edges, start_id, end_id, method, heuristic
+        )
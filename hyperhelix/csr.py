@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from collections import deque
+from heapq import heappop, heappush
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Tuple
+
+import logging
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .core import HyperHelix
+
+logger = logging.getLogger(__name__)
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+class CSRGraph:
+    """Immutable compressed-sparse-row snapshot of a :class:`HyperHelix`.
+
+    Node ``i`` has string id ``ids[i]`` and its neighbours are
+    ``neighbors[offsets[i]:offsets[i + 1]]`` with matching ``weights``.
+    Every undirected edge appears once in each direction.
+    """
+
+    __slots__ = ("ids", "index", "offsets", "neighbors", "weights", "version", "_index")
+
+    def __init__(
+        self,
+        ids: Tuple[str, ...],
+        offsets: np.ndarray,
+        neighbors: np.ndarray,
+        weights: np.ndarray,
+        version: int = 0,
+        index: Dict[str, int] | None = None,
+    ) -> None:
+        self.ids = ids
+        self._index = index if index is not None else {node_id: i for i, node_id in enumerate(ids)}
+        self.index: Mapping[str, int] = MappingProxyType(self._index)
+        self.offsets = _frozen(offsets)
+        self.neighbors = _frozen(neighbors)
+        self.weights = _frozen(weights)
+        self.version = version
+
+    @classmethod
+    def from_graph(cls, graph: "HyperHelix") -> "CSRGraph":
+        """Build a snapshot of ``graph``; edges to missing nodes are dropped."""
+        nodes = list(graph.nodes.values())
+        ids = tuple(node.id for node in nodes)
+        index: Dict[str, int] = {node_id: i for i, node_id in enumerate(ids)}
+        total = sum(len(node.edges) for node in nodes)
+        degrees = np.fromiter((len(node.edges) for node in nodes), dtype=np.int64, count=len(nodes))
+        neighbors = np.fromiter(
+            (index.get(k, -1) for k in chain.from_iterable(node.edges for node in nodes)),
+            dtype=np.int64,
+            count=total,
+        )
+        weights = np.fromiter(
+            chain.from_iterable(node.edges.values() for node in nodes), dtype=np.float64, count=total
+        )
+        valid = neighbors >= 0
+        if not valid.all():
+            rows = np.repeat(np.arange(len(nodes)), degrees)
+            degrees = np.bincount(rows[valid], minlength=len(nodes))
+            neighbors = neighbors[valid]
+            weights = weights[valid]
+        offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        logger.debug("Built CSR snapshot with %d nodes and %d edges", len(nodes), len(neighbors))
+        return cls(ids, offsets, neighbors, weights, getattr(graph, "version", 0), index)
+
+    def patched(self, graph: "HyperHelix", dirty: Iterable[str]) -> "CSRGraph":
+        """Return a new snapshot with only the ``dirty`` rows rebuilt.
+
+        Valid when nodes have only been added (appended) since this snapshot
+        was taken; clean rows are copied with vectorised array operations.
+        """
+        nodes = graph.nodes
+        old_n = self.num_nodes
+        ids = self.ids + tuple(list(nodes)[old_n:])
+        index = self._index.copy()
+        for i in range(old_n, len(ids)):
+            index[ids[i]] = i
+        n = len(ids)
+        dirty_rows = np.array(sorted(index[k] for k in dirty if k in index), dtype=np.int64)
+
+        row_nbrs: List[int] = []
+        row_wts: List[float] = []
+        row_deg: List[int] = []
+        for r in dirty_rows.tolist():
+            edges = nodes[ids[r]].edges
+            count = 0
+            for key, weight in edges.items():
+                j = index.get(key)
+                if j is not None:
+                    row_nbrs.append(j)
+                    row_wts.append(weight)
+                    count += 1
+            row_deg.append(count)
+
+        degrees = np.zeros(n, dtype=np.int64)
+        degrees[:old_n] = self.degree()
+        degrees[dirty_rows] = row_deg
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        neighbors = np.empty(offsets[-1], dtype=np.int64)
+        weights = np.empty(offsets[-1], dtype=np.float64)
+
+        is_dirty = np.zeros(old_n, dtype=bool)
+        is_dirty[dirty_rows[dirty_rows < old_n]] = True
+        old_rows = self.rows()
+        keep = ~is_dirty[old_rows]
+        kept_rows = old_rows[keep]
+        pos = offsets[kept_rows] + (np.flatnonzero(keep) - self.offsets[kept_rows])
+        neighbors[pos] = self.neighbors[keep]
+        weights[pos] = self.weights[keep]
+
+        if len(dirty_rows):
+            deg = np.asarray(row_deg, dtype=np.int64)
+            rep = np.repeat(dirty_rows, deg)
+            starts = np.repeat(np.cumsum(deg) - deg, deg)
+            pos = offsets[rep] + (np.arange(len(row_nbrs)) - starts)
+            neighbors[pos] = row_nbrs
+            weights[pos] = row_wts
+        logger.debug("Patched CSR snapshot: %d dirty rows of %d", len(dirty_rows), n)
+        return CSRGraph(ids, offsets, neighbors, weights, getattr(graph, "version", 0), index)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges."""
+        return len(self.neighbors) // 2
+
+    def degree(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def weighted_degree(self) -> np.ndarray:
+        return np.bincount(self.rows(), weights=self.weights, minlength=self.num_nodes)
+
+    def rows(self) -> np.ndarray:
+        """Source index of every stored edge, aligned with ``neighbors``."""
+        return np.repeat(np.arange(self.num_nodes), self.degree())
+
+    def neighbors_of(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.neighbors[start:end], self.weights[start:end]
+
+    def spiral_walk(self, start_id: str, depth: int = 1) -> List[str]:
+        """Breadth-first ids reachable from ``start_id`` within ``depth`` hops."""
+        if start_id not in self.index:
+            logger.error("Start node %s not found", start_id)
+            raise KeyError(start_id)
+        start = self.index[start_id]
+        seen = np.zeros(self.num_nodes, dtype=bool)
+        seen[start] = True
+        order = [start]
+        queue = deque([(start, 0)])
+        while queue:
+            current, level = queue.popleft()
+            if level >= depth:
+                continue
+            nbrs = self.neighbors[self.offsets[current]:self.offsets[current + 1]]
+            fresh = nbrs[~seen[nbrs]]
+            if len(fresh):
+                fresh = np.unique(fresh)
+                seen[fresh] = True
+                order.extend(fresh.tolist())
+                queue.extend((int(i), level + 1) for i in fresh)
+        return [self.ids[i] for i in order]
+
+    def shortest_path(self, start_id: str, end_id: str) -> List[str]:
+        """Return the shortest weighted path between two ids."""
+        if start_id not in self.index or end_id not in self.index:
+            logger.error("Start or end node missing: %s %s", start_id, end_id)
+            raise KeyError(start_id if start_id not in self.index else end_id)
+        start, end = self.index[start_id], self.index[end_id]
+        offsets = self.offsets.tolist()
+        neighbors = self.neighbors
+        weights = self.weights
+        dist = {start: 0.0}
+        prev = {start: -1}
+        queue: List[Tuple[float, int]] = [(0.0, start)]
+        done = set()
+        while queue:
+            d, current = heappop(queue)
+            if current in done:
+                continue
+            done.add(current)
+            if current == end:
+                break
+            lo, hi = offsets[current], offsets[current + 1]
+            for nbr, w in zip(neighbors[lo:hi].tolist(), weights[lo:hi].tolist()):
+                nd = d + w
+                if nd < dist.get(nbr, float("inf")):
+                    dist[nbr] = nd
+                    prev[nbr] = current
+                    heappush(queue, (nd, nbr))
+        if end not in prev:
+            return []
+        path = []
+        node = end
+        while node != -1:
+            path.append(self.ids[node])
+            node = prev[node]
+        return path[::-1]
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+import logging
+
+from .pathfinding import PathResult
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .core import HyperHelix
+
+logger = logging.getLogger(__name__)
+
+INF = float("inf")
+
+
+@dataclass
+class OracleStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    landmark_builds: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class DistanceOracle:
+    """Cached shortest paths with ALT landmark lower bounds.
+
+    Recent results live in an LRU keyed by the unordered endpoint pair.
+    Landmark distance tables give an admissible A* heuristic and let
+    :meth:`HyperHelix.add_edge` keep cached paths that the new edge cannot
+    shorten. Removing an edge or node only drops the paths that used it.
+
+    The tables stay valid lower bounds as the graph changes: removals and
+    heavier edges only lengthen paths, and a new or lighter edge lowers
+    the table values reachable through it (see :meth:`_repair`). They are
+    rebuilt only when missing, lazily after ``refresh_after`` misses, or
+    on :meth:`refresh_landmarks`; until then searches fall back to
+    bidirectional Dijkstra. The oracle is safe to share between threads;
+    results computed while the graph changed underneath are not cached.
+    :meth:`HyperHelix.enable_distance_oracle` routes the graph's own
+    ``shortest_path`` through one.
+    """
+
+    def __init__(
+        self,
+        graph: "HyperHelix",
+        landmarks: int = 4,
+        cache_size: int = 1024,
+        refresh_after: int = 32,
+    ) -> None:
+        self.graph = graph
+        self.num_landmarks = landmarks
+        self.cache_size = cache_size
+        self.refresh_after = refresh_after
+        self._cache: "OrderedDict[Tuple[str, str], PathResult]" = OrderedDict()
+        self._by_node: Dict[str, Set[Tuple[str, str]]] = {}
+        self._landmarks: List[str] = []
+        self._tables: List[Dict[str, float]] = []
+        self._stale = True
+        self._stale_misses = refresh_after
+        self._stats = OracleStats()
+        self._mutex = threading.Lock()
+        graph.register_edge_hook(self._on_edge)
+        graph.register_remove_hook(self._on_remove)
+
+    # queries -----------------------------------------------------------
+    def shortest_path(self, start_id: str, end_id: str) -> List[str]:
+        return self.find_path(start_id, end_id).path
+
+    def find_path(self, start_id: str, end_id: str) -> PathResult:
+        """Return a cached or freshly computed shortest path."""
+        key = (start_id, end_id) if start_id <= end_id else (end_id, start_id)
+        with self._mutex:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self._stats.hits += 1
+                return self._oriented(result, start_id)
+            self._stats.misses += 1
+            refresh = False
+            if self._stale:
+                self._stale_misses += 1
+                refresh = self._stale_misses >= self.refresh_after
+        if refresh:
+            self.refresh_landmarks()
+        version = self.graph.version
+        if self._stale:
+            result = self.graph.find_path(start_id, end_id, "bidirectional", cached=False)
+        else:
+            result = self.graph.find_path(start_id, end_id, "astar", self.lower_bound, cached=False)
+        with self._mutex:
+            if self.graph.version == version:
+                self._store(key, self._oriented(result, key[0]))
+        return result
+
+    def lower_bound(self, a: str, b: str) -> float:
+        """Admissible distance estimate from the landmark tables."""
+        if self._stale:
+            return 0.0
+        best = 0.0
+        for table in self._tables:
+            da = table.get(a)
+            db = table.get(b)
+            if da is not None and db is not None:
+                diff = abs(da - db)
+                if diff > best:
+                    best = diff
+            elif (da is None) != (db is None):
+                return INF
+        return best
+
+    def stats(self) -> OracleStats:
+        with self._mutex:
+            self._stats.size = len(self._cache)
+            return OracleStats(**vars(self._stats))
+
+    def clear(self) -> None:
+        with self._mutex:
+            self._cache.clear()
+            self._by_node.clear()
+
+    # landmarks ---------------------------------------------------------
+    def refresh_landmarks(self) -> None:
+        """Pick landmarks by farthest-point sampling and rebuild their tables."""
+        landmarks: List[str] = []
+        tables: List[Dict[str, float]] = []
+        with self.graph.read_lock():
+            version = self.graph.version
+            nodes = self.graph.nodes
+            if nodes:
+                current = max(nodes, key=lambda n: len(nodes[n].edges))
+                closest: Dict[str, float] = {}
+                for _ in range(min(self.num_landmarks, len(nodes))):
+                    table = _distances_from(self.graph, current)
+                    landmarks.append(current)
+                    tables.append(table)
+                    for node_id, dist in table.items():
+                        if dist < closest.get(node_id, INF):
+                            closest[node_id] = dist
+                    candidates = [n for n in closest if n not in landmarks]
+                    if not candidates:
+                        break
+                    current = max(candidates, key=closest.__getitem__)
+        with self._mutex:
+            self._landmarks = landmarks
+            self._tables = tables
+            self._stale = self.graph.version != version
+            self._stale_misses = 0
+            self._stats.landmark_builds += 1
+        logger.debug("Built %d landmark tables", len(tables))
+
+    # invalidation ------------------------------------------------------
+    def _on_edge(self, graph: "HyperHelix", a: str, b: str, weight: float | None) -> None:
+        with self._mutex:
+            self._invalidate_edge(a, b, weight)
+
+    def _invalidate_edge(self, a: str, b: str, weight: float | None) -> None:
+        doomed = self._keys_using_edge(a, b)
+        if weight is not None:
+            self._repair(a, b, weight)
+            for key, result in self._cache.items():
+                if key in doomed:
+                    continue
+                s, t = key
+                shortcut = weight + min(
+                    self.lower_bound(s, a) + self.lower_bound(b, t),
+                    self.lower_bound(s, b) + self.lower_bound(a, t),
+                )
+                if shortcut < result.cost:
+                    doomed.add(key)
+        self._drop(doomed)
+
+    def _repair(self, a: str, b: str, weight: float) -> None:
+        """Keep ``|table[u] - table[v]| <= w`` on every edge after ``a``-``b`` was added.
+
+        That property is what makes the landmark bounds admissible. Exact
+        distances have it, removals cannot break it, and lowering values
+        outward from the new edge, as Dijkstra would, restores it. Absent
+        ids count as unreachable.
+        """
+        nodes = self.graph.nodes
+        for table in self._tables:
+            queue: List[Tuple[float, str]] = []
+            for u, v in ((a, b), (b, a)):
+                du = table.get(u)
+                if du is not None and du + weight < table.get(v, INF):
+                    table[v] = du + weight
+                    heappush(queue, (du + weight, v))
+            while queue:
+                d, current = heappop(queue)
+                if d > table[current]:
+                    continue
+                for neighbor, w in nodes[current].edges.items():
+                    nd = d + w
+                    if nd < table.get(neighbor, INF):
+                        table[neighbor] = nd
+                        heappush(queue, (nd, neighbor))
+
+    def _on_remove(self, graph: "HyperHelix", node_id: str) -> None:
+        with self._mutex:
+            self._drop(set(self._by_node.get(node_id, ())))
+            # Forget old distances so a re-added node does not loosen the bounds.
+            for table in self._tables:
+                table.pop(node_id, None)
+
+    def _keys_using_edge(self, a: str, b: str) -> Set[Tuple[str, str]]:
+        keys = self._by_node.get(a, set()) & self._by_node.get(b, set())
+        doomed = set()
+        for key in keys:
+            path = self._cache[key].path
+            for x, y in zip(path, path[1:]):
+                if (x == a and y == b) or (x == b and y == a):
+                    doomed.add(key)
+                    break
+        return doomed
+
+    # cache bookkeeping -------------------------------------------------
+    def _store(self, key: Tuple[str, str], result: PathResult) -> None:
+        self._cache[key] = result
+        for node_id in set(result.path) | set(key):
+            self._by_node.setdefault(node_id, set()).add(key)
+        while len(self._cache) > self.cache_size:
+            old_key, _ = self._cache.popitem(last=False)
+            self._unindex(old_key)
+
+    def _drop(self, keys: Set[Tuple[str, str]]) -> None:
+        for key in keys:
+            if key in self._cache:
+                self._unindex(key)
+                del self._cache[key]
+        self._stats.invalidations += len(keys)
+
+    def _unindex(self, key: Tuple[str, str]) -> None:
+        result = self._cache[key]
+        for node_id in set(result.path) | set(key):
+            members = self._by_node.get(node_id)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._by_node[node_id]
+
+    @staticmethod
+    def _oriented(result: PathResult, start_id: str) -> PathResult:
+        if not result.path or result.path[0] == start_id:
+            return result
+        return PathResult(result.path[::-1], result.cost, result.expanded)
+
+
+def _distances_from(graph: "HyperHelix", source: str) -> Dict[str, float]:
+    dist: Dict[str, float] = {source: 0.0}
+    queue: List[Tuple[float, str]] = [(0.0, source)]
+    done = set()
+    nodes = graph.nodes
+    while queue:
+        d, current = heappop(queue)
+        if current in done:
+            continue
+        done.add(current)
+        for neighbor, weight in nodes[current].edges.items():
+            nd = d + weight
+            if nd < dist.get(neighbor, INF):
+                dist[neighbor] = nd
+                heappush(queue, (nd, neighbor))
+    return dist
@@ -1 +1,13 @@
-"""Event-driven engines that prune and weave the graph."""
+"""Event-driven engines that prune and weave the graph.
+
+:mod:`.evented_engine` prunes only the touched nodes' edges on insert and
+update (``prune_node_edges``); ``prune_missing_edges`` is the full sweep.
+``weave_by_tag`` follows the ``weave`` section of ``config/default.yaml``:
+``all`` links every peer sharing a tag, while ``capped`` and ``hub`` bound
+the fan-out when chosen explicitly.
+
+:mod:`.continuous_engine` provides ``MetricsScheduler``, a background thread
+that recomputes importance for nodes marked dirty by hooks plus a
+round-robin ``refresh_batch`` of the rest, and reports each pass as
+``TickStats``.
+"""
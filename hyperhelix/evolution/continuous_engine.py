@@ -2,22 +2,231 @@ from __future__ import annotations
 
 import threading
 import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List
+
+import logging
 
 from ..core import HyperHelix
 from ..analytics.importance import compute_importance
-from ..analytics.permanence import compute_permanence
+from ..analytics.metrics import MetricsTable, compute_metrics, write_importance
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..analytics.centrality import CentralityEngine
 
-def run_periodically(graph: HyperHelix, interval: float) -> threading.Thread:
-    """Periodically recompute node metrics."""
+logger = logging.getLogger(__name__)
+
+# When more than this fraction of nodes is dirty a tick recomputes the whole
+# graph with the vectorised metrics pass instead of node by node.
+FULL_PASS_FRACTION = 0.125
+
+
+@dataclass
+class TickStats:
+    """What one scheduler pass did."""
+
+    started: float = 0.0
+    duration: float = 0.0
+    dirty: int = 0
+    refreshed: int = 0
+    centrality_iterations: int = 0
+
+    @property
+    def touched(self) -> int:
+        return self.dirty + self.refreshed
+
+
+class MetricsScheduler:
+    """Recompute stored node metrics incrementally on a background thread.
+
+    Graph hooks mark inserted, updated and re-wired nodes dirty; each tick
+    recomputes the dirty nodes plus up to ``refresh_batch`` others taken
+    round-robin, so every node is refreshed eventually without a full
+    sweep per tick. When many nodes are dirty a vectorised whole-graph pass
+    runs instead and its columns are kept as ``table``. With a
+    ``centrality`` engine, importance comes from a warm-started centrality
+    run whenever the graph changed instead. The scheduler can be started,
+    stopped, paused and resumed, and its interval changed while running.
+    A failing tick is logged and retried on the next interval. :meth:`stop`
+    unregisters the graph hooks and :meth:`start` registers them again.
+    """
+
+    def __init__(
+        self,
+        graph: HyperHelix,
+        interval: float = 60.0,
+        refresh_batch: int = 1_000,
+        centrality: "CentralityEngine" | None = None,
+    ) -> None:
+        self.graph = graph
+        self.centrality = centrality
+        self.interval = interval
+        self.refresh_batch = refresh_batch
+        self.last_tick: TickStats | None = None
+        self.table: MetricsTable | None = None
+        self.ticks = 0
+        self._dirty: Dict[str, None] = {}
+        self._mutex = threading.Lock()
+        self._refresh_ids: List[str] = []
+        self._cursor = 0
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+        self._paused = False
+        self._next_run = 0.0
+        self._attached = False
+        self._attach()
+
+    # control -----------------------------------------------------------
+    def start(self) -> threading.Thread:
+        if self._thread is not None:
+            logger.error("Metrics scheduler already running")
+            raise RuntimeError("scheduler already running")
+        self._attach()
+        self._stopped = False
+        self._next_run = time.monotonic() + self.interval
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._detach()
+
+    def pause(self) -> None:
+        with self._cond:
+            self._paused = True
+
+    def resume(self) -> None:
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def set_interval(self, interval: float) -> None:
+        """Change the interval; the next tick is rescheduled from now."""
+        with self._cond:
+            self.interval = interval
+            self._next_run = time.monotonic() + interval
+            self._cond.notify_all()
 
-    def _worker() -> None:
+    def mark_dirty(self, *node_ids: str) -> None:
+        with self._mutex:
+            for node_id in node_ids:
+                self._dirty[node_id] = None
+
+    # work --------------------------------------------------------------
+    def tick(self) -> TickStats:
+        """Recompute dirty nodes and the next slice of the background refresh."""
+        stats = TickStats(started=time.time())
+        begin = time.perf_counter()
+        with self._mutex:
+            dirty, self._dirty = self._dirty, {}
+        graph = self.graph
+        if self.centrality is not None:
+            last = self.centrality.last
+            if dirty or last is None or last.version != graph.version:
+                result = self.centrality.update()
+                stats.dirty = len(dirty)
+                stats.refreshed = len(result.ids) - stats.dirty
+                stats.centrality_iterations = result.iterations
+            return self._finish(stats, begin)
+        if len(dirty) > len(graph.nodes) * FULL_PASS_FRACTION:
+            self.table = compute_metrics(graph)
+            write_importance(graph, self.table)
+            stats.dirty = sum(1 for node_id in dirty if node_id in self.table.index)
+            stats.refreshed = len(self.table) - stats.dirty
+            # The pass covered the current refresh round as well.
+            self._cursor = len(self._refresh_ids)
+            return self._finish(stats, begin)
+        with graph.read_lock():
+            nodes = graph.nodes
+            for node_id in dirty:
+                node = nodes.get(node_id)
+                if node is not None:
+                    _recompute(graph, node)
+                    stats.dirty += 1
+            for node_id in self._next_refresh():
+                node = nodes.get(node_id)
+                if node is not None and node_id not in dirty:
+                    _recompute(graph, node)
+                    stats.refreshed += 1
+        return self._finish(stats, begin)
+
+    def _finish(self, stats: TickStats, begin: float) -> TickStats:
+        stats.duration = time.perf_counter() - begin
+        self.last_tick = stats
+        self.ticks += 1
+        logger.debug("Metrics tick %s", stats)
+        return stats
+
+    def _next_refresh(self) -> List[str]:
+        if self._cursor >= len(self._refresh_ids):
+            # Start a new round over the current node ids.
+            self._refresh_ids = list(self.graph.nodes)
+            self._cursor = 0
+        batch = self._refresh_ids[self._cursor:self._cursor + self.refresh_batch]
+        self._cursor += len(batch)
+        return batch
+
+    def _run(self) -> None:
         while True:
-            time.sleep(interval)
-            for node in graph.nodes.values():
-                node.metadata.importance = compute_importance(node, graph.nodes.values())
-                node.metadata.permanence = compute_permanence(node)
-
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
-    return t
+            with self._cond:
+                while not self._stopped and (self._paused or time.monotonic() < self._next_run):
+                    timeout = None if self._paused else self._next_run - time.monotonic()
+                    self._cond.wait(timeout)
+                if self._stopped:
+                    return
+                self._next_run = time.monotonic() + self.interval
+            try:
+                self.tick()
+            except Exception:
+                # Nodes from the failed tick are picked up by later refreshes.
+                logger.exception("Metrics tick failed; retrying next interval")
+
+    # graph hooks -------------------------------------------------------
+    def _attach(self) -> None:
+        if self._attached:
+            return
+        graph = self.graph
+        graph.register_insert_hook(self._on_node, batch_hook=self._on_nodes)
+        graph.register_update_hook(self._on_node)
+        graph.register_edge_hook(self._on_edge)
+        graph.register_remove_hook(self._on_remove)
+        self._attached = True
+
+    def _detach(self) -> None:
+        if not self._attached:
+            return
+        for hook in (self._on_node, self._on_edge, self._on_remove):
+            self.graph.unregister_hook(hook)
+        self._attached = False
+    def _on_node(self, graph: HyperHelix, node_id: str) -> None:
+        self.mark_dirty(node_id)
+
+    def _on_nodes(self, graph: HyperHelix, node_ids: List[str]) -> None:
+        self.mark_dirty(*node_ids)
+
+    def _on_edge(self, graph: HyperHelix, a: str, b: str, weight: float | None) -> None:
+        self.mark_dirty(a, b)
+
+    def _on_remove(self, graph: HyperHelix, node_id: str) -> None:
+        with self._mutex:
+            self._dirty.pop(node_id, None)
+
+
+def _recompute(graph: HyperHelix, node) -> None:
+    graph.set_importance(node.id, compute_importance(node, graph.nodes.values()))
+
+
+def run_periodically(graph: HyperHelix, interval: float) -> threading.Thread:
+    """Periodically recompute stored node metrics.
+
+    Starts a :class:`MetricsScheduler` and returns its thread; use the
+    scheduler directly when it needs to be stopped or paused.
+    """
+    return MetricsScheduler(graph, interval).start()
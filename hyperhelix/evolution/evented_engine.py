@@ -1,45 +1,198 @@
 from __future__ import annotations
 
+import heapq
+from dataclasses import dataclass, fields
+from typing import Iterable
+
+import logging
+
 from ..core import HyperHelix
 from ..node import Node
-from ..edge import connect
+from ..utils import load_config
 from ..analytics.importance import compute_importance
-from ..analytics.permanence import compute_permanence
+
+logger = logging.getLogger(__name__)
+
+WEAVE_STRATEGIES = ("all", "capped", "hub")
+# The importance order ranks this many recent tag members per peer slot.
+IMPORTANCE_WINDOW = 4
+
+
+@dataclass
+class WeaveConfig:
+    """How :func:`weave_by_tag` links a node to others sharing its tags.
+
+    ``all`` (the default) links every node sharing a tag, a clique per tag.
+    ``capped`` links at most ``max_per_tag`` peers per tag chosen by
+    ``order``, and ``hub`` links the node to one hub node per tag instead of
+    to its peers. ``order="importance"`` picks the most important of the
+    ``max_per_tag * IMPORTANCE_WINDOW`` most recent members, so it is only
+    approximately the tag's top peers.
+    """
+
+    strategy: str = "all"
+    max_per_tag: int = 16
+    order: str = "recency"
+    hub_prefix: str = "tag:"
+
+    @classmethod
+    def from_config(cls, config: dict) -> "WeaveConfig":
+        section = config.get("weave") or {}
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in section.items() if k in names})
+
+
+_weave_config: WeaveConfig | None = None
+
+
+def default_weave_config() -> WeaveConfig:
+    """Weave settings from ``config/default.yaml``, loaded once."""
+    global _weave_config
+    if _weave_config is None:
+        _weave_config = WeaveConfig.from_config(load_config())
+    return _weave_config
+
+
+@dataclass
+class PruneStats:
+    """Counters reported by a prune pass."""
+
+    nodes_visited: int = 0
+    edges_scanned: int = 0
+    edges_removed: int = 0
 
 
 def on_insert(graph: HyperHelix, node_id: str) -> None:
-    """Update metrics when a node is inserted."""
-    node = graph.nodes[node_id]
-    _update_metrics(graph, node)
-    weave_by_tag(graph, node_id)
-    prune_missing_edges(graph)
+    """Update metrics when a node is inserted, as :func:`on_insert_batch` does."""
+    on_insert_batch(graph, [node_id])
+
+
+def on_insert_batch(graph: HyperHelix, node_ids: list[str]) -> None:
+    """Weave, score and prune once for a batch of inserted nodes.
+
+    Nodes are scored after weaving, together with their neighbours, whose
+    degree the new links raised. A batch and the same nodes inserted one
+    by one therefore end up with the same importance.
+    """
+    for node_id in node_ids:
+        weave_by_tag(graph, node_id)
+    scored = dict.fromkeys(node_ids)
+    for node_id in node_ids:
+        scored.update(dict.fromkeys(graph.nodes[node_id].edges))
+    for node_id in scored:
+        node = graph.nodes.get(node_id)
+        if node is not None:
+            _update_metrics(graph, node)
+    prune_node_edges(graph, node_ids)
 
 
 def on_update(graph: HyperHelix, node_id: str) -> None:
     """Update metrics when a node changes."""
     node = graph.nodes[node_id]
     _update_metrics(graph, node)
-    prune_missing_edges(graph)
+    prune_node_edges(graph, [node_id])
 
 
 def _update_metrics(graph: HyperHelix, node: "Node") -> None:
-    node.metadata.importance = compute_importance(node, graph.nodes.values())
-    node.metadata.permanence = compute_permanence(node)
+    if graph.importance_engine is not None:
+        # Centrality owns importance; degree scores would not be comparable.
+        return
+    graph.set_importance(node.id, compute_importance(node, graph.nodes.values()))
+
 
+def weave_by_tag(graph: HyperHelix, node_id: str, config: WeaveConfig | None = None) -> int:
+    """Connect a new node to existing nodes sharing its tags.
 
-def weave_by_tag(graph: HyperHelix, node_id: str) -> None:
-    """Connect new node to existing nodes sharing tags."""
+    Returns the number of edges added. ``config`` defaults to the
+    ``weave`` section of ``config/default.yaml``.
+    """
+    config = config or default_weave_config()
     node = graph.nodes[node_id]
+    if not node.tags:
+        return 0
+    if config.strategy == "all":
+        targets = [n.id for n in graph.find_nodes_by_tags(node.tags, match_all=False)]
+    elif config.strategy == "capped":
+        targets = _capped_peers(graph, node, config)
+    elif config.strategy == "hub":
+        targets = [_hub(graph, tag, config) for tag in node.tags]
+    else:
+        logger.error("Unknown weave strategy %s", config.strategy)
+        raise ValueError(
+            f"Unknown weave strategy {config.strategy!r}; expected one of {WEAVE_STRATEGIES}"
+        )
+    added = 0
+    for other_id in targets:
+        if other_id != node.id and other_id not in node.edges:
+            graph.add_edge(node.id, other_id)
+            added += 1
+    return added
+
+
+def _capped_peers(graph: HyperHelix, node: Node, config: WeaveConfig) -> list[str]:
+    limit = config.max_per_tag
+    chosen: dict[str, None] = {}
     for tag in node.tags:
-        for other in graph.find_nodes_by_tag(tag):
-            if other.id != node.id and other.id not in node.edges:
-                connect(node, other)
+        # The tag index keeps insertion order, so recent members are cheap
+        # to read without touching the rest of a popular tag.
+        if config.order == "importance":
+            pool = graph.recent_nodes_by_tag(tag, limit * IMPORTANCE_WINDOW + 1)
+            candidates = heapq.nlargest(limit + 1, pool, key=lambda n: n.metadata.importance)
+        else:
+            candidates = graph.recent_nodes_by_tag(tag, limit + 1)
+        picked = 0
+        for other in candidates:
+            if picked == limit:
+                break
+            if other.id != node.id:
+                chosen[other.id] = None
+                picked += 1
+    return list(chosen)
 
 
-def prune_missing_edges(graph: HyperHelix) -> None:
-    """Remove edges pointing to nonexistent nodes."""
+def _hub(graph: HyperHelix, tag: str, config: WeaveConfig) -> str:
+    hub_id = f"{config.hub_prefix}{tag}"
+    with graph.write_lock():
+        if hub_id not in graph.nodes:
+            graph.add_node(Node(id=hub_id, payload={"tag": tag}, strand="hub"))
+    return hub_id
+
+
+def prune_node_edges(graph: HyperHelix, node_ids: Iterable[str]) -> PruneStats:
+    """Remove dangling edges held by ``node_ids`` only.
+
+    Used by the event hooks so each mutation only inspects the edges it
+    could have affected.
+    """
+    stats = PruneStats()
+    for node_id in node_ids:
+        node = graph.nodes.get(node_id)
+        if node is None:
+            continue
+        _prune(graph, node, stats)
+    logger.debug("Incremental prune %s", stats)
+    return stats
+
+
+def prune_missing_edges(graph: HyperHelix) -> PruneStats:
+    """Remove edges pointing to nonexistent nodes across the whole graph.
+
+    This is a full maintenance sweep; the insert and update hooks use
+    :func:`prune_node_edges` instead.
+    """
+    stats = PruneStats()
     for node in list(graph.nodes.values()):
-        for neighbor_id in list(node.edges.keys()):
-            if neighbor_id not in graph.nodes:
-                del node.edges[neighbor_id]
+        _prune(graph, node, stats)
+    logger.info("Full prune %s", stats)
+    return stats
+
 
+def _prune(graph: HyperHelix, node: Node, stats: PruneStats) -> None:
+    stats.nodes_visited += 1
+    stats.edges_scanned += len(node.edges)
+    dangling = [n for n in node.edges if n not in graph.nodes]
+    for neighbor_id in dangling:
+        del node.edges[neighbor_id]
+    if dangling:
+        stats.edges_removed += len(dangling)
+        graph.touch(node.id)
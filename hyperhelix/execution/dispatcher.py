@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+INSERT = "insert"
+UPDATE = "update"
+
+Handler = Callable[[str, List[str]], None]
+
+
+class HookDispatcher:
+    """Run graph hook events on a pool of worker threads.
+
+    Events are ``(kind, node_id)`` pairs. Repeated events of the same kind
+    for a node that is still queued are coalesced into one. Events for a
+    given node run in submission order and never concurrently, while
+    different nodes are handled in parallel and handed to the handler in
+    groups of up to ``batch_size`` ids per kind. :meth:`flush` blocks until
+    every submitted event has been handled.
+    """
+
+    def __init__(self, workers: int = 4, batch_size: int = 256) -> None:
+        self.workers = workers
+        self.batch_size = batch_size
+        self._handler: Handler | None = None
+        self._pending: Dict[str, Dict[str, None]] = {}
+        self._ready: Deque[str] = deque()
+        self._active: set[str] = set()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+        self.submitted = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    def start(self, handler: Handler) -> None:
+        """Start the workers; ``handler(kind, node_ids)`` runs each group of events."""
+        if self._threads:
+            logger.error("Hook dispatcher already started")
+            raise RuntimeError("dispatcher already started")
+        self._handler = handler
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"hook-dispatcher-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, kind: str, node_ids: Iterable[str]) -> None:
+        with self._cond:
+            if self._closed:
+                logger.error("Hook event submitted after close")
+                raise RuntimeError("dispatcher is closed")
+            for node_id in node_ids:
+                self.submitted += 1
+                kinds = self._pending.get(node_id)
+                if kinds is None:
+                    self._pending[node_id] = {kind: None}
+                    if node_id not in self._active:
+                        self._ready.append(node_id)
+                elif kind in kinds:
+                    self.coalesced += 1
+                else:
+                    kinds[kind] = None
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all submitted events are handled; ``False`` on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._active, timeout)
+
+    def close(self) -> None:
+        """Handle outstanding events, then stop the workers."""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ready or self._closed)
+                if not self._ready:
+                    return
+                work: Dict[str, List[str]] = {}
+                while self._ready and len(work) < self.batch_size:
+                    node_id = self._ready.popleft()
+                    work[node_id] = list(self._pending.pop(node_id))
+                    self._active.add(node_id)
+            try:
+                self._handle(work)
+            finally:
+                with self._cond:
+                    for node_id in work:
+                        self._active.discard(node_id)
+                        # Events that arrived while the node was busy wait
+                        # until now so per-node order holds.
+                        if node_id in self._pending:
+                            self._ready.append(node_id)
+                    self._cond.notify_all()
+
+    def _handle(self, work: Dict[str, List[str]]) -> None:
+        # Round ``r`` holds each node's r-th event, so per-node order is kept
+        # while nodes sharing a kind are handled together.
+        rounds = max(len(kinds) for kinds in work.values())
+        for r in range(rounds):
+            groups: Dict[str, List[str]] = {}
+            for node_id, kinds in work.items():
+                if r < len(kinds):
+                    groups.setdefault(kinds[r], []).append(node_id)
+            for kind, node_ids in groups.items():
+                try:
+                    self._handler(kind, node_ids)
+                except Exception:
+                    self.failures += 1
+                    logger.exception("Hook %s failed for %d nodes", kind, len(node_ids))
@@ -10,11 +10,11 @@ logger = logging.getLogger(__name__)
 
 def execute_node(graph: HyperHelix, node_id: str) -> None:
     """Execute a node and trigger update hooks."""
-    node = graph.nodes[node_id]
+    with graph.read_lock():
+        node = graph.nodes[node_id]
     try:
         node.execute()
     except Exception:
         logger.exception("Node %s execution failed", node.id)
         raise
-    for hook in graph._update_hooks:
-        hook(graph, node_id)
+    graph.notify_update(node_id)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket ``k`` counts calls that took at most ``2**k`` microseconds.
+BUCKETS = 32
+_MICRO = 1e-6
+
+
+def hook_name(hook: Callable) -> str:
+    module = getattr(hook, "__module__", None) or "?"
+    return f"{module}.{getattr(hook, '__qualname__', repr(hook))}"
+
+
+@dataclass
+class HookStats:
+    """Invocation counters and a log-scale latency histogram for one hook."""
+
+    name: str
+    kind: str
+    calls: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_error: str | None = None
+    last_error_at: float | None = None
+    buckets: List[int] = field(default_factory=lambda: [0] * BUCKETS)
+
+    def record(self, seconds: float) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        exponent = math.frexp(seconds / _MICRO)[1] if seconds > _MICRO else 0
+        self.buckets[min(exponent, BUCKETS - 1)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound in seconds of the bucket holding the ``q`` quantile."""
+        if not self.calls:
+            return 0.0
+        rank = q * self.calls
+        seen = 0
+        for k, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(2.0 ** k * _MICRO, self.max_seconds)
+        return self.max_seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "calls": self.calls,
+            "failures": self.failures,
+            "total_ms": self.total_seconds * 1e3,
+            "mean_ms": self.total_seconds * 1e3 / self.calls if self.calls else 0.0,
+            "p50_ms": self.percentile(0.50) * 1e3,
+            "p95_ms": self.percentile(0.95) * 1e3,
+            "p99_ms": self.percentile(0.99) * 1e3,
+            "max_ms": self.max_seconds * 1e3,
+            "last_error": self.last_error,
+            "last_error_at": self.last_error_at,
+        }
+
+
+class HookMetrics:
+    """Per-hook timing collected by :class:`HyperHelix` when enabled."""
+
+    def __init__(self) -> None:
+        self._stats: Dict[Tuple[str, Callable], HookStats] = {}
+        self._mutex = threading.Lock()
+
+    def call(self, kind: str, hook: Callable, *args: Any) -> Any:
+        """Invoke ``hook(*args)`` and record its latency and any failure."""
+        started = time.perf_counter()
+        try:
+            return hook(*args)
+        except Exception as exc:
+            with self._mutex:
+                stats = self._get(kind, hook)
+                stats.failures += 1
+                stats.last_error = f"{type(exc).__name__}: {exc}"
+                stats.last_error_at = time.time()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._mutex:
+                self._get(kind, hook).record(elapsed)
+
+    def stats(self) -> List[HookStats]:
+        """Copies of the collected stats, slowest total time first."""
+        with self._mutex:
+            items = [
+                HookStats(**{**vars(s), "buckets": list(s.buckets)}) for s in self._stats.values()
+            ]
+        return sorted(items, key=lambda s: s.total_seconds, reverse=True)
+
+    def reset(self) -> None:
+        with self._mutex:
+            self._stats.clear()
+
+    def _get(self, kind: str, hook: Callable) -> HookStats:
+        stats = self._stats.get((kind, hook))
+        if stats is None:
+            stats = self._stats[(kind, hook)] = HookStats(hook_name(hook), kind)
+        return stats
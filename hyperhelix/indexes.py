@@ -0,0 +1,423 @@
+"""Indexes the graph maintains alongside its nodes.
+
+They stay current only when nodes change through the graph: use
+``add_tag``/``remove_tag``, ``set_strand``/``set_layer`` and
+``set_importance``/``set_importances`` rather than editing node fields.
+``RankIndex`` and ``ComponentIndex`` are built on their first query.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Callable, Collection, Dict, Iterable, Iterator, KeysView, List, Set, Tuple
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TagIndex:
+    """Inverted index mapping each tag to the ids of nodes carrying it.
+
+    Member ids are kept in insertion order so callers can cheaply pick the
+    most recently tagged nodes.
+    """
+
+    def __init__(self) -> None:
+        self._index: Dict[str, Dict[str, None]] = {}
+
+    def add(self, node_id: str, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self._index.setdefault(tag, {})[node_id] = None
+
+    def discard(self, node_id: str, tags: Iterable[str]) -> None:
+        for tag in tags:
+            members = self._index.get(tag)
+            if members is None:
+                continue
+            members.pop(node_id, None)
+            if not members:
+                del self._index[tag]
+
+    def ids(self, tag: str) -> KeysView[str]:
+        """Return a live view of node ids carrying ``tag``."""
+        return self._index.get(tag, {}).keys()
+
+    def match(self, tags: Iterable[str], match_all: bool = True) -> List[str]:
+        """Return ids carrying all (or any) of ``tags``.
+
+        The order is deterministic: insertion order of the smallest tag for
+        ``match_all``, otherwise of each tag in turn.
+        """
+        views = [self.ids(tag) for tag in tags]
+        if not views:
+            return []
+        if match_all:
+            views.sort(key=len)
+            first, rest = views[0], views[1:]
+            return [i for i in first if all(i in view for view in rest)]
+        result: Dict[str, None] = {}
+        for view in views:
+            result.update(dict.fromkeys(view))
+        return list(result)
+
+    def recent(self, tag: str, limit: int) -> List[str]:
+        """Return up to ``limit`` ids most recently tagged with ``tag``, newest first."""
+        members = self._index.get(tag)
+        if not members:
+            return []
+        return list(islice(reversed(members), limit))
+
+    def count(self, tag: str) -> int:
+        return len(self._index.get(tag, ()))
+
+    def __contains__(self, tag: object) -> bool:
+        return tag in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class LayerIndex:
+    """Sorted index from integer layer to the ids of nodes on that layer.
+
+    Distinct layers are kept in a sorted list so range queries bisect to
+    the matching layers instead of scanning every node.
+    """
+
+    def __init__(self) -> None:
+        self._index: Dict[int, Dict[str, None]] = {}
+        self._layers: List[int] = []
+
+    def add(self, node_id: str, layer: int) -> None:
+        members = self._index.get(layer)
+        if members is None:
+            members = self._index[layer] = {}
+            insort(self._layers, layer)
+        members[node_id] = None
+
+    def discard(self, node_id: str, layer: int) -> None:
+        members = self._index.get(layer)
+        if members is None:
+            return
+        members.pop(node_id, None)
+        if not members:
+            del self._index[layer]
+            del self._layers[bisect_left(self._layers, layer)]
+
+    def ids(self, layer: int) -> KeysView[str]:
+        """Return a live view of node ids on ``layer``."""
+        return self._index.get(layer, {}).keys()
+
+    def range(self, low: int | None = None, high: int | None = None) -> Iterator[str]:
+        """Yield ids with ``low <= layer <= high`` in layer order; bounds are optional."""
+        start = 0 if low is None else bisect_left(self._layers, low)
+        end = len(self._layers) if high is None else bisect_right(self._layers, high)
+        for layer in self._layers[start:end]:
+            yield from self._index[layer]
+
+    def layers(self) -> List[int]:
+        """Distinct populated layers in ascending order."""
+        return list(self._layers)
+
+
+
+class RankIndex:
+    """Node ids ranked by a score, highest first.
+
+    Keys ``(-score, id)`` live in sorted buckets of about ``load`` entries;
+    a Fenwick tree over the bucket sizes turns positions into bucket
+    offsets. :meth:`set`, :meth:`rank` and :meth:`count_at_least` bisect
+    and walk the tree in logarithmic time, and :meth:`top` costs
+    ``O(log n + k)``. Ties are ordered by id. :meth:`update` re-sorts
+    everything in one pass when most scores change at once.
+    """
+
+    def __init__(self, load: int = 512) -> None:
+        self._load = load
+        self._scores: Dict[str, float] = {}
+        self._buckets: List[List[Tuple[float, str]]] = []
+        self._maxes: List[Tuple[float, str]] = []
+        self._tree: List[int] = [0]
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._scores
+
+    def score(self, node_id: str) -> float:
+        return self._scores[node_id]
+
+    def set(self, node_id: str, score: float) -> None:
+        old = self._scores.get(node_id)
+        if old == score:
+            return
+        if old is not None:
+            self._remove((-old, node_id))
+        self._scores[node_id] = score
+        self._insert((-score, node_id))
+
+    def update(self, scores: Iterable[Tuple[str, float]]) -> None:
+        """Set many scores; large batches rebuild the buckets instead."""
+        scores = list(scores)
+        if len(scores) * 4 < len(self._scores):
+            for node_id, score in scores:
+                self.set(node_id, score)
+            return
+        self._scores.update(scores)
+        keys = sorted((-score, node_id) for node_id, score in self._scores.items())
+        load = self._load
+        self._buckets = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._reindex()
+
+    def discard(self, node_id: str) -> None:
+        old = self._scores.pop(node_id, None)
+        if old is not None:
+            self._remove((-old, node_id))
+
+    def top(self, k: int) -> List[Tuple[str, float]]:
+        """The ``k`` highest-scoring ``(id, score)`` pairs, best first."""
+        result: List[Tuple[str, float]] = []
+        for bucket in self._buckets:
+            if len(result) >= k:
+                break
+            result.extend((node_id, -neg) for neg, node_id in bucket[:k - len(result)])
+        return result
+
+    def rank(self, node_id: str) -> int:
+        """Zero-based position of ``node_id`` in the ranking; ``KeyError`` if absent."""
+        key = (-self._scores[node_id], node_id)
+        b = bisect_left(self._maxes, key)
+        return self._prefix(b) + bisect_left(self._buckets[b], key)
+
+    def count_at_least(self, threshold: float) -> int:
+        """Number of ids scoring ``>= threshold``."""
+        # ``(x,)`` sorts before every ``(x, id)``, so this bisects past all
+        # keys whose negated score is at most ``-threshold``.
+        bound = (math.nextafter(-threshold, math.inf),)
+        b = bisect_left(self._maxes, bound)
+        if b == len(self._buckets):
+            return len(self._scores)
+        return self._prefix(b) + bisect_left(self._buckets[b], bound)
+
+    def at_least(self, threshold: float, limit: int | None = None) -> List[Tuple[str, float]]:
+        """``(id, score)`` pairs scoring ``>= threshold``, best first, at most ``limit``."""
+        count = self.count_at_least(threshold)
+        return self.top(count if limit is None else min(count, limit))
+
+    def _insert(self, key: Tuple[float, str]) -> None:
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._reindex()
+            return
+        b = min(bisect_left(self._maxes, key), len(self._buckets) - 1)
+        bucket = self._buckets[b]
+        insort(bucket, key)
+        self._maxes[b] = bucket[-1]
+        if len(bucket) > 2 * self._load:
+            half = len(bucket) // 2
+            self._buckets[b:b + 1] = [bucket[:half], bucket[half:]]
+            self._maxes[b:b + 1] = [bucket[half - 1], bucket[-1]]
+            self._reindex()
+        else:
+            self._add(b, 1)
+
+    def _remove(self, key: Tuple[float, str]) -> None:
+        b = bisect_left(self._maxes, key)
+        bucket = self._buckets[b]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self._maxes[b] = bucket[-1]
+            self._add(b, -1)
+        else:
+            del self._buckets[b]
+            del self._maxes[b]
+            self._reindex()
+
+    # Fenwick tree over bucket sizes, 1-based.
+    def _reindex(self) -> None:
+        tree = [0] * (len(self._buckets) + 1)
+        for i, bucket in enumerate(self._buckets, 1):
+            tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add(self, b: int, delta: int) -> None:
+        tree = self._tree
+        i = b + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, b: int) -> int:
+        """Number of keys in buckets before ``b``."""
+        tree = self._tree
+        total = 0
+        while b > 0:
+            total += tree[b]
+            b -= b & -b
+        return total
+
+
+
+class ComponentIndex:
+    """Connected components kept as a label per id, for constant-time checks.
+
+    A union-find in its quick-find form: joining two components relabels
+    the smaller one, so each id is relabelled ``O(log n)`` times over any
+    run of insertions. Removing an edge or node searches outward from the
+    affected ids in lockstep. If the searches meet, nothing split; otherwise
+    the side that ran out first is the piece that broke off, and only it is
+    relabelled, so the cost is bounded by the smaller side rather than the
+    whole component. ``neighbors(id)`` returns the ids adjacent to a node.
+    """
+
+    def __init__(self, neighbors: Callable[[str], Iterable[str]]) -> None:
+        self._neighbors = neighbors
+        self._label: Dict[str, int] = {}
+        self._members: Dict[int, Set[str]] = {}
+        self._next = 0
+
+    @classmethod
+    def build(cls, ids: Collection[str], neighbors: Callable[[str], Iterable[str]]) -> "ComponentIndex":
+        """Index ``ids`` (a set or mapping); edges to other ids are ignored."""
+        index = cls(neighbors)
+        index._assign(ids)
+        return index
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._label
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def add(self, node_id: str) -> None:
+        if node_id not in self._label:
+            self._label[node_id] = self._new({node_id})
+
+    def union(self, a: str, b: str) -> None:
+        la, lb = self._label[a], self._label[b]
+        if la == lb:
+            return
+        if len(self._members[la]) < len(self._members[lb]):
+            la, lb = lb, la
+        moved = self._members.pop(lb)
+        for node_id in moved:
+            self._label[node_id] = la
+        self._members[la] |= moved
+
+    def cut(self, a: str, b: str) -> None:
+        """Update after the edge ``a``-``b`` was removed."""
+        self._resolve([a, b])
+
+    def discard(self, node_id: str, neighbors: Iterable[str]) -> None:
+        """Drop a removed node; ``neighbors`` are the ids it was linked to."""
+        component = self._label.pop(node_id, None)
+        if component is None:
+            return
+        members = self._members[component]
+        members.discard(node_id)
+        if not members:
+            del self._members[component]
+        self._resolve([n for n in neighbors if n != node_id])
+
+    def recheck(self, node_ids: Iterable[str]) -> None:
+        """Recompute the components of ``node_ids`` after their edges changed in place."""
+        node_ids = [n for n in node_ids if n in self._label]
+        for component in {self._label[n] for n in node_ids}:
+            members = self._members.pop(component)
+            for node_id in members:
+                del self._label[node_id]
+            self._assign(members)
+        # Edges added in place may join other components.
+        for node_id in node_ids:
+            for other in self._neighbors(node_id):
+                if other in self._label:
+                    self.union(node_id, other)
+
+    def connected(self, a: str, b: str) -> bool:
+        return self._label[a] == self._label[b]
+
+    def component(self, node_id: str) -> List[str]:
+        """Ids in the same component as ``node_id``, itself included."""
+        return list(self._members[self._label[node_id]])
+
+    def sizes(self) -> List[int]:
+        """Size of every component, largest first."""
+        return sorted((len(m) for m in self._members.values()), reverse=True)
+
+    def _new(self, members: Set[str]) -> int:
+        component = self._next
+        self._next += 1
+        self._members[component] = members
+        return component
+
+    def _assign(self, ids: Collection[str]) -> None:
+        """Label the components that edges form among the unlabelled ``ids``."""
+        label, neighbors = self._label, self._neighbors
+        for start in ids:
+            if start in label:
+                continue
+            component = self._new({start})
+            label[start] = component
+            members = self._members[component]
+            # The list grows while it is walked, giving a breadth-first search.
+            queue = [start]
+            for node_id in queue:
+                for other in neighbors(node_id):
+                    if other not in label and other in ids:
+                        label[other] = component
+                        members.add(other)
+                        queue.append(other)
+
+    def _resolve(self, seeds: List[str]) -> None:
+        """Split off every piece of the seeds' component that lost its link.
+
+        Each round checks the remaining seeds against the first one; seeds
+        found disconnected carry a new label into the next round.
+        """
+        pending = list(dict.fromkeys(s for s in seeds if s in self._label))
+        while len(pending) > 1:
+            first, rest = pending[0], []
+            for other in pending[1:]:
+                if self._label[other] != self._label[first] or not self._still_linked(first, other):
+                    rest.append(other)
+            pending = rest
+
+    def _still_linked(self, a: str, b: str) -> bool:
+        label, neighbors = self._label, self._neighbors
+        component = label[a]
+        seen = ({a}, {b})
+        queues = ([a], [b])
+        heads = [0, 0]
+        while True:
+            for side in (0, 1):
+                queue, mine, theirs = queues[side], seen[side], seen[1 - side]
+                if heads[side] == len(queue):
+                    # This side's search is exhausted: it is a whole piece.
+                    self._relabel(component, mine)
+                    return False
+                node_id = queue[heads[side]]
+                heads[side] += 1
+                for other in neighbors(node_id):
+                    if other in theirs:
+                        return True
+                    if other not in mine and label.get(other) == component:
+                        mine.add(other)
+                        queue.append(other)
+
+    def _relabel(self, component: int, piece: Set[str]) -> None:
+        self._members[component] -= piece
+        new = self._new(piece)
+        for node_id in piece:
+            self._label[node_id] = new
@@ -1,16 +1,47 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeMetadata:
-    """Metadata about a node's lifecycle."""
+    """Metadata about a node's lifecycle.
 
-    created: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    Timestamps are stored as epoch seconds; ``created`` and ``updated``
+    expose them as timezone-aware datetimes. ``permanence`` is derived from
+    ``created_ts`` when read rather than stored. Set ``importance`` through
+    ``HyperHelix.set_importance`` so the graph's ranking stays in step.
+    """
+
+    created_ts: float = field(default_factory=time.time)
+    updated_ts: float = 0.0
     importance: float = 0.0
-    permanence: float = 0.0
     perception_history: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # Share the creation timestamp object until the node is first updated.
+        if not self.updated_ts:
+            self.updated_ts = self.created_ts
+
+    @property
+    def permanence(self) -> float:
+        return time.time() - self.created_ts
+
+    @property
+    def created(self) -> datetime:
+        return datetime.fromtimestamp(self.created_ts, timezone.utc)
+
+    @created.setter
+    def created(self, value: datetime) -> None:
+        self.created_ts = value.timestamp()
+
+    @property
+    def updated(self) -> datetime:
+        return datetime.fromtimestamp(self.updated_ts, timezone.utc)
+
+    @updated.setter
+    def updated(self, value: datetime) -> None:
+        self.updated_ts = value.timestamp()
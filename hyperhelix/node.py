@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List
 
 from .metadata import NodeMetadata
@@ -10,7 +11,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id: str
     payload: Any
@@ -21,9 +22,16 @@ class Node:
     metadata: NodeMetadata = field(default_factory=NodeMetadata)
     execute_fn: Callable[[Any], Any] | None = None
 
+    def __post_init__(self) -> None:
+        # Interned ids let every neighbour's edge dict share one key object.
+        if type(self.id) is str:
+            self.id = sys.intern(self.id)
+        if type(self.strand) is str:
+            self.strand = sys.intern(self.strand)
+
     def execute(self) -> Any:
         logger.debug("Executing node %s", self.id)
-        self.metadata.updated = datetime.now(timezone.utc)
+        self.metadata.updated_ts = time.time()
         if self.execute_fn:
             try:
                 result = self.execute_fn(self.payload)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from typing import Callable, Dict, List, Mapping, Tuple
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+Adjacency = Callable[[str], Mapping[str, float]]
+Heuristic = Callable[[str, str], float]
+
+METHODS = ("dijkstra", "bidirectional", "astar")
+
+
+@dataclass
+class PathResult:
+    """Outcome of a path search; ``path`` is empty when no route exists."""
+
+    path: List[str] = field(default_factory=list)
+    cost: float = float("inf")
+    expanded: int = 0
+
+
+def _unwind(prev: Dict[str, str | None], node: str | None) -> List[str]:
+    path = []
+    while node is not None:
+        path.append(node)
+        node = prev[node]
+    return path
+
+
+def dijkstra(adjacency: Adjacency, start: str, end: str) -> PathResult:
+    """One-sided Dijkstra search."""
+    return astar(adjacency, start, end, lambda _n, _t: 0.0)
+
+
+def astar(adjacency: Adjacency, start: str, end: str, heuristic: Heuristic) -> PathResult:
+    """A* search guided by ``heuristic(node, target)``.
+
+    The result is optimal when the heuristic never overestimates the
+    remaining distance. A closed node reached again more cheaply is
+    reopened, so the heuristic need not also be consistent; with a
+    consistent one no node is expanded twice.
+    """
+    dist: Dict[str, float] = {start: 0.0}
+    prev: Dict[str, str | None] = {start: None}
+    queue: List[Tuple[float, str]] = [(heuristic(start, end), start)]
+    done = set()
+    expanded = 0
+    while queue:
+        _, current = heappop(queue)
+        if current in done:
+            continue
+        done.add(current)
+        expanded += 1
+        if current == end:
+            return PathResult(_unwind(prev, end)[::-1], dist[end], expanded)
+        base = dist[current]
+        for neighbor, weight in adjacency(current).items():
+            new_dist = base + weight
+            if new_dist < dist.get(neighbor, float("inf")):
+                dist[neighbor] = new_dist
+                prev[neighbor] = current
+                done.discard(neighbor)
+                heappush(queue, (new_dist + heuristic(neighbor, end), neighbor))
+    return PathResult(expanded=expanded)
+
+
+def bidirectional_dijkstra(adjacency: Adjacency, start: str, end: str) -> PathResult:
+    """Dijkstra run from both endpoints until the frontiers meet.
+
+    Edges are symmetric, so the same adjacency serves both directions.
+    """
+    if start == end:
+        return PathResult([start], 0.0, 1)
+    dists = ({start: 0.0}, {end: 0.0})
+    prevs: Tuple[Dict[str, str | None], Dict[str, str | None]] = ({start: None}, {end: None})
+    queues: Tuple[List[Tuple[float, str]], List[Tuple[float, str]]] = ([(0.0, start)], [(0.0, end)])
+    done: Tuple[set, set] = (set(), set())
+    best = float("inf")
+    meet: str | None = None
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        d, current = heappop(queues[side])
+        if current in done[side]:
+            continue
+        done[side].add(current)
+        dist, other = dists[side], dists[1 - side]
+        for neighbor, weight in adjacency(current).items():
+            new_dist = d + weight
+            if new_dist < dist.get(neighbor, float("inf")):
+                dist[neighbor] = new_dist
+                prevs[side][neighbor] = current
+                heappush(queues[side], (new_dist, neighbor))
+            if neighbor in other and dist[neighbor] + other[neighbor] < best:
+                best = dist[neighbor] + other[neighbor]
+                meet = neighbor
+    expanded = len(done[0]) + len(done[1])
+    if meet is None:
+        return PathResult(expanded=expanded)
+    forward = _unwind(prevs[0], meet)[::-1]
+    backward = _unwind(prevs[1], meet)[1:]
+    return PathResult(forward + backward, best, expanded)
+
+
+def search(
+    adjacency: Adjacency,
+    start: str,
+    end: str,
+    method: str = "dijkstra",
+    heuristic: Heuristic | None = None,
+) -> PathResult:
+    """Dispatch to the search selected by ``method``."""
+    logger.debug("Path search %s -> %s using %s", start, end, method)
+    if method == "dijkstra":
+        return dijkstra(adjacency, start, end)
+    if method == "bidirectional":
+        return bidirectional_dijkstra(adjacency, start, end)
+    if method == "astar":
+        return astar(adjacency, start, end, heuristic or (lambda _n, _t: 0.0))
+    logger.error("Unknown path method %s", method)
+    raise ValueError(f"Unknown path method {method!r}; expected one of {METHODS}")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 class BaseAdapter(ABC):
@@ -15,3 +16,13 @@ class BaseAdapter(ABC):
 
     @abstractmethod
     def load_edges(self, node_id: str) -> dict[str, float]: ...
+
+    def save_nodes(self, items: Iterable[tuple[str, dict]]) -> None:
+        """Persist many nodes; override with a native bulk write when available."""
+        for node_id, payload in items:
+            self.save_node(node_id, payload)
+
+    def save_edges(self, items: Iterable[tuple[str, str, float]]) -> None:
+        """Persist many edges; override with a native bulk write when available."""
+        for a, b, weight in items:
+            self.save_edge(a, b, weight)
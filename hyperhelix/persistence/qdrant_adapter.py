@@ -20,3 +20,9 @@ class QdrantAdapter(BaseAdapter):
 
     def load_edges(self, node_id: str) -> dict[str, float]:
         return self._edges.get(node_id, {})
+
+    def remove_nodes(self, node_ids: list[str]) -> None:
+        for node_id in node_ids:
+            self._store.pop(node_id, None)
+            for other in self._edges.pop(node_id, {}):
+                self._edges.get(other, {}).pop(node_id, None)
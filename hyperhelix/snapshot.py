@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Dict, Generator, Iterable, Iterator, List, Mapping, Tuple
+
+import logging
+
+from .node import Node
+from . import pathfinding, traversal
+from .pathfinding import Heuristic, PathResult
+
+logger = logging.getLogger(__name__)
+
+
+def copy_node(node: Node) -> Node:
+    """Copy a node's structure; payload and metadata objects are shared."""
+    return Node(
+        node.id,
+        node.payload,
+        list(node.tags),
+        node.layer,
+        node.strand,
+        dict(node.edges),
+        node.metadata,
+        node.execute_fn,
+    )
+
+
+class GraphSnapshot:
+    """Point-in-time read view returned by :meth:`HyperHelix.snapshot`.
+
+    Nodes are private copies of their edges, tags, layer and strand as of
+    ``version``; unchanged node copies are shared between successive
+    snapshots. Payload and metadata objects are shared with the live graph.
+    Treat the view as read-only; no lock is needed to use it.
+    """
+
+    __slots__ = ("version", "nodes", "_nodes")
+
+    def __init__(self, nodes: Dict[str, Node], version: int) -> None:
+        self._nodes = nodes
+        self.nodes: Mapping[str, Node] = MappingProxyType(nodes)
+        self.version = version
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._nodes)
+
+    def get(self, node_id: str) -> Node | None:
+        return self._nodes.get(node_id)
+
+    def edges(self) -> Iterator[Tuple[str, str, float]]:
+        """Yield every undirected edge once as ``(a, b, weight)`` with ``a <= b``."""
+        for a, node in self._nodes.items():
+            for b, weight in node.edges.items():
+                if a <= b:
+                    yield a, b, weight
+
+    def spiral_walk(
+        self,
+        start_id: str | Iterable[str],
+        depth: int = 1,
+        *,
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
+        min_weight: float | None = None,
+    ) -> Generator[Node, None, None]:
+        """Lazily yield nodes within ``depth`` hops, as :meth:`HyperHelix.spiral_walk`."""
+        starts = [start_id] if isinstance(start_id, str) else list(start_id)
+        nodes = self._nodes
+        for start in starts:
+            if start not in nodes:
+                logger.error("Start node %s not found", start)
+                raise KeyError(start)
+        for node_id, _ in traversal.walk(
+            lambda n: nodes[n].edges,
+            starts,
+            depth,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+            min_weight=min_weight,
+            accept=nodes.__contains__,
+        ):
+            yield nodes[node_id]
+
+    def shortest_path(
+        self,
+        start_id: str,
+        end_id: str,
+        method: str = "dijkstra",
+        heuristic: Heuristic | None = None,
+    ) -> List[str]:
+        return self.find_path(start_id, end_id, method, heuristic).path
+
+    def find_path(
+        self,
+        start_id: str,
+        end_id: str,
+        method: str = "dijkstra",
+        heuristic: Heuristic | None = None,
+    ) -> PathResult:
+        nodes = self._nodes
+        if start_id not in nodes or end_id not in nodes:
+            logger.error("Start or end node missing: %s %s", start_id, end_id)
+            raise KeyError(start_id if start_id not in nodes else end_id)
+        return pathfinding.search(lambda n: nodes[n].edges, start_id, end_id, method, heuristic)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Generator, Iterable, Iterator, List, Mapping, Tuple
+
+import logging
+
+from .node import Node
+from . import pathfinding, traversal
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .core import HyperHelix
+    from .csr import CSRGraph
+    from .pathfinding import Heuristic, PathResult
+
+logger = logging.getLogger(__name__)
+
+
+class _ViewNodes(Mapping[str, Node]):
+    """Read-only mapping of the parent's nodes restricted to the view ids."""
+
+    __slots__ = ("_parent", "_ids")
+
+    def __init__(self, parent: Dict[str, Node], ids: Dict[str, None]) -> None:
+        self._parent = parent
+        self._ids = ids
+
+    def __getitem__(self, node_id: str) -> Node:
+        if node_id not in self._ids:
+            raise KeyError(node_id)
+        return self._parent[node_id]
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._ids and node_id in self._parent
+
+    def __iter__(self) -> Iterator[str]:
+        parent = self._parent
+        return (node_id for node_id in self._ids if node_id in parent)
+
+    def __len__(self) -> int:
+        return sum(1 for node_id in self._ids if node_id in self._parent)
+
+
+class SubgraphView:
+    """Induced subgraph of a :class:`HyperHelix` over a set of node ids.
+
+    The view holds the parent graph and the ids only; nodes are the
+    parent's own objects and edges leaving the id set are filtered out as
+    they are read. Ids later removed from the parent drop out of the view.
+    Queries take the parent's read lock.
+    """
+
+    __slots__ = ("graph", "nodes", "_ids")
+
+    def __init__(self, graph: "HyperHelix", node_ids: Iterable[str]) -> None:
+        self.graph = graph
+        self._ids: Dict[str, None] = dict.fromkeys(node_ids)
+        self.nodes: Mapping[str, Node] = _ViewNodes(graph.nodes, self._ids)
+
+    @property
+    def version(self) -> int:
+        return self.graph.version
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.nodes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nodes)
+
+    def neighbors(self, node_id: str) -> Dict[str, float]:
+        """Edges of ``node_id`` whose other end is also in the view."""
+        with self.graph.read_lock():
+            return self._filtered(self.nodes[node_id])
+
+    def edges(self) -> List[Tuple[str, str, float]]:
+        """Every edge inside the view once, as ``(a, b, weight)`` with ``a <= b``."""
+        with self.graph.read_lock():
+            ids = self._ids
+            return [
+                (a, b, w)
+                for a, node in self.nodes.items()
+                for b, w in node.edges.items()
+                if a <= b and b in ids
+            ]
+
+    def degree(self, node_id: str) -> int:
+        return len(self.neighbors(node_id))
+
+    def find_nodes_by_tag(self, tag: str) -> list[Node]:
+        return [n for n in self.graph.find_nodes_by_tag(tag) if n.id in self._ids]
+
+    def spiral_walk(
+        self,
+        start_id: str | Iterable[str],
+        depth: int = 1,
+        *,
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
+        min_weight: float | None = None,
+    ) -> Generator[Node, None, None]:
+        """Lazily yield view nodes within ``depth`` hops, never leaving the view."""
+        starts = [start_id] if isinstance(start_id, str) else list(start_id)
+        with self.graph.read_lock():
+            for start in starts:
+                if start not in self.nodes:
+                    logger.error("Start node %s not in subgraph", start)
+                    raise KeyError(start)
+        for node_id, _ in traversal.walk(
+            self._adjacency,
+            starts,
+            depth,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+            min_weight=min_weight,
+            accept=self.nodes.__contains__,
+        ):
+            node = self.graph.nodes.get(node_id)
+            if node is not None:
+                yield node
+
+    def shortest_path(
+        self,
+        start_id: str,
+        end_id: str,
+        method: str = "dijkstra",
+        heuristic: "Heuristic" | None = None,
+    ) -> List[str]:
+        return self.find_path(start_id, end_id, method, heuristic).path
+
+    def find_path(
+        self,
+        start_id: str,
+        end_id: str,
+        method: str = "dijkstra",
+        heuristic: "Heuristic" | None = None,
+    ) -> "PathResult":
+        """Shortest path using only nodes and edges inside the view."""
+        with self.graph.read_lock():
+            if start_id not in self.nodes or end_id not in self.nodes:
+                logger.error("Start or end node not in subgraph: %s %s", start_id, end_id)
+                raise KeyError(start_id if start_id not in self.nodes else end_id)
+            nodes = self.graph.nodes
+            return pathfinding.search(
+                lambda n: self._filtered(nodes[n]), start_id, end_id, method, heuristic
+            )
+
+    def freeze(self) -> "CSRGraph":
+        """Build a CSR snapshot of the view for the array-based analytics."""
+        from .csr import CSRGraph
+
+        with self.graph.read_lock():
+            return CSRGraph.from_graph(self)
+
+    def _adjacency(self, node_id: str) -> Dict[str, float]:
+        with self.graph.read_lock():
+            node = self.graph.nodes.get(node_id)
+            return self._filtered(node) if node is not None else {}
+
+    def _filtered(self, node: Node) -> Dict[str, float]:
+        ids = self._ids
+        return {k: w for k, w in node.edges.items() if k in ids}
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from typing import Mapping
+
 from ..core import HyperHelix
 
 
-def sprint_plan(graph: HyperHelix) -> list[str]:
-    """Return a simple ordered list of task IDs."""
-    return list(graph.nodes.keys())
+def sprint_plan(graph: HyperHelix, priority: Mapping[str, float] | None = None) -> list[str]:
+    """Return an ordered list of task IDs.
+
+    Insertion order by default; with ``priority`` (for example betweenness
+    scores of bridge nodes) higher-scoring tasks come first.
+    """
+    with graph.read_lock():
+        ids = list(graph.nodes.keys())
+    if priority is not None:
+        ids.sort(key=lambda node_id: -priority.get(node_id, 0.0))
+    return ids
@@ -11,6 +11,7 @@ def create_task(graph: HyperHelix, task: Task) -> None:
 
 
 def assign_task(graph: HyperHelix, task_id: str, user: str) -> None:
-    node = graph.nodes[task_id]
+    with graph.read_lock():
+        node = graph.nodes[task_id]
     if isinstance(node.payload, Task):
         node.payload.assigned_to = user
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Generator, Iterable, Mapping, Tuple
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+Adjacency = Callable[[str], Mapping[str, float]]
+
+
+def walk(
+    adjacency: Adjacency,
+    starts: Iterable[str],
+    depth: int = 1,
+    max_nodes: int | None = None,
+    max_edges: int | None = None,
+    min_weight: float | None = None,
+    accept: Callable[[str], bool] | None = None,
+    priority: Callable[[str], float] | None = None,
+) -> Generator[Tuple[str, int], None, None]:
+    """Lazily yield ``(node_id, level)`` pairs in breadth-first order.
+
+    Nodes are marked seen when enqueued, so each id enters the frontier at
+    most once and the frontier never holds more than ``max_nodes`` ids.
+    The walk stops after ``max_nodes`` results or once
+    ``max_edges`` edges have been examined. Edges lighter than
+    ``min_weight`` are ignored and neighbours rejected by ``accept`` are
+    neither yielded nor expanded; start nodes are always yielded. Once the
+    edge budget is spent, nodes already discovered are still yielded but
+    not expanded. With ``priority``, each node's neighbours are enqueued
+    highest priority first, so preferred nodes survive the budgets.
+    """
+    queue = deque()
+    seen = set()
+    for start in starts:
+        if start not in seen:
+            seen.add(start)
+            queue.append((start, 0))
+    emitted = 0
+    examined = 0
+    exhausted = False
+    while queue:
+        if max_nodes is not None and emitted >= max_nodes:
+            logger.debug("Walk stopped at node budget %d", max_nodes)
+            return
+        current, level = queue.popleft()
+        yield current, level
+        emitted += 1
+        if level >= depth or exhausted:
+            continue
+        edges = adjacency(current).items()
+        if priority is not None:
+            edges = sorted(edges, key=lambda edge: -priority(edge[0]))
+        for neighbor, weight in edges:
+            if max_edges is not None and examined >= max_edges:
+                logger.debug("Walk stopped at edge budget %d", max_edges)
+                exhausted = True
+                break
+            examined += 1
+            if neighbor in seen or (min_weight is not None and weight < min_weight):
+                continue
+            if accept is not None and not accept(neighbor):
+                continue
+            if max_nodes is not None and len(seen) >= max_nodes:
+                break
+            seen.add(neighbor)
+            queue.append((neighbor, level + 1))
@@ -1,8 +1,13 @@
 import os
 import logging
+from pathlib import Path
+
+import yaml
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / 'config' / 'default.yaml'
+
 
 def get_api_key(name: str, default: str | None = None) -> str | None:
     """Return API key from the environment.
@@ -13,3 +18,16 @@ def get_api_key(name: str, default: str | None = None) -> str | None:
     if value is None:
         logger.warning("%s not set", name)
     return value
+
+
+def load_config(path: Path | str | None = None) -> dict:
+    """Return runtime settings from ``config/default.yaml`` (or ``path``).
+
+    A missing file yields an empty mapping so callers fall back to defaults.
+    """
+    path = Path(path) if path is not None else DEFAULT_CONFIG_PATH
+    if not path.exists():
+        logger.warning("Config file %s not found", path)
+        return {}
+    with path.open('r') as f:
+        return yaml.safe_load(f) or {}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Tuple
+import math
+from typing import Callable, Mapping, Tuple
 
 from ..node import Node
 
@@ -9,3 +10,25 @@ def helix_coords(node: Node, idx: int, total: int) -> Tuple[float, float, float]
     """Generate simple 3D coordinates."""
     angle = idx * 3.1415 * 2 / max(total, 1)
     return (angle, idx, 0.0)
+
+
+def distance_heuristic(
+    coords: Mapping[str, Tuple[float, float, float]], scale: float = 1.0
+) -> Callable[[str, str], float]:
+    """Return an A* heuristic measuring straight-line distance between coordinates.
+
+    When every edge weight is at least ``scale`` times the distance between
+    its endpoints the heuristic never overestimates, and by the triangle
+    inequality it is consistent too. Nodes without coordinates get an
+    estimate of zero, which keeps it admissible but may make it
+    inconsistent; :func:`~hyperhelix.pathfinding.astar` handles both.
+    """
+
+    def _heuristic(node_id: str, target_id: str) -> float:
+        a = coords.get(node_id)
+        b = coords.get(target_id)
+        if a is None or b is None:
+            return 0.0
+        return scale * math.dist(a, b)
+
+    return _heuristic
@@ -4,6 +4,8 @@ import pytest
 from hyperhelix.api.main import app
 from hyperhelix.core import HyperHelix
 from hyperhelix.node import Node
+from hyperhelix.persistence.journal import Journal
+from hyperhelix.tasks.task import Task
 
 client = TestClient(app)
 
@@ -100,6 +102,14 @@ def test_list_edges():
     assert edges == {('a', 'b', 2.0)}
 
 
+def test_list_edges_includes_self_loops():
+    client.post('/nodes', json={'id': 'a', 'payload': {}})
+    client.post('/edges', json={'a': 'a', 'b': 'a', 'weight': 3.0})
+    resp = client.get('/edges')
+    assert resp.status_code == 200
+    assert [(e['a'], e['b'], e['weight']) for e in resp.json()] == [('a', 'a', 3.0)]
+
+
 def test_delete_edge():
     client.post('/nodes', json={'id': 'a', 'payload': {}})
     client.post('/nodes', json={'id': 'b', 'payload': {}})
@@ -191,6 +201,18 @@ def test_task_endpoints():
     assert plan.json() == ['t1']
 
 
+def test_create_task_with_journal(tmp_path):
+    app.state.graph = HyperHelix(journal=Journal(tmp_path, sync_interval=None))
+    resp = client.post('/tasks', json={'id': 't1', 'description': 'demo'})
+    assert resp.status_code == 200
+    assert 't1' in app.state.graph.nodes
+    app.state.graph.journal.close()
+
+    restored = HyperHelix(journal=Journal(tmp_path, sync_interval=None))
+    assert isinstance(restored.nodes['t1'].payload, Task)
+    assert restored.nodes['t1'].payload.description == 'demo'
+
+
 @pytest.mark.skipif(
     not os.getenv('OPENAI_API_KEY'),
     reason='OPENAI_API_KEY not set; skipping live integration test',
@@ -261,3 +283,78 @@ def test_suggest_includes_context_local(capture_local):
     if capture_local is not None:
         assert capture_local['messages'][0]['role'] == 'system'
 
+
+
+def test_path_endpoint():
+    for node_id in 'abc':
+        client.post('/nodes', json={'id': node_id, 'payload': {}})
+    client.post('/edges', json={'a': 'a', 'b': 'b', 'weight': 1})
+    client.post('/edges', json={'a': 'b', 'b': 'c', 'weight': 2})
+    resp = client.get('/path/a/c', params={'method': 'bidirectional'})
+    assert resp.status_code == 200
+    assert resp.json()['path'] == ['a', 'b', 'c']
+    assert resp.json()['cost'] == 3.0
+    assert client.get('/path/a/c', params={'method': 'bogus'}).status_code == 400
+    assert client.get('/path/a/missing').status_code == 404
+
+
+def test_walk_limits():
+    for node_id in 'abcd':
+        client.post('/nodes', json={'id': node_id, 'payload': {}})
+    client.post('/edges', json={'a': 'a', 'b': 'b'})
+    client.post('/edges', json={'a': 'a', 'b': 'c'})
+    resp = client.get('/walk/a', params={'depth': 1, 'max_nodes': 2})
+    assert len(resp.json()) == 2
+    resp = client.get('/walk/a', params={'depth': 0, 'also': ['d']})
+    assert {n['id'] for n in resp.json()} == {'a', 'd'}
+    assert client.get('/walk/a', params={'max_nodes': 10**9}).status_code == 422
+
+
+def test_list_nodes_filters():
+    client.post('/nodes', json={'id': 'a', 'payload': {}, 'strand': 'x', 'layer': 1})
+    client.post('/nodes', json={'id': 'b', 'payload': {}, 'strand': 'x', 'layer': 3})
+    client.post('/nodes', json={'id': 'c', 'payload': {}, 'layer': 2})
+    resp = client.get('/nodes', params={'strand': 'x'})
+    assert [n['id'] for n in resp.json()] == ['a', 'b']
+    resp = client.get('/nodes', params={'layer_min': 2, 'layer_max': 3})
+    assert [(n['id'], n['layer']) for n in resp.json()] == [('b', 3), ('c', 2)]
+    resp = client.get('/nodes', params={'strand': 'x', 'layer_max': 2})
+    assert [n['id'] for n in resp.json()] == ['a']
+
+
+def test_export_subgraph_filters():
+    for node_id in 'abcd':
+        client.post('/nodes', json={'id': node_id, 'payload': {}})
+    client.post('/edges', json={'a': 'a', 'b': 'b'})
+    client.post('/edges', json={'a': 'b', 'b': 'c'})
+    client.post('/edges', json={'a': 'c', 'b': 'd'})
+    data = client.get('/export', params={'nodes': ['a', 'b', 'd']}).json()
+    assert {n['id'] for n in data['nodes']} == {'a', 'b', 'd'}
+    assert [(e['a'], e['b']) for e in data['edges']] == [('a', 'b')]
+    data = client.get('/export', params={'around': 'c', 'depth': 1}).json()
+    assert {n['id'] for n in data['nodes']} == {'b', 'c', 'd'}
+    assert len(data['edges']) == 2
+    assert client.get('/export', params={'around': 'zz'}).status_code == 404
+
+
+def test_hook_metrics_endpoint():
+    assert client.get('/metrics/hooks').json() == {'enabled': False, 'hooks': []}
+    app.state.graph.enable_hook_metrics()
+    client.post('/nodes', json={'id': 'a', 'payload': {}})
+    hooks = client.get('/metrics/hooks').json()['hooks']
+    assert hooks[0]['name'].endswith('on_insert')
+    assert hooks[0]['calls'] == 1 and 'p99_ms' in hooks[0]
+
+
+def test_top_nodes_endpoint():
+    graph = app.state.graph
+    for node_id, score in (('a', 0.1), ('b', 0.9), ('c', 0.6)):
+        client.post('/nodes', json={'id': node_id, 'payload': {}})
+        graph.set_importance(node_id, score)
+    resp = client.get('/nodes/top', params={'n': 2})
+    assert [(n['id'], n['rank']) for n in resp.json()] == [('b', 0), ('c', 1)]
+    resp = client.get('/nodes/top', params={'threshold': 0.7})
+    assert [n['id'] for n in resp.json()] == ['b']
+    resp = client.get('/nodes/top', params={'important': True})
+    assert [n['importance'] for n in resp.json()] == [0.9, 0.6]
+    assert client.get('/nodes/top', params={'n': 0}).status_code == 422
@@ -0,0 +1,102 @@
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+from hyperhelix.persistence.neo4j_adapter import Neo4jAdapter
+
+
+class CountingAdapter(Neo4jAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    def save_node(self, node_id, payload):
+        self.calls.append('save_node')
+        super().save_node(node_id, payload)
+
+    def save_nodes(self, items):
+        self.calls.append('save_nodes')
+        for node_id, payload in items:
+            super().save_node(node_id, payload)
+
+    def save_edges(self, items):
+        self.calls.append('save_edges')
+        for a, b, weight in items:
+            super().save_edge(a, b, weight)
+
+
+def test_batch_defers_hooks_and_adapter_writes():
+    adapter = CountingAdapter()
+    g = HyperHelix(adapter=adapter)
+    seen = []
+    g.register_insert_hook(lambda _g, node_id: seen.append(node_id))
+    with g.batch():
+        g.add_node(Node(id='a', payload={}, tags=['x']))
+        g.add_node(Node(id='b', payload={}, tags=['x']))
+        g.add_edge('a', 'b', 2.0)
+        assert seen == [] and adapter.calls == []
+        assert 'a' in g.nodes
+    assert seen == ['a', 'b']
+    assert adapter.calls == ['save_nodes', 'save_edges']
+    assert adapter.load_edges('a') == {'b': 2.0}
+    assert 'b' in g.nodes['a'].edges
+
+
+def test_batch_hook_called_once_with_all_ids():
+    g = HyperHelix()
+    batches = []
+    g.register_insert_hook(lambda _g, _id: None, batch_hook=lambda _g, ids: batches.append(ids))
+    g.add_nodes(Node(id=str(i), payload=None) for i in range(3))
+    assert batches == [['0', '1', '2']]
+
+
+def test_add_nodes_weaves_tags_and_add_edges():
+    g = HyperHelix()
+    g.add_nodes([Node(id='a', payload=None, tags=['t']), Node(id='b', payload=None, tags=['t']),
+                 Node(id='c', payload=None)])
+    assert 'b' in g.nodes['a'].edges
+    assert g.nodes['a'].metadata.importance == 1.0
+    g.add_edges([('a', 'c'), ('b', 'c', 3.0)])
+    assert g.nodes['c'].edges == {'a': 1.0, 'b': 3.0}
+
+
+def test_batch_and_sequential_inserts_score_alike():
+    def build(batched):
+        g = HyperHelix()
+        nodes = [Node(id=i, payload=None, tags=['t']) for i in 'abc']
+        if batched:
+            g.add_nodes(nodes)
+        else:
+            for node in nodes:
+                g.add_node(node)
+        return {i: n.metadata.importance for i, n in g.nodes.items()}
+
+    assert build(True) == build(False) == {'a': 2.0, 'b': 2.0, 'c': 2.0}
+
+
+def test_nested_batch_and_removed_nodes_skipped():
+    g = HyperHelix()
+    seen = []
+    g.register_insert_hook(lambda _g, node_id: seen.append(node_id))
+    with g.batch():
+        with g.batch():
+            g.add_node(Node(id='a', payload=None))
+        g.add_node(Node(id='b', payload=None))
+        g.remove_node('a')
+        assert seen == []
+    assert seen == ['b']
+
+
+def test_batch_saves_only_edges_still_present():
+    adapter = CountingAdapter()
+    g = HyperHelix(adapter=adapter)
+    with g.batch():
+        g.add_nodes(Node(id=i, payload=None) for i in 'abcd')
+        g.add_edge('a', 'b')
+        g.remove_edge('a', 'b')
+        g.add_edge('a', 'c')
+        g.remove_node('c')
+        g.add_node(Node(id='c', payload=None))
+        g.add_edge('a', 'd')
+        g.add_edge('d', 'a', 2.0)
+    assert adapter.calls.count('save_edges') == 1
+    assert adapter.load_edges('a') == {'d': 2.0}
+    assert adapter.load_edges('b') == {} and adapter.load_edges('c') == {}
@@ -0,0 +1,86 @@
+import random
+
+import numpy as np
+
+from hyperhelix.analytics.betweenness import (
+    approximate_betweenness,
+    iter_betweenness,
+    samples_for,
+)
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+from hyperhelix.tasks.sprint_planner import sprint_plan
+
+
+def _graph(edges) -> HyperHelix:
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    for node_id in sorted({x for a, b, _ in edges for x in (a, b)}):
+        g.add_node(Node(id=node_id, payload=None))
+    for a, b, w in edges:
+        g.add_edge(a, b, w)
+    return g
+
+
+def test_all_sources_give_exact_weighted_betweenness():
+    # a-b-c-d-e path plus a heavy shortcut a-e that no shortest path uses.
+    g = _graph([('a', 'b', 1), ('b', 'c', 1), ('c', 'd', 1), ('d', 'e', 1), ('a', 'e', 10)])
+    result = approximate_betweenness(g.freeze(), samples=5)
+    assert result.error_bound == 0.0
+    scores = result.as_dict()
+    assert scores['c'] == 4 * 2 / (4 * 3)
+    assert scores['b'] == scores['d'] == 3 * 2 / (4 * 3)
+    assert scores['a'] == scores['e'] == 0.0
+    assert result.top(1) == [('c', scores['c'])]
+
+
+def test_equal_length_paths_split_dependency():
+    g = _graph([('a', 'b', 1), ('b', 'd', 1), ('a', 'c', 1.5), ('c', 'd', 0.5), ('d', 'e', 1)])
+    scores = approximate_betweenness(g.freeze(), samples=5).as_dict()
+    # a-e and a-d split between the b and c routes; d carries every pair ending at e.
+    assert scores['b'] == scores['c']
+    assert scores['d'] > scores['b'] > 0
+
+
+def _barbell() -> HyperHelix:
+    rng = random.Random(0)
+    edges = []
+    for side in 'lr':
+        for _ in range(300):
+            edges.append((f'{side}{rng.randrange(60)}', f'{side}{rng.randrange(60)}', rng.uniform(1, 2)))
+    edges += [('l0', 'bridge', 1), ('bridge', 'r0', 1)]
+    return _graph(edges)
+
+
+def test_sampling_finds_bridge_within_bound():
+    snap = _barbell().freeze()
+    exact = approximate_betweenness(snap, samples=snap.num_nodes).scores
+    estimate = approximate_betweenness(snap, samples=40, seed=3)
+    assert estimate.samples == 40
+    assert np.abs(estimate.scores - exact).max() <= estimate.error_bound
+    assert estimate.top(1)[0][0] in {'bridge', 'l0', 'r0'}
+
+
+def test_iter_betweenness_yields_per_batch_and_respects_budget():
+    snap = _barbell().freeze()
+    steps = list(iter_betweenness(snap, samples=32, batch_size=8))
+    assert [r.samples for r in steps] == [8, 16, 24, 32]
+    assert steps[0].error_bound > steps[-1].error_bound
+    assert approximate_betweenness(snap, samples=32, time_budget=0.0).samples == 0
+    assert samples_for(10_000, 0.05) > samples_for(10_000, 0.1)
+
+
+def test_process_pool_matches_inline():
+    snap = _barbell().freeze()
+    inline = approximate_betweenness(snap, samples=24)
+    pooled = approximate_betweenness(snap, samples=24, workers=2)
+    assert pooled.samples == 24
+    assert np.allclose(inline.scores, pooled.scores)
+
+
+def test_priority_orders_walk_and_sprint_plan():
+    g = _graph([('s', 'a', 1), ('s', 'b', 1), ('s', 'c', 1)])
+    priority = {'c': 3.0, 'a': 1.0}
+    walked = [n.id for n in g.spiral_walk('s', 1, max_nodes=2, priority=priority)]
+    assert walked == ['s', 'c']
+    assert sprint_plan(g, priority)[:2] == ['c', 'a']
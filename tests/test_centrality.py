@@ -0,0 +1,100 @@
+import random
+
+import numpy as np
+
+from hyperhelix.analytics.centrality import (
+    CentralityEngine,
+    eigenvector_centrality,
+    pagerank,
+)
+from hyperhelix.core import HyperHelix
+from hyperhelix.evolution.continuous_engine import MetricsScheduler
+from hyperhelix.node import Node
+
+
+def _graph(edges, extra=()) -> HyperHelix:
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    ids = sorted({x for a, b, _ in edges for x in (a, b)} | set(extra))
+    for node_id in ids:
+        g.add_node(Node(id=node_id, payload=None))
+    for a, b, w in edges:
+        g.add_edge(a, b, w)
+    return g
+
+
+def _dense_pagerank(snapshot, damping=0.85):
+    n = snapshot.num_nodes
+    adj = np.zeros((n, n))
+    adj[snapshot.rows(), snapshot.neighbors] = snapshot.weights
+    transition = adj / adj.sum(axis=1, keepdims=True)
+    return np.linalg.solve(np.eye(n) - damping * transition.T, np.full(n, (1 - damping) / n))
+
+
+def test_pagerank_matches_dense_solution():
+    g = _graph([('a', 'b', 1), ('b', 'c', 2), ('a', 'c', 5), ('c', 'd', 1)])
+    snap = g.freeze()
+    result = pagerank(snap, tol=1e-12, max_iter=500)
+    assert result.converged
+    assert np.allclose(result.scores, _dense_pagerank(snap), atol=1e-9)
+    assert abs(result.scores.sum() - 1) < 1e-9
+
+
+def test_pagerank_spreads_isolated_node_mass():
+    g = _graph([('a', 'b', 1), ('b', 'c', 1)], extra=['z'])
+    scores = pagerank(g.freeze(), tol=1e-12, max_iter=500).as_dict()
+    assert abs(sum(scores.values()) - 1) < 1e-9
+    assert scores['b'] > scores['a'] > scores['z'] > 0
+
+
+def test_eigenvector_centrality_ranks_star_centre_first():
+    g = _graph([('hub', leaf, 1) for leaf in 'abcd'])
+    result = eigenvector_centrality(g.freeze(), tol=1e-10, max_iter=500)
+    scores = result.as_dict()
+    assert result.converged
+    assert abs(np.linalg.norm(result.scores) - 1) < 1e-9
+    assert scores['hub'] > scores['a'] == scores['d']
+
+
+def test_engine_warm_starts_and_writes_importance():
+    rng = random.Random(0)
+    edges = [(f'n{rng.randrange(500)}', f'n{rng.randrange(500)}', rng.choice([1, 2, 3])) for _ in range(2000)]
+    g = _graph(edges)
+    engine = CentralityEngine(g, tol=1e-10, max_iter=500)
+    cold = engine.update()
+    assert g.nodes['n0'].metadata.importance == cold.as_dict()['n0']
+
+    for i in range(3):
+        g.add_edge(f'n{i}', f'n{i + 10}', 2)
+    warm = engine.update()
+    fresh = pagerank(g.freeze(), tol=1e-10, max_iter=500)
+    assert warm.iterations < fresh.iterations
+    assert np.allclose(warm.scores, fresh.scores, atol=1e-8)
+
+    g.add_node(Node(id='new', payload=None))
+    g.add_edge('new', 'n1', 1)
+    assert np.allclose(engine.update().scores, pagerank(g.freeze(), tol=1e-10, max_iter=500).scores, atol=1e-8)
+
+
+def test_scheduler_uses_centrality_engine():
+    g = _graph([('a', 'b', 1), ('b', 'c', 1)])
+    scheduler = MetricsScheduler(g, centrality=CentralityEngine.from_config(g, {}))
+    stats = scheduler.tick()
+    assert stats.centrality_iterations > 0
+    assert g.nodes['b'].metadata.importance > g.nodes['a'].metadata.importance
+    assert scheduler.tick().centrality_iterations == 0
+
+
+def test_insert_hooks_leave_centrality_importance_alone():
+    g = HyperHelix()
+    g.add_nodes(Node(id=i, payload=None, tags=['t']) for i in 'abc')
+    assert g.nodes['a'].metadata.importance == 2.0
+    engine = CentralityEngine(g)
+    engine.update()
+    assert g.importance_engine is engine
+    g.add_node(Node(id='d', payload=None, tags=['t']))
+    assert g.nodes['d'].metadata.importance == 0.0
+    assert g.nodes['a'].metadata.importance < 1.0
+    assert g.top_nodes_by_importance(1)[0].id != 'd'
+    engine.update()
+    assert np.isclose(sum(n.metadata.importance for n in g.nodes.values()), 1.0)
@@ -0,0 +1,62 @@
+import random
+
+import numpy as np
+import pytest
+
+from hyperhelix.analytics import communities
+from hyperhelix.analytics.communities import assign_strands, label_propagation, louvain, modularity
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def _planted(groups: int = 6, size: int = 30, seed: int = 0) -> HyperHelix:
+    rng = random.Random(seed)
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    for i in range(groups * size):
+        g.add_node(Node(id=f'n{i}', payload=None))
+    for _ in range(groups * size * 6):
+        base = rng.randrange(groups) * size
+        g.add_edge(f'n{base + rng.randrange(size)}', f'n{base + rng.randrange(size)}')
+    for _ in range(groups * 3):
+        g.add_edge(f'n{rng.randrange(groups * size)}', f'n{rng.randrange(groups * size)}')
+    return g
+
+
+def _planted_labels(snapshot, size: int = 30) -> np.ndarray:
+    return np.array([int(node_id[1:]) // size for node_id in snapshot.ids])
+
+
+@pytest.mark.parametrize('detect', [label_propagation, louvain])
+def test_detects_planted_communities(detect):
+    snap = _planted().freeze()
+    result = detect(snap)
+    assert result.count == 6
+    assert abs(result.modularity - modularity(snap, _planted_labels(snap))) < 1e-9
+    assert sorted(len(group) for group in result.groups()) == [30] * 6
+
+
+def test_process_pool_matches_planted_partition(monkeypatch):
+    monkeypatch.setattr(communities, 'PARALLEL_MIN_EDGES', 0)
+    snap = _planted().freeze()
+    assert louvain(snap, workers=2).count == 6
+    assert label_propagation(snap, workers=2).count == 6
+
+
+def test_louvain_keeps_singletons_apart():
+    g = HyperHelix()
+    for node_id in 'xyz':
+        g.add_node(Node(id=node_id, payload=None))
+    result = louvain(g.freeze())
+    assert result.count == 3
+    assert result.modularity == 0.0
+
+
+def test_assign_strands_moves_nodes_by_community():
+    g = _planted(groups=2)
+    result = louvain(g.freeze())
+    assert assign_strands(g, result) == 60
+    assert assign_strands(g, result) == 0
+    strands = g.group_by_strand()
+    assert sorted(len(ids) for ids in strands.values()) == [30, 30]
+    assert set(strands) == {'community-0', 'community-1'}
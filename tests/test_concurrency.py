@@ -0,0 +1,84 @@
+import random
+import threading
+
+import pytest
+
+from hyperhelix.concurrency import RWLock
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def test_rwlock_reentrancy_and_upgrade_refused():
+    lock = RWLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+    with lock.write():
+        pass
+
+
+def test_rwlock_readers_share_writers_exclude():
+    lock = RWLock()
+    inside = threading.Barrier(2, timeout=5)
+
+    def reader():
+        with lock.read():
+            inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert not any(t.is_alive() for t in threads)
+
+
+def test_mixed_workload_stress():
+    g = HyperHelix()
+    g.add_nodes(Node(id=str(i), payload=None, tags=[f"t{i % 5}"]) for i in range(200))
+    errors = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        try:
+            for _ in range(300):
+                a, b = str(rng.randrange(300)), str(rng.randrange(300))
+                op = rng.random()
+                try:
+                    if op < 0.3:
+                        g.add_edge(a, b, rng.random())
+                    elif op < 0.4:
+                        g.remove_node(a)
+                    elif op < 0.5:
+                        g.add_node(Node(id=a, payload=None, tags=[f"t{seed}"]))
+                    elif op < 0.6:
+                        g.remove_edge(a, b)
+                    elif op < 0.7:
+                        list(g.spiral_walk(a, depth=2))
+                    elif op < 0.8:
+                        g.shortest_path(a, b, method="bidirectional")
+                    elif op < 0.9:
+                        g.find_nodes_by_tag(f"t{seed % 5}")
+                    else:
+                        with g.read_lock():
+                            sum(len(n.edges) for n in g.nodes.values())
+                        g.freeze()
+                except KeyError:
+                    pass
+        except Exception as exc:  # pragma: no cover - failure reporting
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(60)
+    assert not errors
+    for node_id, node in g.nodes.items():
+        for other, weight in node.edges.items():
+            assert g.nodes[other].edges[node_id] == weight
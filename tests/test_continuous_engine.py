@@ -1,3 +1,4 @@
+import time
 from unittest.mock import patch
 
 from hyperhelix.core import HyperHelix
@@ -30,17 +31,124 @@ def test_run_periodically(monkeypatch):
         captured['target'] = target
         return DummyThread(target, daemon)
 
-    def fake_permanence(node):
-        node.metadata.permanence = 1.0
+    def fake_importance(node, all_nodes):
+        node.metadata.importance = 1.0
         raise StopIteration
 
     with patch('hyperhelix.evolution.continuous_engine.threading.Thread', fake_thread), \
          patch('hyperhelix.evolution.continuous_engine.time.sleep', lambda x: None), \
-         patch('hyperhelix.evolution.continuous_engine.compute_permanence', fake_permanence):
+         patch('hyperhelix.evolution.continuous_engine.compute_importance', fake_importance):
         thread = continuous_engine.run_periodically(graph, 0.0)
         assert isinstance(thread, DummyThread)
         try:
             captured['target']()
         except StopIteration:
             pass
-        assert n.metadata.permanence == 1.0
+        assert n.metadata.importance == 1.0
+
+
+def test_scheduler_recomputes_dirty_nodes_and_refreshes_the_rest():
+    graph = HyperHelix()
+    graph._insert_hooks.clear()
+    for i in range(20):
+        graph.add_node(Node(id=str(i), payload=None))
+    scheduler = continuous_engine.MetricsScheduler(graph, interval=60.0, refresh_batch=9)
+    graph.add_edge('0', '1')
+
+    stats = scheduler.tick()
+    assert stats.dirty == 2
+    assert stats.touched == stats.dirty + stats.refreshed
+    assert graph.nodes['0'].metadata.importance == 1
+    assert scheduler.last_tick is stats
+
+    # The dirty nodes were also in the first refresh slice; two more cover the rest.
+    assert stats.refreshed == 7
+    assert scheduler.tick().refreshed + scheduler.tick().refreshed == 11
+
+    graph.add_node(Node(id='new', payload=None))
+    graph.remove_node('new')
+    assert scheduler.tick().dirty == 0
+
+
+def test_scheduler_start_pause_stop():
+    graph = HyperHelix()
+    graph.add_node(Node(id='a', payload=None))
+    scheduler = continuous_engine.MetricsScheduler(graph, interval=60.0)
+    scheduler.start()
+    scheduler.set_interval(0.01)
+    deadline = time.time() + 5
+    while scheduler.ticks == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert scheduler.ticks > 0
+
+    scheduler.pause()
+    time.sleep(0.05)
+    ticks = scheduler.ticks
+    time.sleep(0.05)
+    assert scheduler.ticks == ticks
+
+    scheduler.resume()
+    scheduler.stop(timeout=5)
+    ticks = scheduler.ticks
+    time.sleep(0.05)
+    assert scheduler.ticks == ticks
+
+
+def test_scheduler_switches_to_vectorised_pass_when_mostly_dirty():
+    graph = HyperHelix()
+    graph._insert_hooks.clear()
+    scheduler = continuous_engine.MetricsScheduler(graph, refresh_batch=1)
+    for i in range(8):
+        graph.add_node(Node(id=str(i), payload=None))
+    graph.add_edge('0', '1', 2.5)
+    stats = scheduler.tick()
+    assert stats.dirty == 8 and stats.refreshed == 0
+    assert scheduler.table.row('0')['weighted_degree'] == 2.5
+    assert graph.nodes['1'].metadata.importance == 1.0
+
+
+def test_scheduler_marks_neighbours_of_removed_nodes_dirty():
+    graph = HyperHelix()
+    graph._insert_hooks.clear()
+    for i in range(20):
+        graph.add_node(Node(id=str(i), payload=None))
+    graph.add_edge('0', '1')
+    graph.add_edge('0', '0')
+    scheduler = continuous_engine.MetricsScheduler(graph, interval=60.0, refresh_batch=1)
+    scheduler.tick()
+    graph.set_importance('1', 1.0)
+
+    graph.remove_node('0')
+    stats = scheduler.tick()
+    assert stats.dirty == 1
+    assert graph.nodes['1'].metadata.importance == 0
+    assert [n.id for n in graph.nodes_above_importance(1.0)] == []
+
+
+def test_scheduler_survives_failing_tick_and_unhooks_on_stop(monkeypatch):
+    graph = HyperHelix()
+    hooks = (len(graph._insert_hooks), len(graph._edge_hooks), len(graph._remove_hooks))
+    scheduler = continuous_engine.MetricsScheduler(graph, interval=0.01)
+    calls = []
+    real_tick = scheduler.tick
+
+    def flaky_tick():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError('boom')
+        return real_tick()
+
+    monkeypatch.setattr(scheduler, 'tick', flaky_tick)
+    scheduler.start()
+    deadline = time.time() + 5
+    while scheduler.ticks == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(calls) > 1 and scheduler.ticks > 0
+    scheduler.stop(timeout=5)
+    assert (len(graph._insert_hooks), len(graph._edge_hooks), len(graph._remove_hooks)) == hooks
+    assert not graph._batch_hooks.get(scheduler._on_node)
+
+    scheduler.start()
+    graph.add_node(Node(id='a', payload=None))
+    assert scheduler._dirty == {'a': None}
+    scheduler.stop(timeout=5)
@@ -53,3 +53,56 @@ def test_graph_adapter_connections():
     g.add_edge('a', 'b', 2.0)
     assert adapter.load_node('a') == {}
     assert adapter.load_edges('a')['b'] == 2.0
+
+
+def test_remove_node_clears_neighbour_edges():
+    g = HyperHelix()
+    for node_id in 'abc':
+        g.add_node(Node(id=node_id, payload=None))
+    g.add_edge('a', 'b')
+    g.add_edge('b', 'c')
+    g.remove_node('b')
+    assert 'b' not in g.nodes
+    assert g.nodes['a'].edges == {}
+    assert g.nodes['c'].edges == {}
+
+
+def test_remove_nodes_bulk_single_adapter_call():
+    adapter = Neo4jAdapter()
+    calls = []
+    original = adapter.remove_nodes
+    adapter.remove_nodes = lambda ids: (calls.append(list(ids)), original(ids))
+    g = HyperHelix(adapter=adapter)
+    for node_id in 'abcd':
+        g.add_node(Node(id=node_id, payload={}))
+    g.add_edge('a', 'b')
+    g.add_edge('c', 'd')
+    g.remove_nodes(['a', 'c', 'a'])
+    assert set(g.nodes) == {'b', 'd'}
+    assert g.nodes['b'].edges == {} and g.nodes['d'].edges == {}
+    assert calls == [['a', 'c']]
+    assert adapter.load_edges('b') == {}
+    with pytest.raises(KeyError):
+        g.remove_nodes(['b', 'missing'])
+    assert 'b' in g.nodes
+
+
+def test_readding_node_keeps_edges_symmetric():
+    g = HyperHelix()
+    for node_id in 'ab':
+        g.add_node(Node(id=node_id, payload=None))
+    g.add_edge('a', 'b')
+    g.add_node(Node(id='a', payload=None))
+    assert g.nodes['a'].edges == {}
+    assert g.nodes['b'].edges == {}
+
+
+def test_readding_node_with_self_loop():
+    g = HyperHelix()
+    for node_id in 'ab':
+        g.add_node(Node(id=node_id, payload=None))
+    g.add_edge('a', 'a')
+    g.add_edge('a', 'b')
+    g.add_node(Node(id='a', payload=None))
+    assert g.nodes['a'].edges == {}
+    assert g.nodes['b'].edges == {}
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from hyperhelix.analytics.importance import compute_importance_array
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def _graph() -> HyperHelix:
+    g = HyperHelix()
+    for node_id in 'abcd':
+        g.add_node(Node(id=node_id, payload=None))
+    g.add_edge('a', 'b', 1)
+    g.add_edge('b', 'c', 2)
+    g.add_edge('a', 'c', 5)
+    return g
+
+
+def test_freeze_builds_csr_arrays():
+    g = _graph()
+    snap = g.freeze()
+    assert snap.num_nodes == 4 and snap.num_edges == 3
+    assert snap.ids[snap.index['c']] == 'c'
+    assert snap.degree().tolist() == [2, 2, 2, 0]
+    assert snap.weighted_degree().tolist() == [6.0, 3.0, 7.0, 0.0]
+    nbrs, weights = snap.neighbors_of(snap.index['a'])
+    assert {snap.ids[i]: w for i, w in zip(nbrs, weights)} == {'b': 1.0, 'c': 5.0}
+    with pytest.raises(ValueError):
+        snap.weights[0] = 3.0
+
+
+def test_freeze_is_cached_until_mutation():
+    g = _graph()
+    snap = g.freeze()
+    assert g.freeze() is snap
+    g.add_edge('c', 'd')
+    fresh = g.freeze()
+    assert fresh is not snap and fresh.num_edges == 4
+    assert snap.num_edges == 3
+
+
+def test_csr_walk_path_and_analytics_match_graph():
+    g = _graph()
+    expected = g.shortest_path('a', 'c')
+    g.nodes['a'].edges['ghost'] = 1.0
+    g.touch()
+    snap = g.freeze()
+    assert snap.num_edges == 3
+    assert snap.shortest_path('a', 'c') == expected == ['a', 'b', 'c']
+    assert snap.shortest_path('a', 'd') == []
+    assert set(snap.spiral_walk('a', depth=1)) == {'a', 'b', 'c'}
+    assert snap.spiral_walk('d', depth=3) == ['d']
+    assert np.array_equal(compute_importance_array(snap), [2.0, 2.0, 2.0, 0.0])
+    with pytest.raises(KeyError):
+        snap.spiral_walk('missing')
+
+
+def test_incremental_freeze_matches_full_build():
+    from hyperhelix.csr import CSRGraph
+
+    g = HyperHelix()
+    g.add_nodes(Node(id=str(i), payload=None) for i in range(20))
+    for i in range(19):
+        g.add_edge(str(i), str(i + 1), float(i))
+    g.freeze()
+    g.add_node(Node(id='new', payload=None))
+    g.add_edge('new', '3', 7.0)
+    g.remove_edge('10', '11')
+    patched = g.freeze()
+    full = CSRGraph.from_graph(g)
+    assert patched.ids == full.ids
+    assert np.array_equal(patched.offsets, full.offsets)
+    for i in range(full.num_nodes):
+        got = dict(zip(*map(np.ndarray.tolist, patched.neighbors_of(i))))
+        want = dict(zip(*map(np.ndarray.tolist, full.neighbors_of(i))))
+        assert got == want
+    g.remove_node('new')
+    assert g.freeze().num_nodes == 20
@@ -0,0 +1,79 @@
+import threading
+import time
+
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+from hyperhelix.execution.dispatcher import HookDispatcher
+from hyperhelix.execution.executor import execute_node
+
+
+def test_dispatcher_coalesces_while_busy():
+    gate = threading.Event()
+    calls = []
+
+    def handler(kind, node_ids):
+        if node_ids == ['gate']:
+            gate.wait(5)
+        calls.append((kind, list(node_ids)))
+
+    dispatcher = HookDispatcher(workers=1)
+    dispatcher.start(handler)
+    dispatcher.submit('insert', ['gate'])
+    for _ in range(3):
+        dispatcher.submit('update', ['x'])
+    dispatcher.submit('insert', ['x'])
+    gate.set()
+    assert dispatcher.flush(5)
+    assert calls == [('insert', ['gate']), ('update', ['x']), ('insert', ['x'])]
+    assert dispatcher.coalesced == 2
+    dispatcher.close()
+
+
+def test_dispatcher_keeps_per_node_order():
+    seen = {}
+    busy = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def handler(kind, node_ids):
+        with lock:
+            overlaps.extend(n for n in node_ids if n in busy)
+            busy.update(node_ids)
+        time.sleep(0.001)
+        with lock:
+            for node_id in node_ids:
+                seen.setdefault(node_id, []).append(kind)
+            busy.difference_update(node_ids)
+
+    dispatcher = HookDispatcher(workers=4, batch_size=8)
+    dispatcher.start(handler)
+    for i in range(200):
+        dispatcher.submit('insert', [f'n{i % 50}'])
+        dispatcher.submit('update', [f'n{i % 50}'])
+    assert dispatcher.flush(10)
+    dispatcher.close()
+    assert not overlaps
+    for kinds in seen.values():
+        assert kinds[0] == 'insert'
+        assert all(a != b for a, b in zip(kinds, kinds[1:]))
+
+
+def test_graph_hooks_run_on_dispatcher():
+    dispatcher = HookDispatcher(workers=2)
+    g = HyperHelix(dispatcher=dispatcher)
+    inserted = []
+    updated = []
+    g.register_insert_hook(lambda _g, node_id: (time.sleep(0.2), inserted.append(node_id)))
+    g.register_update_hook(lambda _g, node_id: updated.append(node_id))
+
+    g.add_node(Node(id='a', payload=None, tags=['t']))
+    assert inserted == []
+    assert dispatcher.flush(5)
+    assert inserted == ['a']
+
+    g.add_node(Node(id='b', payload=None, tags=['t'], execute_fn=lambda x: x))
+    execute_node(g, 'b')
+    assert dispatcher.flush(5)
+    assert 'b' in g.nodes['a'].edges
+    assert inserted == ['a', 'b'] and updated == ['b']
+    dispatcher.close()
@@ -0,0 +1,87 @@
+from hyperhelix.core import HyperHelix
+from hyperhelix.distance_oracle import DistanceOracle
+from hyperhelix.node import Node
+
+
+def _line(n: int) -> HyperHelix:
+    g = HyperHelix()
+    g.add_nodes(Node(id=str(i), payload=None) for i in range(n))
+    for i in range(n - 1):
+        g.add_edge(str(i), str(i + 1))
+    return g
+
+
+def test_cache_hits_and_reverse_lookup():
+    g = _line(5)
+    oracle = DistanceOracle(g, landmarks=2)
+    assert oracle.shortest_path('0', '4') == ['0', '1', '2', '3', '4']
+    assert oracle.shortest_path('4', '0') == ['4', '3', '2', '1', '0']
+    stats = oracle.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.landmark_builds == 1
+    assert stats.hit_rate == 0.5
+
+
+def test_add_edge_invalidates_only_shortened_paths():
+    g = _line(8)
+    g.add_node(Node(id='x', payload=None))
+    g.add_node(Node(id='y', payload=None))
+    g.add_edge('7', 'x')
+    oracle = DistanceOracle(g, landmarks=3)
+    oracle.shortest_path('0', '3')
+    oracle.shortest_path('0', '7')
+    g.add_edge('x', 'y', 5.0)
+    assert oracle.stats().size == 2
+    oracle.refresh_landmarks()
+    g.add_edge('0', '6', 1.0)
+    assert oracle.stats().size == 1
+    assert oracle.shortest_path('0', '7') == ['0', '6', '7']
+
+
+def test_remove_edge_and_node_drop_dependent_paths():
+    g = _line(4)
+    g.add_node(Node(id='z', payload=None))
+    g.add_edge('z', '0')
+    oracle = DistanceOracle(g)
+    oracle.shortest_path('0', '3')
+    oracle.shortest_path('z', '0')
+    g.remove_edge('1', '2')
+    assert oracle.stats().size == 1
+    assert oracle.shortest_path('0', '3') == []
+    g.remove_node('z')
+    assert oracle.stats().size == 1
+    assert oracle.stats().invalidations == 2
+
+
+def test_mutations_keep_landmark_bounds_and_unrelated_paths():
+    g = _line(8)
+    oracle = DistanceOracle(g, landmarks=2)
+    oracle.refresh_landmarks()
+    oracle.shortest_path('0', '2')
+    g.add_node(Node(id='x', payload=None))
+    g.add_edge('5', 'x')
+    g.add_edge('x', '7', 0.5)
+    g.remove_edge('3', '4')
+    g.remove_node('6')
+    g.add_node(Node(id='6', payload=None))
+    g.add_edge('6', '0')
+    assert oracle.stats().size == 1
+    assert oracle.stats().landmark_builds == 1
+    assert oracle.lower_bound('0', '2') > 0
+    for a in g.nodes:
+        for b in g.nodes:
+            result = g.find_path(a, b)
+            if result.path:
+                assert oracle.lower_bound(a, b) <= result.cost, (a, b)
+    assert oracle.shortest_path('6', '2') == ['6', '0', '1', '2']
+
+
+def test_enable_distance_oracle_routes_graph_queries():
+    g = _line(5)
+    oracle = g.enable_distance_oracle(landmarks=2)
+    assert g.enable_distance_oracle() is oracle
+    assert g.shortest_path('0', '4') == ['0', '1', '2', '3', '4']
+    assert g.shortest_path('4', '0', method='astar') == ['4', '3', '2', '1', '0']
+    assert (oracle.stats().hits, oracle.stats().misses) == (1, 1)
+    g.find_path('0', '4', cached=False)
+    assert oracle.stats().hits == 1
@@ -39,3 +39,93 @@ def test_on_update_invokes_prune():
     g.add_node(n)
     evented_engine.on_update(g, 'a')
     assert n.metadata.permanence >= 0
+
+
+def test_prune_node_edges_is_local():
+    g = HyperHelix()
+    for node_id in "abc":
+        g.add_node(Node(id=node_id, payload=None))
+    g.add_edge("a", "b")
+    g.add_edge("b", "c")
+    del g.nodes["c"]
+    stats = evented_engine.prune_node_edges(g, ["a"])
+    assert stats.edges_scanned == 1 and stats.edges_removed == 0
+    stats = evented_engine.prune_node_edges(g, ["b"])
+    assert stats.edges_scanned == 2 and stats.edges_removed == 1
+    assert "c" not in g.nodes["b"].edges
+
+
+def test_prune_invalidates_only_pruned_nodes():
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    for node_id in "abc":
+        g.add_node(Node(id=node_id, payload=None))
+    g.add_edge("a", "b")
+    g.nodes["c"].edges["ghost"] = 1.0
+    first = g.snapshot()
+    evented_engine.prune_node_edges(g, ["c"])
+    second = g.snapshot()
+    assert second.nodes["a"] is first.nodes["a"]
+    assert second.nodes["c"].edges == {}
+
+
+def test_insert_prunes_only_new_node_edges():
+    g = HyperHelix()
+    g.add_node(Node(id="a", payload=None))
+    g.add_node(Node(id="b", payload=None))
+    g.add_edge("a", "b")
+    g.nodes["a"].edges["ghost"] = 1.0
+    g.add_node(Node(id="n", payload=None, edges={"gone": 1.0}))
+    assert g.nodes["n"].edges == {}
+    assert "ghost" in g.nodes["a"].edges
+    stats = evented_engine.prune_missing_edges(g)
+    assert stats.nodes_visited == 3 and stats.edges_removed == 1
+
+
+def _weave_graph(config, count=10):
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    for i in range(count):
+        g.add_node(Node(id=f"n{i}", payload=None, tags=["pop"]))
+        evented_engine.weave_by_tag(g, f"n{i}", config)
+    return g
+
+
+def test_weave_capped_links_recent_peers():
+    config = evented_engine.WeaveConfig(strategy="capped", max_per_tag=3)
+    g = _weave_graph(config)
+    assert set(g.nodes["n9"].edges) == {"n6", "n7", "n8"}
+    assert max(len(n.edges) for n in g.nodes.values()) <= 6
+    assert sum(len(n.edges) for n in g.nodes.values()) // 2 == 24
+
+
+def test_weave_hub_and_all_strategies():
+    g = _weave_graph(evented_engine.WeaveConfig(strategy="hub"), count=4)
+    assert g.nodes["tag:pop"].strand == "hub"
+    assert set(g.nodes["tag:pop"].edges) == {"n0", "n1", "n2", "n3"}
+    assert g.nodes["n3"].edges == {"tag:pop": 1.0}
+    g = _weave_graph(evented_engine.WeaveConfig(strategy="all"), count=4)
+    assert sum(len(n.edges) for n in g.nodes.values()) // 2 == 6
+    with pytest.raises(ValueError):
+        _weave_graph(evented_engine.WeaveConfig(strategy="nope"), count=1)
+
+
+def test_weave_all_links_in_tag_insertion_order():
+    g = HyperHelix()
+    for i, tags in enumerate([["b"], ["a"], ["a", "b"], ["c"], ["b", "a"]]):
+        g.add_node(Node(id=f"n{i}", payload=None, tags=tags))
+    linked = []
+    g.register_edge_hook(lambda _g, a, b, weight: linked.append(b))
+    g.add_node(Node(id="new", payload=None, tags=["a", "b"]))
+    assert linked == ["n1", "n2", "n4", "n0"]
+    assert [n.id for n in g.find_nodes_by_tags(["b", "a"])] == ["n2", "n4", "new"]
+
+
+def test_weave_config_from_yaml(tmp_path):
+    from hyperhelix.utils import load_config
+
+    path = tmp_path / "cfg.yaml"
+    path.write_text("weave:\n  strategy: hub\n  max_per_tag: 2\n  unknown: 1\n")
+    config = evented_engine.WeaveConfig.from_config(load_config(path))
+    assert config == evented_engine.WeaveConfig(strategy="hub", max_per_tag=2)
+    assert evented_engine.default_weave_config().strategy == "all"
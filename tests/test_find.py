@@ -1,3 +1,5 @@
+import pytest
+
 from hyperhelix.core import HyperHelix
 from hyperhelix.node import Node
 
@@ -9,3 +11,108 @@ def test_find_nodes_by_tag():
     res = g.find_nodes_by_tag("x")
     ids = {n.id for n in res}
     assert ids == {"a", "b"}
+
+
+def test_find_nodes_by_tags_and_or():
+    g = HyperHelix()
+    g.add_node(Node(id="a", payload=None, tags=["x"]))
+    g.add_node(Node(id="b", payload=None, tags=["x", "y"]))
+    g.add_node(Node(id="c", payload=None, tags=["z"]))
+    assert {n.id for n in g.find_nodes_by_tags(["x", "y"])} == {"b"}
+    assert {n.id for n in g.find_nodes_by_tags(["y", "z"], match_all=False)} == {"b", "c"}
+    assert g.find_nodes_by_tags(["x", "missing"]) == []
+
+
+def test_tag_index_follows_mutations():
+    g = HyperHelix()
+    g.add_node(Node(id="a", payload=None, tags=["x"]))
+    g.add_tag("a", "y")
+    assert [n.id for n in g.find_nodes_by_tag("y")] == ["a"]
+    g.remove_tag("a", "x")
+    assert g.find_nodes_by_tag("x") == []
+    assert g.nodes["a"].tags == ["y"]
+    g.remove_node("a")
+    assert g.find_nodes_by_tag("y") == []
+
+
+def test_find_nodes_by_strand_and_layer():
+    g = HyperHelix()
+    g.add_node(Node(id='a', payload=None, strand='x', layer=1))
+    g.add_node(Node(id='b', payload=None, strand='x', layer=3))
+    g.add_node(Node(id='c', payload=None, strand='y', layer=2))
+    g.add_node(Node(id='d', payload=None, layer=5))
+    assert [n.id for n in g.find_nodes(layer_min=2, layer_max=3)] == ['c', 'b']
+    assert {n.id for n in g.find_nodes(strand='x')} == {'a', 'b'}
+    assert [n.id for n in g.find_nodes(strand='x', layer_min=2)] == ['b']
+    assert [n.id for n in g.find_nodes(layer_max=1)] == ['a']
+
+    g.set_layer('a', 4)
+    g.set_strand('c', 'x')
+    g.remove_node('b')
+    assert {n.id for n in g.find_nodes(strand='x')} == {'a', 'c'}
+    assert {layer: [n.id for n in nodes] for layer, nodes in g.group_by_layer().items()} == {
+        2: ['c'], 4: ['a'], 5: ['d']
+    }
+    assert sorted(g.group_by_strand()) == ['default', 'x']
+    with pytest.raises(KeyError):
+        g.set_layer('missing', 1)
+
+
+def test_spiral_walk_prunes_by_strand_index():
+    g = HyperHelix()
+    for node_id, strand in (('a', 's'), ('b', 's'), ('c', 't'), ('d', 's')):
+        g.add_node(Node(id=node_id, payload=None, strand=strand))
+    g.add_edge('a', 'b')
+    g.add_edge('a', 'c')
+    g.add_edge('c', 'd')
+    assert [n.id for n in g.spiral_walk('a', depth=3, strand='s')] == ['a', 'b']
+    g.set_strand('c', 's')
+    assert [n.id for n in g.spiral_walk('a', depth=3, strand='s')] == ['a', 'b', 'c', 'd']
+
+
+def test_rank_index_matches_sorted_order():
+    import random
+
+    from hyperhelix.indexes import RankIndex
+
+    rng = random.Random(0)
+    index = RankIndex(load=4)
+    expected = {}
+    for step in range(600):
+        node_id = f"n{rng.randrange(80)}"
+        if step % 7 == 0:
+            index.discard(node_id)
+            expected.pop(node_id, None)
+        else:
+            score = float(rng.randrange(20))
+            index.set(node_id, score)
+            expected[node_id] = score
+    index.update([(f"n{i}", float(i % 5)) for i in range(0, 80, 3)])
+    expected.update({f"n{i}": float(i % 5) for i in range(0, 80, 3)})
+    ranking = sorted(expected.items(), key=lambda item: (-item[1], item[0]))
+    assert index.top(10) == ranking[:10]
+    assert index.top(len(ranking) + 5) == ranking
+    for position, (node_id, _) in enumerate(ranking):
+        assert index.rank(node_id) == position
+    for threshold in (-1.0, 0.0, 2.5, 4.0, 19.0, 100.0):
+        above = [item for item in ranking if item[1] >= threshold]
+        assert index.count_at_least(threshold) == len(above)
+        assert index.at_least(threshold, 3) == above[:3]
+
+
+def test_importance_ranking_follows_graph():
+    g = HyperHelix()
+    for node_id in "abcd":
+        g.add_node(Node(id=node_id, payload={}))
+    g.set_importance("a", 0.2)
+    g.set_importances([("b", 0.9), ("c", 0.5), ("missing", 1.0)])
+    assert [n.id for n in g.top_nodes_by_importance(2)] == ["b", "c"]
+    assert g.importance_rank("a") == 2
+    assert [n.id for n in g.nodes_above_importance(0.5)] == ["b", "c"]
+    assert g.count_above_importance(0.1) == 3
+    g.remove_node("b")
+    assert [n.id for n in g.top_nodes_by_importance(1)] == ["c"]
+    with pytest.raises(KeyError):
+        g.importance_rank("b")
+    g.set_importance("a", 2.0)
+    assert g.importance_rank("a") == 0
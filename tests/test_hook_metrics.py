@@ -0,0 +1,47 @@
+import pytest
+
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+from hyperhelix.execution.executor import execute_node
+from hyperhelix.execution.hook_metrics import HookStats
+
+
+def test_hook_metrics_track_calls_and_failures():
+    g = HyperHelix()
+    assert g.hook_metrics is None
+    metrics = g.enable_hook_metrics()
+
+    def flaky(_g, node_id):
+        if node_id == 'bad':
+            raise ValueError('nope')
+
+    g.register_insert_hook(flaky)
+    g.register_update_hook(lambda _g, _id: None)
+    g.add_node(Node(id='a', payload=None, execute_fn=lambda x: x))
+    with pytest.raises(ValueError):
+        g.add_node(Node(id='bad', payload=None))
+    g.add_nodes([Node(id='b', payload=None), Node(id='c', payload=None)])
+    execute_node(g, 'a')
+
+    by_name = {s.name.rsplit('.', 1)[-1]: s for s in metrics.stats()}
+    assert by_name['flaky'].calls == 4
+    assert by_name['flaky'].failures == 1
+    assert by_name['flaky'].last_error == 'ValueError: nope'
+    assert by_name['on_insert'].calls == 2
+    assert by_name['on_insert_batch'].calls == 1
+    assert by_name['<lambda>'].kind == 'update'
+
+    g.disable_hook_metrics()
+    g.add_node(Node(id='d', payload=None))
+    assert [s.calls for s in metrics.stats() if s.name.endswith('flaky')] == [4]
+
+
+def test_hook_stats_percentiles():
+    stats = HookStats('h', 'insert')
+    for _ in range(98):
+        stats.record(0.0001)
+    stats.record(0.05)
+    stats.record(0.2)
+    assert stats.percentile(0.5) <= 0.0002
+    assert 0.05 <= stats.percentile(0.99) <= 0.2
+    assert stats.as_dict()['max_ms'] == pytest.approx(200.0)
@@ -0,0 +1,40 @@
+import time
+
+from hyperhelix.analytics.metrics import compute_metrics, write_importance
+from hyperhelix.core import HyperHelix
+from hyperhelix.metadata import NodeMetadata
+from hyperhelix.node import Node
+
+
+def _graph() -> HyperHelix:
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    now = time.time()
+    for i, node_id in enumerate('abcd'):
+        g.add_node(Node(id=node_id, payload=None, metadata=NodeMetadata(created_ts=now - 10 * (i + 1))))
+    g.add_edge('a', 'b', 1)
+    g.add_edge('b', 'c', 2)
+    g.add_edge('a', 'c', 5)
+    return g
+
+
+def test_metrics_table_columns_match_per_node_values():
+    g = _graph()
+    table = compute_metrics(g)
+    for node_id, node in g.nodes.items():
+        row = table.row(node_id)
+        assert row['degree'] == len(node.edges)
+        assert row['weighted_degree'] == sum(node.edges.values())
+        assert row['importance'] == len(node.edges)
+        assert row['created_ts'] == node.metadata.created_ts
+        assert abs(row['permanence'] - node.metadata.permanence) < 1
+    assert table.top('weighted_degree', 2) == [('c', 7.0), ('a', 6.0)]
+    assert table.top('permanence', 1)[0][0] == 'd'
+    assert table.version == g.version
+
+
+def test_write_importance_in_bulk():
+    g = _graph()
+    assert write_importance(g, compute_metrics(g)) == 4
+    assert g.nodes['a'].metadata.importance == 2.0
+    assert g.nodes['d'].metadata.importance == 0.0
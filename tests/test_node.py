@@ -1,3 +1,11 @@
+import time
+
+from hyperhelix.analytics.permanence import (
+    compute_permanence,
+    compute_permanence_array,
+    rank_by_permanence,
+)
+from hyperhelix.metadata import NodeMetadata
 from hyperhelix.node import Node
 
 
@@ -17,3 +25,28 @@ def test_node_execute():
 def test_node_execute_no_fn():
     n = Node(id='2', payload=None)
     assert n.execute() is None
+
+
+def test_node_is_slotted_with_epoch_timestamps():
+    import sys
+    from datetime import datetime, timezone
+
+    n = Node(id=''.join(['no', 'de']), payload=None)
+    assert not hasattr(n, '__dict__') and not hasattr(n.metadata, '__dict__')
+    assert n.id is sys.intern('node')
+    assert isinstance(n.metadata.created_ts, float)
+    assert n.metadata.created.tzinfo is timezone.utc
+    stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    n.metadata.created = stamp
+    assert n.metadata.created == stamp
+
+
+def test_permanence_is_derived_from_creation_time():
+    now = time.time()
+    old = Node(id='old', payload=None, metadata=NodeMetadata(created_ts=now - 100))
+    new = Node(id='new', payload=None, metadata=NodeMetadata(created_ts=now - 10))
+    assert old.metadata.permanence >= 100
+    assert compute_permanence(new, now=now) == 10
+    assert compute_permanence_array([old, new], now=now).tolist() == [100, 10]
+    assert rank_by_permanence([new, old]) == ['old', 'new']
+    assert rank_by_permanence([new, old], k=1) == ['old']
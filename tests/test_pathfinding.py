@@ -0,0 +1,129 @@
+import random
+
+import pytest
+
+from hyperhelix import pathfinding
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+from hyperhelix.visualization.coords_generator import distance_heuristic
+
+
+def _grid(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    g = HyperHelix()
+    coords = {}
+    g.add_nodes(Node(id=f"{x},{y}", payload=None) for x in range(size) for y in range(size))
+    for x in range(size):
+        for y in range(size):
+            coords[f"{x},{y}"] = (x, y, 0.0)
+            if x + 1 < size:
+                g.add_edge(f"{x},{y}", f"{x + 1},{y}", 1 + rng.random())
+            if y + 1 < size:
+                g.add_edge(f"{x},{y}", f"{x},{y + 1}", 1 + rng.random())
+    return g, coords
+
+
+def test_modes_agree_on_cost():
+    g, coords = _grid(8)
+    h = distance_heuristic(coords)
+    results = {
+        method: g.find_path("0,0", "7,5", method, h) for method in pathfinding.METHODS
+    }
+    costs = {round(r.cost, 9) for r in results.values()}
+    assert len(costs) == 1
+    for result in results.values():
+        assert result.path[0] == "0,0" and result.path[-1] == "7,5"
+    assert results["astar"].expanded <= results["dijkstra"].expanded
+    assert results["bidirectional"].expanded <= results["dijkstra"].expanded
+
+
+def test_unreachable_and_trivial_paths():
+    g = HyperHelix()
+    g.add_node(Node(id="a", payload=None))
+    g.add_node(Node(id="b", payload=None))
+    for method in pathfinding.METHODS:
+        assert g.shortest_path("a", "b", method) == []
+        assert g.shortest_path("a", "a", method) == ["a"]
+
+
+def test_astar_reopens_nodes_for_inconsistent_heuristic():
+    edges = {"s": {"a": 1.0, "b": 3.0}, "a": {"s": 1.0, "b": 1.0},
+             "b": {"s": 3.0, "a": 1.0, "t": 3.0}, "t": {"b": 3.0}}
+    # Admissible (never above the true distance) but inconsistent at "a".
+    estimate = {"a": 4.0}
+    result = pathfinding.astar(edges.__getitem__, "s", "t", lambda n, _t: estimate.get(n, 0.0))
+    assert result.path == ["s", "a", "b", "t"]
+    assert result.cost == 5.0
+
+
+def test_unknown_method():
+    g, _ = _grid(2)
+    with pytest.raises(ValueError):
+        g.shortest_path("0,0", "1,1", method="nope")
+
+
+def _reference_components(g):
+    seen, sizes, label = set(), [], {}
+    for start in g.nodes:
+        if start in seen:
+            continue
+        seen.add(start)
+        stack, size = [start], 0
+        while stack:
+            node_id = stack.pop()
+            label[node_id] = start
+            size += 1
+            for other in g.nodes[node_id].edges:
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        sizes.append(size)
+    return label, sorted(sizes, reverse=True)
+
+
+def test_components_follow_mutations():
+    rng = random.Random(1)
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    g.add_nodes(Node(id=f"n{i}", payload=None) for i in range(40))
+    assert g.connected("n0", "n0")
+    for step in range(400):
+        ids = list(g.nodes)
+        action = rng.random()
+        if action < 0.55:
+            g.add_edge(rng.choice(ids), rng.choice(ids))
+        elif action < 0.8:
+            edges = [(a, b) for a in ids for b in g.nodes[a].edges if a <= b]
+            if edges:
+                g.remove_edge(*rng.choice(edges))
+        elif action < 0.9:
+            g.remove_node(rng.choice(ids))
+        else:
+            g.add_node(Node(id=f"n{rng.randrange(60)}", payload=None))
+        if step % 5 == 0:
+            label, sizes = _reference_components(g)
+            ids = list(g.nodes)
+            for _ in range(20):
+                a, b = rng.choice(ids), rng.choice(ids)
+                assert g.connected(a, b) == (label[a] == label[b])
+            node_id = rng.choice(ids)
+            assert {n.id for n in g.component(node_id)} == {i for i in ids if label[i] == label[node_id]}
+            assert g.component_sizes() == sizes
+
+
+def test_disconnected_path_short_circuits():
+    g, _ = _grid(6)
+    g.add_node(Node(id="island", payload=None))
+    result = g.find_path("0,0", "island")
+    assert result.path == [] and result.expanded == 0
+    g.add_edge("5,5", "island")
+    assert g.shortest_path("0,0", "island")[-1] == "island"
+    g.add_edge("island", "island")
+    g.remove_edge("5,5", "island")
+    assert not g.connected("0,0", "island")
+    g.remove_edge("island", "island")
+    assert g.nodes["island"].edges == {}
+    assert not g.connected("0,0", "island")
+    assert g.component_sizes() == [36, 1]
+    with pytest.raises(ValueError):
+        g.shortest_path("0,0", "island", method="nope")
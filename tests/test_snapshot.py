@@ -0,0 +1,86 @@
+import pytest
+
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def _graph():
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    for node_id in 'abcd':
+        g.add_node(Node(id=node_id, payload=None))
+    g.add_edge('a', 'b', 1.0)
+    g.add_edge('b', 'c', 2.0)
+    return g
+
+
+def test_snapshot_is_isolated_from_later_writes():
+    g = _graph()
+    snap = g.snapshot()
+    g.add_edge('c', 'd')
+    g.remove_edge('a', 'b')
+    g.remove_node('b')
+    g.add_tag('a', 'x')
+    assert set(snap) == {'a', 'b', 'c', 'd'}
+    assert sorted(snap.edges()) == [('a', 'b', 1.0), ('b', 'c', 2.0)]
+    assert snap.nodes['a'].tags == []
+    assert snap.shortest_path('a', 'c') == ['a', 'b', 'c']
+    assert [n.id for n in snap.spiral_walk('a', depth=2)] == ['a', 'b', 'c']
+    with pytest.raises(TypeError):
+        snap.nodes['z'] = Node(id='z', payload=None)
+
+    later = g.snapshot()
+    assert later.version > snap.version
+    assert set(later) == {'a', 'c', 'd'}
+    assert sorted(later.edges()) == [('c', 'd', 1.0)]
+    assert later.nodes['a'].tags == ['x']
+
+
+def test_snapshot_shares_unchanged_nodes():
+    g = _graph()
+    first = g.snapshot()
+    assert g.snapshot() is first
+    g.add_edge('c', 'd')
+    second = g.snapshot()
+    assert second.nodes['a'] is first.nodes['a']
+    assert second.nodes['c'] is not first.nodes['c']
+    assert first.nodes['c'].edges == {'b': 2.0}
+    assert second.nodes['d'].edges == {'c': 1.0}
+    g.touch()
+    assert g.snapshot().nodes['a'] is not first.nodes['a']
+
+
+def test_removing_self_loop_invalidates_snapshots():
+    g = _graph()
+    g.add_edge('a', 'a', 3.0)
+    assert g.snapshot().nodes['a'].edges == {'b': 1.0, 'a': 3.0}
+    assert ('a', 'a', 3.0) in g.snapshot().edges()
+    assert ('a', 'a', 3.0) in g.subgraph(['a']).edges()
+    csr = g.freeze()
+    assert csr.index['a'] in csr.neighbors_of(csr.index['a'])[0]
+    version = g.version
+    g.remove_edge('a', 'a')
+    assert g.version > version
+    assert g.nodes['a'].edges == {'b': 1.0}
+    assert g.snapshot().nodes['a'].edges == {'b': 1.0}
+    csr = g.freeze()
+    assert csr.index['a'] not in csr.neighbors_of(csr.index['a'])[0]
+
+
+def test_touch_with_ids_invalidates_only_those_nodes():
+    g = _graph()
+    first = g.snapshot()
+    assert g.freeze().num_edges == 2
+    assert g.connected('a', 'c')
+    g.nodes['b'].edges.pop('c')
+    g.nodes['c'].edges.pop('b')
+    g.touch('b', 'c')
+    second = g.snapshot()
+    assert second.nodes['a'] is first.nodes['a']
+    assert second.nodes['c'].edges == {}
+    assert g.freeze().num_edges == 1
+    assert not g.connected('a', 'c')
+    g.nodes['c'].edges['d'] = 1.0
+    g.nodes['d'].edges['c'] = 1.0
+    g.touch('c', 'd')
+    assert g.connected('c', 'd') and g.component_sizes() == [2, 2]
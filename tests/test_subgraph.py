@@ -0,0 +1,43 @@
+import pytest
+
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def _graph():
+    g = HyperHelix()
+    g._insert_hooks.clear()
+    for node_id in 'abcde':
+        g.add_node(Node(id=node_id, payload={'id': node_id}, tags=['t'] if node_id in 'ac' else []))
+    g.add_edge('a', 'b', 1.0)
+    g.add_edge('b', 'c', 1.0)
+    g.add_edge('a', 'd', 0.5)
+    g.add_edge('d', 'c', 0.5)
+    g.add_edge('c', 'e', 1.0)
+    return g
+
+
+def test_subgraph_filters_edges_without_copying():
+    g = _graph()
+    view = g.subgraph(['a', 'b', 'c'])
+    assert view.nodes['a'] is g.nodes['a']
+    assert len(view) == 3 and 'd' not in view
+    assert view.neighbors('a') == {'b': 1.0}
+    assert sorted(view.edges()) == [('a', 'b', 1.0), ('b', 'c', 1.0)]
+    assert view.shortest_path('a', 'c') == ['a', 'b', 'c']
+    assert g.shortest_path('a', 'c') == ['a', 'd', 'c']
+    assert [n.id for n in view.spiral_walk('a', depth=3)] == ['a', 'b', 'c']
+    assert {n.id for n in view.find_nodes_by_tag('t')} == {'a', 'c'}
+    assert view.freeze().degree().tolist() == [1, 2, 1]
+    with pytest.raises(KeyError):
+        view.shortest_path('a', 'e')
+
+
+def test_neighborhood_tracks_parent():
+    g = _graph()
+    view = g.neighborhood('e', depth=1)
+    assert set(view) == {'c', 'e'}
+    g.add_edge('c', 'e', 3.0)
+    assert view.neighbors('e') == {'c': 3.0}
+    g.remove_node('c')
+    assert list(view) == ['e'] and view.edges() == []
@@ -0,0 +1,40 @@
+from hyperhelix import traversal
+from hyperhelix.core import HyperHelix
+from hyperhelix.node import Node
+
+
+def _star(n: int) -> HyperHelix:
+    g = HyperHelix()
+    g.add_node(Node(id='hub', payload=None))
+    g.add_nodes(Node(id=str(i), payload=None, strand='odd' if i % 2 else 'even', layer=i % 3)
+                for i in range(n))
+    for i in range(n):
+        g.add_edge('hub', str(i), float(i))
+        g.add_edge(str(i), str((i + 1) % n))
+    return g
+
+
+def test_walk_dedups_on_enqueue():
+    g = _star(50)
+    adjacency = lambda node_id: g.nodes[node_id].edges
+    ids = [node_id for node_id, _ in traversal.walk(adjacency, ['hub'], depth=3)]
+    assert len(ids) == len(set(ids)) == 51
+
+
+def test_spiral_walk_budgets_and_filters():
+    g = _star(20)
+    assert len(list(g.spiral_walk('hub', depth=2, max_nodes=5))) == 5
+    assert len(list(g.spiral_walk('hub', depth=1, max_edges=3))) == 4
+    heavy = {n.id for n in g.spiral_walk('hub', depth=1, min_weight=18)}
+    assert heavy == {'hub', '18', '19'}
+    odd = {n.id for n in g.spiral_walk('hub', depth=2, strand='odd')}
+    assert odd == {'hub'} | {str(i) for i in range(1, 20, 2)}
+    layered = {n.id for n in g.spiral_walk('hub', depth=1, layer=0)}
+    assert layered == {'hub'} | {str(i) for i in range(0, 20, 3)}
+
+
+def test_spiral_walk_multi_start_is_lazy():
+    g = _star(10)
+    walk = g.spiral_walk(['0', '5'], depth=0)
+    assert next(walk).id == '0'
+    assert [n.id for n in walk] == ['5']
@@ -7,3 +7,9 @@ def test_process_webhook():
     g = HyperHelix()
     webhook_listener.process_webhook(g, {'id': 'w1', 'msg': 'hi'})
     assert 'w1' in g.nodes and g.nodes['w1'].payload['msg'] == 'hi'
+
+
+def test_process_webhooks_backlog():
+    g = HyperHelix()
+    webhook_listener.process_webhooks(g, [{'id': 'w1'}, {'id': 'w2'}])
+    assert {'w1', 'w2'} <= set(g.nodes)